@@ -0,0 +1,111 @@
+"""
+Compares the JSON codecs on large batch payloads: serializing a BATCH_CREATE request body (plain and
+query tunneled) and decoding a BATCH_GET response body through the response formatter.
+
+Usage:
+    python benchmarks/bench_codec.py [--entities N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requests import Response
+
+from linkedin_api.clients.common.codec import OrjsonCodec, StdlibJsonCodec, orjson
+from linkedin_api.clients.restli.response_formatter import BatchGetResponseFormatter
+from linkedin_api.clients.restli.utils.query_tunneling import (
+    MAX_QUERY_STRING_LENGTH,
+    maybe_apply_query_tunneling,
+)
+from linkedin_api.common.constants import RESTLI_METHODS
+
+
+def build_entity(index):
+    return {
+        "id": index,
+        "account": f"urn:li:sponsoredAccount:{100000 + index}",
+        "name": f"Campaign group {index} – Q{index % 4 + 1}",
+        "status": "ACTIVE" if index % 3 else "PAUSED",
+        "runSchedule": {"start": 1700000000000 + index, "end": 1800000000000},
+        "totalBudget": {"amount": f"{index * 10}.00", "currencyCode": "EUR"},
+        "test": False,
+        "servingStatuses": ["RUNNABLE", "STOPPED"][: 1 + index % 2],
+    }
+
+
+def build_batch_get_response(entities):
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {
+            "results": {str(entity["id"]): entity for entity in entities},
+            "statuses": {str(entity["id"]): 200 for entity in entities},
+            "errors": {},
+        }
+    ).encode("utf-8")
+    return response
+
+
+def legacy_tunneled_body(encoded_query_param_string, body):
+    # The previous implementation serialized the body twice with the standard library
+    raw = encoded_query_param_string + json.dumps(body)
+    return raw, json.dumps(body)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    entities = [build_entity(index) for index in range(args.entities)]
+    request_body = {"elements": entities}
+    response = build_batch_get_response(entities)
+    long_query_string = "q=search&" + "x" * MAX_QUERY_STRING_LENGTH
+
+    codecs = [StdlibJsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson is not installed, only the standard library codec is measured")
+
+    print(
+        f"{args.entities} entities, request body {len(codecs[0].encode(request_body))} bytes, "
+        f"response body {len(response.content)} bytes, best of {args.repeat} runs (ms)"
+    )
+    print(f"{'codec':<10}{'encode':>10}{'tunneled':>10}{'decode':>10}")
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat)) * 1000
+
+    legacy_tunneled = best(lambda: legacy_tunneled_body(long_query_string, request_body))
+    print(f"{'legacy':<10}{'':>10}{legacy_tunneled:>10.2f}{'':>10}")
+
+    for codec in codecs:
+        encode = best(lambda: codec.encode(request_body))
+        tunneled = best(
+            lambda: maybe_apply_query_tunneling(
+                url="https://api.linkedin.com/rest/adCampaignGroups",
+                encoded_query_param_string=long_query_string,
+                original_restli_method=RESTLI_METHODS.BATCH_CREATE,
+                original_request_body=request_body,
+                access_token="token",
+                version_string="202401",
+                codec=codec,
+            )
+        )
+        decode = best(
+            lambda: BatchGetResponseFormatter.format_response(
+                response, codec=codec
+            ).results
+        )
+        print(f"{codec.name:<10}{encode:>10.2f}{tunneled:>10.2f}{decode:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
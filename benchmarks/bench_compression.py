@@ -0,0 +1,82 @@
+"""
+Measures gzip compression of BATCH_CREATE request bodies of increasing size at several compression levels:
+the compressed size, the CPU time spent compressing, and the upload time saved at a given uplink bandwidth.
+Compression pays off once the time saved exceeds the CPU time, which helps choosing the `min_size` and
+`level` of a RequestCompression.
+
+Usage:
+    python benchmarks/bench_compression.py [--uplink-mbps 20] [--levels 1 6 9] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_api.clients.common.codec import get_default_codec
+from linkedin_api.clients.restli.utils.compression import RequestCompression
+
+ENTITY_COUNTS = (1, 10, 50, 200, 1000, 5000, 20000)
+
+
+def build_batch_create_body(count):
+    return {
+        "elements": [
+            {
+                "account": f"urn:li:sponsoredAccount:{100000 + index}",
+                "name": f"Campaign group {index} – Q{index % 4 + 1}",
+                "status": "ACTIVE" if index % 3 else "PAUSED",
+                "runSchedule": {"start": 1700000000000 + index * 1000, "end": 1800000000000},
+                "totalBudget": {"amount": f"{index * 10}.00", "currencyCode": "EUR"},
+                "test": False,
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uplink-mbps", type=float, default=20.0, help="Upload bandwidth in megabits per second")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codec = get_default_codec()
+    bytes_per_ms = args.uplink_mbps * 1e6 / 8 / 1000
+
+    print(f"Upload bandwidth {args.uplink_mbps:g} Mbit/s, best of {args.repeat} runs, codec {codec.name}")
+    print(f"{'entities':>9}{'bytes':>11}{'level':>7}{'gzip bytes':>12}{'ratio':>7}{'cpu ms':>9}{'saved ms':>10}  net")
+
+    gains = {level: [] for level in args.levels}
+    for count in ENTITY_COUNTS:
+        body = codec.encode(build_batch_create_body(count))
+        for level in args.levels:
+            compression = RequestCompression(min_size=0, level=level)
+            compressed = compression.compress(body)
+            cpu_ms = min(timeit.repeat(lambda: compression.compress(body), number=1, repeat=args.repeat)) * 1000
+            saved_ms = (len(body) - len(compressed)) / bytes_per_ms
+            gains[level].append((len(body), saved_ms > cpu_ms))
+            print(
+                f"{count:>9}{len(body):>11}{level:>7}{len(compressed):>12}"
+                f"{len(body) / len(compressed):>7.1f}{cpu_ms:>9.3f}{saved_ms:>10.3f}"
+                f"  {'gain' if saved_ms > cpu_ms else 'loss'}"
+            )
+
+    for level in args.levels:
+        # The smallest measured size from which compression pays off for every larger size
+        break_even = None
+        for size, gain in reversed(gains[level]):
+            if not gain:
+                break
+            break_even = size
+        if break_even is None:
+            print(f"level {level}: compression did not pay off for the largest measured size")
+        else:
+            print(f"level {level}: compression pays off from about {break_even} bytes")
+
+
+if __name__ == "__main__":
+    main()
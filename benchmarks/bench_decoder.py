@@ -0,0 +1,83 @@
+"""
+Measures Rest.li decoding of large batch keys: long lists of complex keys (as in BATCH_GET responses on
+resources with compound keys) and deeply nested values. The time per input character should stay flat
+as the inputs grow.
+
+To compare with another decoder implementation, e.g. a previous revision:
+    git show <rev>:linkedin_api/clients/restli/utils/decoder.py > /tmp/decoder_baseline.py
+    python benchmarks/bench_decoder.py --baseline /tmp/decoder_baseline.py
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_api.clients.restli.utils import decoder
+from linkedin_api.clients.restli.utils.encoder import encode
+
+
+def build_batch_key(count):
+    return encode(
+        [
+            {
+                "account": f"urn:li:sponsoredAccount:{index}",
+                "campaign": f"urn:li:sponsoredCampaign:{index * 7}",
+                "dateRange": {"start": {"year": 2023, "month": 1, "day": 1}},
+            }
+            for index in range(count)
+        ]
+    )
+
+
+def build_nested_value(depth):
+    value = "urn:li:person:123"
+    for level in range(depth):
+        value = [value, {"level": str(level)}] if level % 2 else {"inner": value}
+    return encode(value)
+
+
+def load_baseline(path):
+    spec = importlib.util.spec_from_file_location("decoder_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(decode, value, repeat):
+    runs = max(1, 200000 // len(value))
+    return min(timeit.repeat(lambda: decode(value), number=runs, repeat=repeat)) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", help="Path to a decoder.py module to compare with")
+    args = parser.parse_args()
+
+    implementations = [("current", decoder.decode)]
+    if args.baseline:
+        sys.setrecursionlimit(10000)
+        implementations.append(("baseline", load_baseline(args.baseline).decode))
+
+    cases = [(f"batch key x{count}", build_batch_key(count)) for count in (10, 100, 1000, 5000)]
+    cases += [(f"nested depth {depth}", build_nested_value(depth)) for depth in (10, 100, 400)]
+
+    header = f"{'input':<20}{'chars':>10}"
+    for name, _ in implementations:
+        header += f"{name + ' ms':>16}{'ns/char':>10}"
+    print(header)
+
+    for label, value in cases:
+        line = f"{label:<20}{len(value):>10}"
+        for _, decode in implementations:
+            seconds = measure(decode, value, args.repeat)
+            line += f"{seconds * 1000:>16.3f}{seconds * 1e9 / len(value):>10.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
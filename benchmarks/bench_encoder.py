@@ -0,0 +1,92 @@
+"""
+Measures Rest.li encoding of large batch_finder criteria lists and deeply nested values, both with a
+cold encoding cache (every string is quoted) and a warm one (repeated URNs).
+
+To compare with another encoder implementation, e.g. a previous revision:
+    git show <rev>:linkedin_api/clients/restli/utils/encoder.py > /tmp/encoder_baseline.py
+    python benchmarks/bench_encoder.py --baseline /tmp/encoder_baseline.py
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_api.clients.restli.utils import encoder
+
+
+def build_finder_criteria(count):
+    return [
+        {
+            "OrganizationRoleAuthorizationAction": {
+                "actionType": "ADMINISTRATOR_READ" if index % 2 else "ANALYTICS_READ",
+                "organization": f"urn:li:organization:{1000000 + index}",
+            },
+            "impersonator": f"urn:li:person:abc{index}",
+            "dateRange": {"start": {"year": 2023, "month": 1 + index % 12, "day": 1}},
+            "test": index % 3 == 0,
+        }
+        for index in range(count)
+    ]
+
+
+def build_nested_value(depth):
+    value = "urn:li:person:123"
+    for level in range(depth):
+        value = [value, {"level": level}] if level % 2 else {"inner": value}
+    return value
+
+
+def load_baseline(path):
+    spec = importlib.util.spec_from_file_location("encoder_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(encode, value, repeat, cold):
+    def run():
+        if cold:
+            encoder.clear_encode_cache()
+        encode(value)
+
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--baseline", help="Path to an encoder.py module to compare with")
+    args = parser.parse_args()
+
+    implementations = [
+        ("cold", encoder.encode, True),
+        ("warm", encoder.encode, False),
+    ]
+    if args.baseline:
+        sys.setrecursionlimit(10000)
+        implementations.append(("baseline", load_baseline(args.baseline).encode, False))
+
+    cases = [
+        (f"criteria x{count}", build_finder_criteria(count))
+        for count in (100, 1000, 10000)
+    ]
+    cases += [(f"nested depth {depth}", build_nested_value(depth)) for depth in (10, 400)]
+
+    header = f"{'input':<20}{'chars':>10}"
+    for name, _, _ in implementations:
+        header += f"{name + ' ms':>14}"
+    print(header)
+
+    for label, value in cases:
+        line = f"{label:<20}{len(encoder.encode(value)):>10}"
+        for _, encode, cold in implementations:
+            line += f"{measure(encode, value, args.repeat, cold) * 1000:>14.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
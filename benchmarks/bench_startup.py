@@ -0,0 +1,85 @@
+"""
+Measures the cold import time of the entry point (and optionally other modules) with `python -X importtime`,
+and fails if it exceeds a budget. Scheduled runs pay the import cost on every launch, so only what is needed
+before the first network call should be imported eagerly.
+
+Usage:
+    python benchmarks/bench_startup.py [--module main] [--budget-ms 100] [--runs 5] [--top 10]
+
+The exit status is 1 if the best run of any module is over the budget.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_imports(module):
+    # Returns the (self_us, cumulative_us, depth, name) entries of one cold import of the module
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, name))
+    return entries
+
+
+def import_tree(entries, module):
+    # Returns the cumulative import time of the module and its direct imports. The children of an
+    # import are reported before it, so they are the entries since the previous top-level import.
+    children = []
+    for _, cumulative_us, depth, name in entries:
+        if depth == 0:
+            if name == module:
+                return cumulative_us, children
+            children = []
+        elif depth == 1:
+            children.append((cumulative_us, name))
+    raise RuntimeError(f"{module} is missing from the import time report")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", action="append", help="Module to import (repeatable). Defaults to main.")
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest direct imports to list")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.module or ["main"]:
+        # Keep the fastest run, which is the least disturbed by the machine
+        runs = [import_tree(measure_imports(module), module) for _ in range(args.runs)]
+        total_us, children = min(runs, key=lambda run: run[0])
+        total_ms = total_us / 1000
+        status = "ok" if total_ms <= args.budget_ms else "OVER BUDGET"
+        over_budget = over_budget or total_ms > args.budget_ms
+
+        print(
+            f"{module}: {total_ms:.1f} ms, excluding interpreter startup "
+            f"(budget {args.budget_ms:.0f} ms, best of {args.runs}) {status}"
+        )
+        for cumulative_us, name in sorted(children, reverse=True)[: args.top]:
+            print(f"    {cumulative_us / 1000:>8.1f} ms  {name}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
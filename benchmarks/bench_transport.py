@@ -0,0 +1,219 @@
+"""
+Compares the transports on many concurrent Rest.li GET calls against a local stand-in for api.linkedin.com:
+a TLS server that speaks HTTP/2 or HTTP/1.1 (negotiated with ALPN) and answers every request after a fixed
+delay, which emulates the network round trip and server time. Reports the throughput and the latency
+percentiles of each transport at several concurrency levels.
+
+Requires the openssl command line tool (to create a self-signed certificate) and the h2 package, which is
+used by both the Http2Transport and the server. Without h2, only the RequestsTransport is measured.
+
+Usage:
+    python benchmarks/bench_transport.py [--requests 400] [--concurrency 1 16 64] [--latency-ms 30]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:
+    h2 = None
+
+from linkedin_api.clients.common.transport import Http2Transport, RequestsTransport
+from linkedin_api.clients.restli.utils.query_tunneling import maybe_apply_query_tunneling
+from linkedin_api.common.constants import RESTLI_METHODS
+
+RESPONSE_BODY = json.dumps(
+    {"id": 123, "localizedName": "Stand-in organization", "vanityName": "stand-in"}
+).encode("utf-8")
+
+
+class Http1Handler:
+    # Answers keep-alive HTTP/1.1 requests, one at a time per connection
+    def __init__(self, transport, latency):
+        self.transport = transport
+        self.latency = latency
+        self.buffer = b""
+
+    def data_received(self, data):
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            head, rest = self.buffer.split(b"\r\n\r\n", 1)
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value.strip())
+            if len(rest) < length:
+                return
+            self.buffer = rest[length:]
+            asyncio.get_running_loop().call_later(self.latency, self.respond)
+
+    def respond(self):
+        if self.transport.is_closing():
+            return
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            + f"Content-Length: {len(RESPONSE_BODY)}\r\n\r\n".encode("ascii")
+            + RESPONSE_BODY
+        )
+
+
+class Http2Handler:
+    # Answers the streams of an HTTP/2 connection concurrently
+    def __init__(self, transport, latency):
+        self.transport = transport
+        self.latency = latency
+        self.connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.connection.initiate_connection()
+        self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data):
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(self.latency, self.respond, event.stream_id)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.connection.data_to_send())
+
+    def respond(self, stream_id):
+        if self.transport.is_closing():
+            return
+        self.connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(RESPONSE_BODY))),
+            ],
+        )
+        self.connection.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+        self.transport.write(self.connection.data_to_send())
+
+
+class StandInProtocol(asyncio.Protocol):
+    def __init__(self, latency):
+        self.latency = latency
+        self.handler = None
+
+    def connection_made(self, transport):
+        protocol = transport.get_extra_info("ssl_object").selected_alpn_protocol()
+        handler_class = Http2Handler if protocol == "h2" else Http1Handler
+        self.handler = handler_class(transport, self.latency)
+
+    def data_received(self, data):
+        self.handler.data_received(data)
+
+
+def create_certificate(directory):
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", key_path, "-out", cert_path, "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert_path, key_path
+
+
+def start_server(cert_path, key_path, latency):
+    # Runs the stand-in server on an event loop in a background thread, and returns its port
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    context.set_alpn_protocols(["h2", "http/1.1"] if h2 is not None else ["http/1.1"])
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        loop.create_server(lambda: StandInProtocol(latency), "127.0.0.1", 0, ssl=context, backlog=1024)
+    )
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def run(transport, port, total_requests, concurrency):
+    def call(index):
+        prepared_request = maybe_apply_query_tunneling(
+            url=f"https://localhost:{port}/rest/organizations/{index}",
+            encoded_query_param_string=None,
+            original_restli_method=RESTLI_METHODS.GET,
+            access_token="token",
+            version_string="202401",
+        )
+        start = time.perf_counter()
+        response = transport.send(prepared_request)
+        assert response.status_code == 200
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Warm up the connections before measuring
+        list(executor.map(call, range(concurrency)))
+        start = time.perf_counter()
+        latencies = sorted(executor.map(call, range(total_requests)))
+        elapsed = time.perf_counter() - start
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+    return total_requests / elapsed, percentile(0.5), percentile(0.95), percentile(0.99)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = create_certificate(directory)
+        port = start_server(cert_path, key_path, args.latency_ms / 1000)
+
+        def requests_transport():
+            transport = RequestsTransport()
+            transport.session.verify = cert_path
+            return transport
+
+        transports = [requests_transport]
+        if h2 is not None:
+            transports.append(lambda: Http2Transport(verify=ssl.create_default_context(cafile=cert_path)))
+        else:
+            print("h2 is not installed (pip install httpx[http2]), only the RequestsTransport is measured")
+
+        print(f"{args.requests} GET calls, {args.latency_ms:g} ms server latency")
+        print(f"{'transport':<10}{'concurrency':>12}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for concurrency in args.concurrency:
+            for create_transport in transports:
+                transport = create_transport()
+                try:
+                    throughput, p50, p95, p99 = run(transport, port, args.requests, concurrency)
+                finally:
+                    transport.close()
+                print(
+                    f"{transport.name:<10}{concurrency:>12}{throughput:>10.0f}"
+                    f"{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from linkedin_api.clients.auth.response_formatter import (
 )
 import linkedin_api.common.constants as constants
 from linkedin_api.common.errors import MissingArgumentError
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+from linkedin_api.clients.common.transport import Transport, RequestsTransport
 import linkedin_api.clients.auth.utils.oauth as oauth
 from linkedin_api.clients.auth.response import (
     AccessToken2LResponse,
@@ -26,11 +28,18 @@ class AuthClient:
         client_id (str): The client ID of the developer application.
         client_secret (str): The client secret of the developer application.
         redirect_url (Optional[str], optional): The redirect URL. This URL is used in the authorization code flow (3-legged OAuth). Users will be redirected to this URL after authorization. Defaults to None.
-        session (requests.Session): The session instance used to make requests to the Auth server. Session attributes can be modified, which will affect all requests.
+        transport (Transport): The transport used to make requests to the Auth server.
+        session (Optional[requests.Session]): The session instance used to make requests to the Auth server, if the transport is a RequestsTransport, otherwise None. Session attributes can be modified, which will affect all requests.
+        codec (JsonCodec): The codec used to decode response bodies.
     """
 
     def __init__(
-        self, client_id: str, client_secret: str, redirect_url: Optional[str] = None
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_url: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+        transport: Optional[Transport] = None,
     ):
         """
         The constructor for the AuthClient class.
@@ -39,11 +48,25 @@ class AuthClient:
             client_id (str): The client ID of the developer application.
             client_secret (str): The client secret of the developer application.
             redirect_url (Optional[str], optional): The redirect URL. This URL is used in the authorization code flow (3-legged OAuth). Users will be redirected to this URL after authorization. Defaults to None.
+            codec (Optional[JsonCodec], optional): The JSON codec for response bodies. Defaults to the OrjsonCodec if orjson is installed, otherwise the StdlibJsonCodec.
+            transport (Optional[Transport], optional): The transport used to send the requests, e.g. an Http2Transport. Defaults to a RequestsTransport, which uses HTTP/1.1.
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_url = redirect_url
-        self.session = requests.Session()
+        self.transport = transport or RequestsTransport()
+        self.session = (
+            self.transport.session
+            if isinstance(self.transport, RequestsTransport)
+            else None
+        )
+        self.codec = codec or get_default_codec()
+
+    def close(self) -> None:
+        """
+        Closes the connections of the client's transport.
+        """
+        self.transport.close()
 
     def generate_member_auth_url(
         self, scopes: List[str], state: Optional[str] = None
@@ -116,9 +139,11 @@ class AuthClient:
             method=HTTP_METHODS.POST.value, url=url, data=data, headers=headers
         )
         prepared_request = request.prepare()
-        response = self.session.send(prepared_request)
+        response = self.transport.send(prepared_request)
 
-        return AccessToken3LResponseFormatter.format_response(response)
+        return AccessToken3LResponseFormatter.format_response(
+            response, codec=self.codec
+        )
 
     def exchange_refresh_token_for_access_token(
         self, refresh_token: str
@@ -154,8 +179,10 @@ class AuthClient:
             method=HTTP_METHODS.POST.value, url=url, headers=headers, data=data
         )
         prepared_request = request.prepare()
-        response = self.session.send(prepared_request)
-        return RefreshTokenExchangeResponseFormatter.format_response(response)
+        response = self.transport.send(prepared_request)
+        return RefreshTokenExchangeResponseFormatter.format_response(
+            response, codec=self.codec
+        )
 
     def get_two_legged_access_token(self) -> AccessToken2LResponse:
         """
@@ -185,8 +212,10 @@ class AuthClient:
             method=HTTP_METHODS.POST.value, url=url, headers=headers, data=data
         )
         prepared_request = request.prepare()
-        response = self.session.send(prepared_request)
-        return AccessToken2LResponseFormatter.format_response(response)
+        response = self.transport.send(prepared_request)
+        return AccessToken2LResponseFormatter.format_response(
+            response, codec=self.codec
+        )
 
     def introspect_access_token(self, access_token: str) -> IntrospectTokenResponse:
         """
@@ -218,5 +247,7 @@ class AuthClient:
             method=HTTP_METHODS.POST.value, url=url, headers=headers, data=data
         )
         prepared_request = request.prepare()
-        response = self.session.send(prepared_request)
-        return IntrospectTokenResponseFormatter.format_response(response)
+        response = self.transport.send(prepared_request)
+        return IntrospectTokenResponseFormatter.format_response(
+            response, codec=self.codec
+        )
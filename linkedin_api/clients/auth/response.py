@@ -2,10 +2,18 @@ from linkedin_api.clients.common.response import BaseResponse
 
 
 class BaseAuthResponse(BaseResponse):
-    pass
+    __slots__ = ()
 
 
 class AccessToken3LResponse(BaseAuthResponse):
+    __slots__ = (
+        "access_token",
+        "expires_in",
+        "refresh_token",
+        "refresh_token_expires_in",
+        "scope",
+    )
+
     def __init__(
         self,
         status_code,
@@ -48,6 +56,8 @@ class AccessToken3LResponse(BaseAuthResponse):
 
 
 class AccessToken2LResponse(BaseAuthResponse):
+    __slots__ = ("access_token", "expires_in")
+
     def __init__(self, status_code, url, headers, response, access_token, expires_in):
         super().__init__(
             status_code=status_code, url=url, headers=headers, response=response
@@ -64,6 +74,17 @@ class AccessToken2LResponse(BaseAuthResponse):
 
 
 class IntrospectTokenResponse(BaseAuthResponse):
+    __slots__ = (
+        "active",
+        "auth_type",
+        "authorized_at",
+        "client_id",
+        "created_at",
+        "expires_at",
+        "scope",
+        "status",
+    )
+
     def __init__(
         self,
         status_code,
@@ -124,6 +145,13 @@ class IntrospectTokenResponse(BaseAuthResponse):
 
 
 class RefreshTokenExchangeResponse(BaseAuthResponse):
+    __slots__ = (
+        "access_token",
+        "expires_in",
+        "refresh_token",
+        "refresh_token_expires_in",
+    )
+
     def __init__(
         self,
         status_code,
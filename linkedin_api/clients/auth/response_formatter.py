@@ -1,4 +1,6 @@
 from requests import Response
+from typing import Optional
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
 from linkedin_api.clients.auth.response import (
     AccessToken3LResponse,
     AccessToken2LResponse,
@@ -14,8 +16,10 @@ from linkedin_api.clients.common.response_formatter import (
 class AccessToken3LResponseFormatter(BaseResponseFormatter[AccessToken3LResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> AccessToken3LResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> AccessToken3LResponse:
+        json_data = (codec or get_default_codec()).decode(response.content)
 
         return AccessToken3LResponse(
             status_code=response.status_code,
@@ -33,8 +37,10 @@ class AccessToken3LResponseFormatter(BaseResponseFormatter[AccessToken3LResponse
 class AccessToken2LResponseFormatter(BaseResponseFormatter[AccessToken2LResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> AccessToken2LResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> AccessToken2LResponse:
+        json_data = (codec or get_default_codec()).decode(response.content)
 
         return AccessToken2LResponse(
             status_code=response.status_code,
@@ -49,8 +55,10 @@ class AccessToken2LResponseFormatter(BaseResponseFormatter[AccessToken2LResponse
 class IntrospectTokenResponseFormatter(BaseResponseFormatter[IntrospectTokenResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> IntrospectTokenResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> IntrospectTokenResponse:
+        json_data = (codec or get_default_codec()).decode(response.content)
 
         return IntrospectTokenResponse(
             status_code=response.status_code,
@@ -73,8 +81,10 @@ class RefreshTokenExchangeResponseFormatter(
 ):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> RefreshTokenExchangeResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> RefreshTokenExchangeResponse:
+        json_data = (codec or get_default_codec()).decode(response.content)
 
         return RefreshTokenExchangeResponse(
             status_code=response.status_code,
@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(ABC):
+    """
+    Serializes request bodies to JSON and decodes JSON response bodies. Clients serialize each request
+    body exactly once, with the codec they were created with.
+    """
+
+    name = None
+    """
+    The name of the JSON library used by the codec.
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Serializes a value to UTF-8 encoded JSON.
+
+        Args:
+            value (Any): The value to serialize
+
+        Returns:
+            bytes: The serialized value
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        Args:
+            data (Union[bytes, str]): The JSON document
+
+        Raises:
+            ValueError: Error raised if the data is not valid JSON
+
+        Returns:
+            Any: The decoded value
+        """
+        pass
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    A JSON codec using the standard library json module.
+    """
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode("utf-8")
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        # json.loads detects the UTF-8/16/32 encoding of bytes, like Response.json()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    A JSON codec using orjson, which is several times faster than the standard library for both
+    serializing and decoding. Requires the optional orjson package.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is required to use the OrjsonCodec")
+
+    def encode(self, value: Any) -> bytes:
+        # Like the standard library, serialize non-string dictionary keys (e.g. numeric ids) as strings
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_default_codec() -> JsonCodec:
+    """
+    Returns the codec used when no codec is specified: the OrjsonCodec if orjson is installed,
+    otherwise the StdlibJsonCodec.
+
+    Returns:
+        JsonCodec: The default codec
+    """
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+    return _default_codec
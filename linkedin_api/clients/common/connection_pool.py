@@ -0,0 +1,212 @@
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+import socket
+import threading
+import time
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+
+class ConnectionTiming(threading.local):
+    """
+    Measures, per thread, the time spent acquiring connections from the pools of PooledHTTPAdapters:
+    waiting for a pooled connection and opening new connections (the DNS lookup and the TCP and TLS
+    handshakes). Nothing is measured unless the timing was started on the thread.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.seconds: Optional[float] = None
+
+    def start(self) -> None:
+        """
+        Starts measuring on the current thread.
+        """
+        self.active = True
+        self.seconds = None
+
+    def stop(self) -> Optional[float]:
+        """
+        Stops measuring on the current thread.
+
+        Returns:
+            Optional[float]: The seconds spent acquiring connections since the timing was started, or None
+            if no connection was acquired from a PooledHTTPAdapter
+        """
+        self.active = False
+        return self.seconds
+
+    def add(self, seconds: float) -> None:
+        self.seconds = (self.seconds or 0.0) + seconds
+
+
+connection_timing = ConnectionTiming()
+"""
+The connection timing shared by all PooledHTTPAdapters
+"""
+
+
+class DnsCache:
+    """
+    Caches the resolved address of each host for a fixed time, so that new connections (e.g. after idle
+    connections were dropped) skip the DNS lookup. An entry is dropped as soon as connecting to its
+    address fails, so that a changed address is looked up again.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl (float): The time in seconds resolved addresses are reused for
+        """
+        self.ttl = ttl
+        self._addresses: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Returns the address of a host, from the cache if it was resolved less than `ttl` seconds ago.
+
+        Args:
+            host (str): The host name
+            port (int): The port that will be connected to
+
+        Returns:
+            str: The IP address of the host
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._addresses.get((host, port), None)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        # Use the first address, which is the one that would be tried first without the cache
+        address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4][0]
+        with self._lock:
+            self._addresses[(host, port)] = (now + self.ttl, address)
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        """
+        Drops the cached address of a host.
+        """
+        with self._lock:
+            self._addresses.pop((host, port), None)
+
+    def __getstate__(self):
+        # Cached addresses are not carried over, and locks cannot be pickled
+        return {"ttl": self.ttl}
+
+    def __setstate__(self, state):
+        self.__init__(state["ttl"])
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose pooled connections can be dropped once they have been idle for too long (before
+    the server or a load balancer closes them, which would make the next request on them fail), and
+    whose new connections can use cached DNS lookups.
+    """
+
+    # The attributes that are pickled, from which the pool manager is rebuilt when unpickling
+    __attrs__ = HTTPAdapter.__attrs__ + ["idle_timeout", "dns_cache"]
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        idle_timeout: Optional[float] = None,
+        dns_cache: Optional[DnsCache] = None,
+    ):
+        """
+        The constructor for the PooledHTTPAdapter class.
+
+        Args:
+            pool_connections (int, optional): The number of hosts whose connection pools are kept. Defaults to 10.
+            pool_maxsize (int, optional): The maximum number of connections kept per host. Defaults to 32.
+            pool_block (bool, optional): Flag whether requests wait for a pooled connection when `pool_maxsize` connections are in use, instead of opening a connection that is discarded afterwards. Defaults to False.
+            idle_timeout (Optional[float], optional): The time in seconds after which an idle connection is closed instead of reused. None keeps idle connections until the server closes them. Defaults to None.
+            dns_cache (Optional[DnsCache], optional): The cache used to resolve hosts when connecting. Defaults to None.
+        """
+        self.idle_timeout = idle_timeout
+        self.dns_cache = dns_cache
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _pool_class(HTTPConnectionPool, HTTPConnection, self),
+            "https": _pool_class(HTTPSConnectionPool, HTTPSConnection, self),
+        }
+
+
+def _pool_class(pool_base, connection_base, adapter: PooledHTTPAdapter):
+    # Builds the connection pool class of an adapter, bound to its idle timeout and DNS cache
+    idle_timeout = adapter.idle_timeout
+    dns_cache = adapter.dns_cache
+
+    class Connection(connection_base):
+        def connect(self):
+            if not connection_timing.active:
+                return super().connect()
+
+            start = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                connection_timing.add(time.perf_counter() - start)
+
+        def _new_conn(self):
+            if dns_cache is None:
+                return super()._new_conn()
+
+            host = self._dns_host
+            self._dns_host = dns_cache.resolve(host, self.port)
+            try:
+                return super()._new_conn()
+            except Exception:
+                dns_cache.invalidate(host, self.port)
+                raise
+            finally:
+                # The host name is still used for the TLS handshake and the Host header
+                self._dns_host = host
+
+    class Pool(pool_base):
+        ConnectionCls = Connection
+
+        def _get_conn(self, timeout=None):
+            if not connection_timing.active:
+                return self._get_idle_checked_conn(timeout)
+
+            start = time.perf_counter()
+            try:
+                return self._get_idle_checked_conn(timeout)
+            finally:
+                connection_timing.add(time.perf_counter() - start)
+
+        def _get_idle_checked_conn(self, timeout):
+            conn = super()._get_conn(timeout)
+            idle_since = getattr(conn, "_idle_since", None)
+            if (
+                idle_timeout is not None
+                and idle_since is not None
+                and time.monotonic() - idle_since > idle_timeout
+            ):
+                # A closed connection reconnects when it is used
+                conn.close()
+            return conn
+
+        def _put_conn(self, conn):
+            if conn is not None:
+                conn._idle_since = time.monotonic()
+            super()._put_conn(conn)
+
+    return Pool
@@ -0,0 +1,113 @@
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from typing import AsyncIterator, Iterable, Iterator, Union
+
+
+def build_httpx_request(
+    client: Union[httpx.Client, httpx.AsyncClient],
+    prepared_request: requests.PreparedRequest,
+) -> httpx.Request:
+    """
+    Converts a prepared requests.PreparedRequest into an httpx.Request bound to the given client, so
+    that requests built by the shared encoding and query tunneling utilities can be sent over httpx.
+
+    Args:
+        client (Union[httpx.Client, httpx.AsyncClient]): The httpx client the request will be sent with
+        prepared_request (requests.PreparedRequest): The prepared request
+
+    Returns:
+        httpx.Request: The equivalent httpx request
+    """
+    body = prepared_request.body
+    if isinstance(client, httpx.AsyncClient) and not isinstance(
+        body, (bytes, str, type(None))
+    ):
+        # Streamed bodies (e.g. multipart bodies) must be async iterables for an AsyncClient. The
+        # Content-Length header set by requests is kept, so the body is not sent chunked.
+        body = _iterate_async(body)
+
+    return client.build_request(
+        method=prepared_request.method,
+        url=prepared_request.url,
+        headers=dict(prepared_request.headers),
+        content=body,
+    )
+
+
+async def _iterate_async(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def to_requests_response(
+    response: httpx.Response, prepared_request: requests.PreparedRequest
+) -> requests.Response:
+    """
+    Converts a fully-read httpx.Response into a requests.Response, so that the existing response
+    formatters can be reused and the `response` attribute of formatted responses is always a
+    requests.Response.
+
+    Args:
+        response (httpx.Response): The httpx response. The response content must already be read.
+        prepared_request (requests.PreparedRequest): The request the response belongs to
+
+    Returns:
+        requests.Response: The equivalent requests response
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted._content = response.content
+    # The content is complete, so closing the response must not try to release a raw stream
+    converted._content_consumed = True
+    converted.encoding = response.encoding
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    converted.request = prepared_request
+    return converted
+
+
+def to_streaming_requests_response(
+    response: httpx.Response, prepared_request: requests.PreparedRequest
+) -> requests.Response:
+    """
+    Converts an httpx.Response whose content has not been read into a requests.Response, whose
+    content is read from the httpx response on demand, e.g. with `iter_content()`. Closing the
+    converted response closes the httpx response.
+
+    Args:
+        response (httpx.Response): The httpx response, sent with `stream=True`
+        prepared_request (requests.PreparedRequest): The request the response belongs to
+
+    Returns:
+        requests.Response: The equivalent requests response
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.raw = HttpxRawStream(response)
+    converted.encoding = response.encoding
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    converted.request = prepared_request
+    return converted
+
+
+class HttpxRawStream:
+    """
+    Exposes the body of a streamed httpx.Response through the `stream()` and `close()` methods that
+    requests.Response expects of its `raw` attribute.
+    """
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+
+    def stream(self, chunk_size: int, decode_content: bool = True) -> Iterator[bytes]:
+        # httpx always decodes the content encoding
+        return self.response.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        self.response.close()
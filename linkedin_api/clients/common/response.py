@@ -1,8 +1,99 @@
 from requests import Response
-from typing import Dict
+from typing import Any, Callable, Dict, Optional
+import threading
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+from linkedin_api.common.errors import ResponseFormattingError
+
+
+class LazyValue:
+    """
+    A placeholder for a response attribute value that is computed the first time the attribute is read,
+    typically from the decoded response body.
+    """
+
+    __slots__ = ("compute",)
+
+    def __init__(self, compute: Callable[[], Any]):
+        self.compute = compute
+
+
+class LazyJsonBody:
+    """
+    Decodes the JSON body of a response the first time it is needed, and at most once, even if several
+    threads need it at the same time. Only the body bytes are kept until then, not the response, so that
+    the raw response can be released early.
+    """
+
+    __slots__ = ("content", "optional", "codec", "decoded", "value", "lock")
+
+    def __init__(
+        self,
+        response: Response,
+        optional: bool = False,
+        codec: Optional[JsonCodec] = None,
+    ):
+        """
+        Args:
+            response (Response): The response whose body should be decoded
+            optional (bool, optional): Flag whether the body may be empty or not JSON, in which case the
+            decoded value is None instead of raising an error. Defaults to False.
+            codec (Optional[JsonCodec], optional): The codec used to decode the body. Defaults to the default codec.
+        """
+        self.content = response.content
+        self.optional = optional
+        self.codec = codec or get_default_codec()
+        self.decoded = False
+        self.value = None
+        self.lock = threading.Lock()
+
+    def get(self) -> Any:
+        if not self.decoded:
+            with self.lock:
+                # Another thread may have decoded the body while this one waited for the lock
+                if not self.decoded:
+                    try:
+                        self.value = self.codec.decode(self.content)
+                    except ValueError:
+                        if not self.optional:
+                            raise
+                        self.value = None
+                    self.decoded = True
+                    # The decoded value is all that is needed from now on
+                    self.content = None
+        return self.value
+
+
+class lazy_attribute:
+    """
+    A descriptor for response attributes that can be assigned either a value, or a LazyValue that is
+    resolved (and replaced by its result) when the attribute is first read. The value is stored in the
+    "_<name>" attribute, which classes with __slots__ must declare.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.storage_name = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.storage_name)
+        if isinstance(value, LazyValue):
+            try:
+                value = value.compute()
+            except Exception as e:
+                raise ResponseFormattingError from e
+            setattr(instance, self.storage_name, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.storage_name, value)
 
 
 class BaseResponse:
+    __slots__ = ("status_code", "response", "headers", "url")
+
     def __init__(
         self,
         status_code: int,
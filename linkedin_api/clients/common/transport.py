@@ -0,0 +1,255 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+import importlib.util
+import ssl
+import requests
+from linkedin_api.clients.common.connection_pool import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DnsCache,
+    PooledHTTPAdapter,
+)
+
+DEFAULT_HTTP2_MAX_CONNECTIONS = 4
+DEFAULT_HTTP2_MAX_KEEPALIVE_CONNECTIONS = 4
+
+_HTTP2_PACKAGES_REQUIRED = (
+    "The httpx and h2 packages are required to use the Http2Transport "
+    "(pip install httpx[http2])"
+)
+
+
+class Transport(ABC):
+    """
+    Sends prepared requests for the RestliClient and the AuthClient. Requests are built (encoded, query
+    tunneled and given their headers) in the same way for every transport, and every transport returns
+    requests.Response objects, so that retries and response formatting do not depend on the transport.
+
+    Transports must be safe to use from several threads at once. Connection errors and timeouts are
+    raised as requests.ConnectionError and requests.Timeout.
+    """
+
+    name: str
+    """
+    A short name identifying the transport, e.g. in benchmark output
+    """
+
+    max_concurrency: Optional[int] = None
+    """
+    The number of requests the transport can send at the same time, each on its own connection, or None
+    if it is not limited (e.g. because requests are multiplexed, or the limit is not known)
+    """
+
+    @abstractmethod
+    def send(
+        self, prepared_request: requests.PreparedRequest, stream: bool = False
+    ) -> requests.Response:
+        """
+        Sends a prepared request.
+
+        Args:
+            prepared_request (requests.PreparedRequest): The request to send
+            stream (bool, optional): Flag whether the response body should be read on demand, rather than before returning. Defaults to False.
+
+        Raises:
+            requests.ConnectionError: Error raised if the connection failed
+            requests.Timeout: Error raised if the request timed out
+
+        Returns:
+            requests.Response: The response
+        """
+        pass
+
+    def warmup(self, url: str, connections: int = 1) -> None:
+        """
+        Opens connections to the host of a URL ahead of the first request, so that the DNS lookup and the
+        TCP and TLS handshakes are not paid by it. Transports that cannot open connections ahead of time
+        do nothing.
+
+        Args:
+            url (str): A URL on the host to connect to
+            connections (int, optional): The number of connections to open. Defaults to 1.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Closes the connections of the transport.
+        """
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    Sends requests with a requests.Session, over HTTP/1.1. Each connection carries one request at a time,
+    so concurrent calls each use their own pooled connection.
+
+    The session is shared by all threads. This is safe because sending only reads the session's
+    configuration (its adapters are mounted before the first request), its cookie jar is guarded by a
+    lock, and its connection pool hands each thread a separate connection.
+    """
+
+    name = "requests"
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        idle_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[float] = None,
+    ):
+        """
+        The constructor for the RequestsTransport class.
+
+        Args:
+            session (Optional[requests.Session], optional): The session used to send the requests. The connection pool options only apply to the default session, so a given session keeps its adapters. Defaults to a new session.
+            pool_connections (int, optional): The number of hosts whose connection pools are kept. Defaults to 10.
+            pool_maxsize (int, optional): The maximum number of connections kept per host, which should be at least the number of concurrent calls. Defaults to 32.
+            pool_block (bool, optional): Flag whether calls wait for a pooled connection when `pool_maxsize` connections are in use, instead of opening a connection that is discarded afterwards. Defaults to False.
+            idle_timeout (Optional[float], optional): The time in seconds after which idle connections are closed instead of reused. Should be below the keep-alive timeout of the server. None keeps idle connections until the server closes them. Defaults to None.
+            dns_cache_ttl (Optional[float], optional): The time in seconds resolved host addresses are reused for when opening connections. None looks up the host for every connection. Defaults to None.
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = PooledHTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                idle_timeout=idle_timeout,
+                dns_cache=DnsCache(dns_cache_ttl) if dns_cache_ttl else None,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self.max_concurrency = pool_maxsize
+
+        self.session = session
+        """
+        The session used to send the requests. Session attributes can be modified, which will affect all
+        requests.
+        """
+
+    def send(
+        self, prepared_request: requests.PreparedRequest, stream: bool = False
+    ) -> requests.Response:
+        return self.session.send(prepared_request, stream=stream)
+
+    def warmup(self, url: str, connections: int = 1) -> None:
+        adapter = self.session.get_adapter(url)
+        prepared_request = requests.Request("GET", url).prepare()
+        # Connect the connections of the pool that the requests will use, which depends on the same
+        # TLS and proxy settings as when sending
+        pool = adapter.get_connection_with_tls_context(
+            prepared_request,
+            verify=self.session.verify,
+            proxies=self.session.rebuild_proxies(prepared_request, self.session.proxies),
+            cert=self.session.cert,
+        )
+        pooled_connections = [
+            pool._get_conn() for _ in range(min(connections, pool.pool.maxsize))
+        ]
+        try:
+            unconnected = [conn for conn in pooled_connections if conn.sock is None]
+            if unconnected:
+                with ThreadPoolExecutor(max_workers=len(unconnected)) as executor:
+                    list(executor.map(lambda conn: conn.connect(), unconnected))
+        finally:
+            for conn in pooled_connections:
+                pool._put_conn(conn)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Http2Transport(Transport):
+    """
+    Sends requests with an httpx.Client over HTTP/2, which multiplexes concurrent calls (e.g. from
+    several threads) as streams of a few connections, instead of opening a connection per call. Servers
+    that do not support HTTP/2 are transparently spoken to over HTTP/1.1.
+
+    Requires the optional httpx and h2 packages (`pip install httpx[http2]`). They are
+    imported when the transport is constructed, so the other transports do not depend on them.
+    """
+
+    name = "http2"
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = DEFAULT_HTTP2_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[
+            int
+        ] = DEFAULT_HTTP2_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: Optional[float] = None,
+        verify: Union[bool, ssl.SSLContext] = True,
+    ):
+        """
+        The constructor for the Http2Transport class.
+
+        Args:
+            max_connections (Optional[int], optional): The maximum number of connections. Since every connection carries many concurrent streams, a few are enough. Defaults to 4.
+            max_keepalive_connections (Optional[int], optional): The maximum number of idle connections kept alive. Defaults to 4.
+            timeout (Optional[float], optional): The timeout in seconds for each request. None disables the timeout, matching the RequestsTransport. Defaults to None.
+            verify (Union[bool, ssl.SSLContext], optional): Flag whether TLS certificates are verified, or the SSL context to verify them with. Defaults to True.
+
+        Raises:
+            ImportError: Error raised if the httpx or h2 package is not installed
+        """
+        try:
+            import httpx
+        except ImportError as error:
+            raise ImportError(_HTTP2_PACKAGES_REQUIRED) from error
+        # httpx imports h2 itself when the client is created, so it only needs to be found here
+        if importlib.util.find_spec("h2") is None:
+            raise ImportError(_HTTP2_PACKAGES_REQUIRED)
+
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            verify=verify,
+        )
+        """
+        The httpx client used to send the requests.
+        """
+
+    def send(
+        self, prepared_request: requests.PreparedRequest, stream: bool = False
+    ) -> requests.Response:
+        import httpx
+        from linkedin_api.clients.common.httpx_compat import (
+            build_httpx_request,
+            to_requests_response,
+            to_streaming_requests_response,
+        )
+
+        request = build_httpx_request(self.client, prepared_request)
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(error, request=prepared_request) from error
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error, request=prepared_request) from error
+
+        if stream:
+            return to_streaming_requests_response(response, prepared_request)
+        return to_requests_response(response, prepared_request)
+
+    def warmup(self, url: str, connections: int = 1) -> None:
+        # httpx cannot open connections without a request, so a HEAD request is sent and its response
+        # discarded. A single HTTP/2 connection serves all concurrent calls.
+        import httpx
+
+        try:
+            self.client.head(url)
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error) from error
+
+    def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,779 @@
+import asyncio
+import copy
+import httpx
+from typing import AsyncIterator, Dict, Any, List, Optional, Type, Tuple, TypeVar, Union
+import linkedin_api.clients.restli.utils.api as apiutils
+import linkedin_api.clients.restli.utils.encoder as encoder
+import linkedin_api.clients.restli.utils.paging as paging
+from linkedin_api.clients.restli.route import RestliRoute
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+from linkedin_api.clients.common.httpx_compat import (
+    build_httpx_request,
+    to_requests_response,
+)
+from linkedin_api.clients.restli.client import (
+    RestliEntityId,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+)
+from linkedin_api.clients.restli.utils.compression import RequestCompression
+from linkedin_api.clients.restli.utils.query_tunneling import (
+    maybe_apply_query_tunneling,
+    partition_ids_to_fit_query_string,
+)
+from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.clients.restli.response_formatter import (
+    BaseResponseFormatter,
+    ActionResponseFormatter,
+    BatchCreateResponseFormatter,
+    BatchDeleteResponseFormatter,
+    BatchFinderResponseFormatter,
+    CollectionResponseFormatter,
+    BatchGetResponseFormatter,
+    CreateResponseFormatter,
+    GetResponseFormatter,
+    BatchUpdateResponseFormatter,
+    DeleteResponseFormatter,
+    UpdateResponseFormatter,
+)
+from linkedin_api.clients.restli.response import (
+    BaseRestliResponse,
+    ActionResponse,
+    BatchCreateResponse,
+    BatchDeleteResponse,
+    BatchFinderResponse,
+    BatchUpdateResponse,
+    CreateResponse,
+    GetResponse,
+    BatchGetResponse,
+    CollectionResponse,
+    RestliEntity,
+    UpdateResponse,
+)
+
+T = TypeVar("T", bound=BaseRestliResponse)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class AsyncRestliClient:
+    """
+    An asyncio client for making Rest.li-based, LinkedIn API calls. It offers the same methods as the
+    RestliClient as coroutines, and sends all requests over a single pooled httpx.AsyncClient, so many
+    calls can be in flight on one event loop without a thread per call.
+
+    Requests are encoded, query tunneled and formatted with the same utilities as the RestliClient, so
+    the returned response objects are identical.
+
+    Attributes:
+        client (httpx.AsyncClient): The httpx client instance used to send the API requests. Its
+        connection pool is shared by all requests made with this AsyncRestliClient.
+        release_raw_responses (bool): Flag whether the raw requests.Response is dropped from formatted
+        responses, so that retained results only hold their decoded payload.
+        codec (JsonCodec): The codec used to serialize request bodies and decode response bodies.
+        compression (Optional[RequestCompression]): The gzip compression configuration for large request
+        bodies. If None, request bodies are sent uncompressed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: Optional[float] = None,
+        release_raw_responses: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compression: Optional[RequestCompression] = None,
+    ):
+        """
+        The constructor for the AsyncRestliClient class.
+
+        Args:
+            max_connections (Optional[int], optional): The maximum number of concurrent connections in the pool. None means no limit. Defaults to 100.
+            max_keepalive_connections (Optional[int], optional): The maximum number of idle connections kept alive in the pool. Defaults to 20.
+            timeout (Optional[float], optional): The timeout in seconds for each request. None disables the timeout, matching the RestliClient. Defaults to None.
+            release_raw_responses (bool, optional): Flag whether the `response` attribute of formatted responses is set to None once they are formatted. See `RestliClient` for details. Defaults to False.
+            codec (Optional[JsonCodec], optional): The JSON codec for request and response bodies. Defaults to the OrjsonCodec if orjson is installed, otherwise the StdlibJsonCodec.
+            compression (Optional[RequestCompression], optional): Opt-in gzip compression of request bodies above a size threshold. See `RestliClient` for details. Defaults to None.
+        """
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+        self.release_raw_responses = release_raw_responses
+        self.codec = codec or get_default_codec()
+        self.compression = compression
+
+    async def __aenter__(self) -> "AsyncRestliClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying connection pool. The client cannot be used after it is closed.
+        """
+        await self.client.aclose()
+
+    def route(self, resource_path: str) -> RestliRoute:
+        """
+        Compiles a resource path template into a route. See `RestliClient.route` for details.
+        """
+        return RestliRoute(resource_path)
+
+    async def get(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> GetResponse:
+        """
+        Makes a Rest.li GET request to fetch the specified entity on a resource. See `RestliClient.get`
+        for details on the arguments.
+
+        Returns:
+            GetResponse: An instance of the GetResponse class representing the response from the Rest.li GET call
+
+        Example:
+            >>> response = await async_restli_client.get(
+                    resource_path="/adAccounts/{id}",
+                    path_keys={ "id": 123 },
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202302"
+                )
+            >>> ad_account = response.entity
+        """
+        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.GET,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=GetResponseFormatter,
+        )
+
+    async def batch_get(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+        chunked: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> BatchGetResponse:
+        """
+        Makes a Rest.li BATCH_GET request to fetch multiple entities on a resource. With `chunked` set, the ids
+        are split into chunks that fit the URL length limit, which are fetched concurrently and merged. See
+        `RestliClient.batch_get` for details on the arguments.
+
+        Returns:
+            BatchGetResponse: An instance of the BatchGetResponse class representing the response from the Rest.li BATCH_GET call
+        """
+        if chunked:
+            id_chunks = partition_ids_to_fit_query_string(ids, query_params)
+            if len(id_chunks) > 1:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def fetch_chunk(id_chunk):
+                    async with semaphore:
+                        return await self.batch_get(
+                            resource_path=resource_path,
+                            ids=id_chunk,
+                            access_token=access_token,
+                            path_keys=path_keys,
+                            query_params=query_params,
+                            version_string=version_string,
+                        )
+
+                responses = await asyncio.gather(
+                    *[fetch_chunk(id_chunk) for id_chunk in id_chunks]
+                )
+                return BatchGetResponseFormatter.merge_responses(
+                    responses, id_chunks
+                )
+
+        query_params_final = copy.deepcopy(query_params) if query_params else {}
+        query_params_final.update({"ids": ids})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            query_params_final
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_GET,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchGetResponseFormatter,
+        )
+
+    async def get_all(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CollectionResponse:
+        """
+        Makes a Rest.li GET_ALL request to fetch all entities on a resource. See `RestliClient.get_all`
+        for details on the arguments.
+
+        Returns:
+            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li GET_ALL call
+        """
+        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.GET_ALL,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=CollectionResponseFormatter,
+        )
+
+    async def finder(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        finder_name: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CollectionResponse:
+        """
+        Makes a Rest.li FINDER request to find entities by some specified criteria. See
+        `RestliClient.finder` for details on the arguments.
+
+        Returns:
+            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li FINDER call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"q": finder_name})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            final_query_params
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.FINDER,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=CollectionResponseFormatter,
+        )
+
+    async def batch_finder(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        finder_name: str,
+        finder_criteria: Tuple[str, List[Dict[str, Any]]],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchFinderResponse:
+        """
+        Makes a Rest.li BATCH_FINDER request to find entities by multiple sets of criteria. See
+        `RestliClient.batch_finder` for details on the arguments.
+
+        Returns:
+            BatchFinderResponse: An instance of the BatchFinderResponse class representing the response from the Rest.li BATCH_FINDER call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"bq": finder_name})
+        final_query_params.update({finder_criteria[0]: finder_criteria[1]})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            final_query_params
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_FINDER,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchFinderResponseFormatter,
+        )
+
+    async def create(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        entity: RestliEntity,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CreateResponse:
+        """
+        Makes a Rest.li CREATE request to create a new resource entity. See `RestliClient.create` for
+        details on the arguments.
+
+        Returns:
+            CreateResponse: An instance of the CreateResponse class representing the response from the Rest.li CREATE call
+
+        Example:
+            >>> response = await async_restli_client.create(
+                    resource_path="/ugcPosts",
+                    entity=ugc_post,
+                    access_token=MY_ACCESS_TOKEN
+                )
+            >>> created_entity_id = response.entity_id
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.CREATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=entity,
+            version_string=version_string,
+            formatter=CreateResponseFormatter,
+        )
+
+    async def batch_create(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        entities: List[RestliEntity],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchCreateResponse:
+        """
+        Makes a Rest.li BATCH_CREATE request to create multiple entities in a single call. See
+        `RestliClient.batch_create` for details on the arguments.
+
+        Returns:
+            BatchCreateResponse: An instance of the BatchCreateResponse class representing the response from the Rest.li BATCH_CREATE call
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+        request_body = {"elements": entities}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_CREATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=request_body,
+            version_string=version_string,
+            formatter=BatchCreateResponseFormatter,
+        )
+
+    async def update(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        entity: RestliEntity,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> UpdateResponse:
+        """
+        Makes a Rest.li UPDATE request to update an entity (overwriting the entity with the provided
+        value). See `RestliClient.update` for details on the arguments.
+
+        Returns:
+            UpdateResponse: An instance of the UpdateResponse class representing the response from the Rest.li UPDATE call
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=entity,
+            version_string=version_string,
+            formatter=UpdateResponseFormatter,
+        )
+
+    async def batch_update(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        entities: List[RestliEntity],
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchUpdateResponse:
+        """
+        Makes a Rest.li BATCH_UPDATE request to update multiple entities in a single call. See
+        `RestliClient.batch_update` for details on the arguments.
+
+        Returns:
+            BatchUpdateResponse: An instance of the BatchUpdateResponse class representing the response from the Rest.li BATCH_UPDATE call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        encoded_ids = [encoder.encode(id) for id in ids]
+        entities_map = dict(zip(encoded_ids, entities))
+        request_body = {"entities": entities_map}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchUpdateResponseFormatter,
+        )
+
+    async def partial_update(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        patch_set_object: Dict[str, Any],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> UpdateResponse:
+        """
+        Makes a Rest.li PARTIAL_UPDATE request to update part of an entity. See
+        `RestliClient.partial_update` for details on the arguments.
+
+        Returns:
+            UpdateResponse: An instance of the UpdateResponse class representing the response from the Rest.li PARTIAL_UPDATE call
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        request_body = {"patch": {"$set": patch_set_object}}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.PARTIAL_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=UpdateResponseFormatter,
+        )
+
+    async def batch_partial_update(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        ids: List[RestliEntityId],
+        patch_set_objects: List[Dict[str, Any]],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchUpdateResponse:
+        """
+        Makes a Rest.li BATCH_PARTIAL_UPDATE request to update multiple entities at once. See
+        `RestliClient.batch_partial_update` for details on the arguments.
+
+        Returns:
+            BatchUpdateResponse: An instance of the BatchUpdateResponse class representing the response from the Rest.li BATCH_PARTIAL_UPDATE call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        id_to_patch_map = dict(zip(ids, patch_set_objects))
+        entities_map = {
+            encoder.encode(id): {"patch": {"$set": patch_set_object}}
+            for (id, patch_set_object) in id_to_patch_map.items()
+        }
+        request_body = {"entities": entities_map}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_PARTIAL_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchUpdateResponseFormatter,
+        )
+
+    async def delete(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BaseRestliResponse:
+        """
+        Makes a Rest.li DELETE request to delete an entity. See `RestliClient.delete` for details on
+        the arguments.
+
+        Returns:
+            BaseRestliResponse: An instance of the BaseRestliResponse class representing the response of the Rest.li DELETE call
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.DELETE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=DeleteResponseFormatter,
+        )
+
+    async def batch_delete(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchDeleteResponse:
+        """
+        Makes a Rest.li BATCH_DELETE request to delete multiple entities at once. See
+        `RestliClient.batch_delete` for details on the arguments.
+
+        Returns:
+            BatchDeleteResponse: An instance of BatchDeleteResponse class representing the response of the Rest.li BATCH_DELETE call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        return await self.__send_and_format_response(
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            restli_method=RESTLI_METHODS.BATCH_DELETE,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchDeleteResponseFormatter,
+        )
+
+    async def action(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        action_name: str,
+        access_token: str,
+        action_params: Optional[Dict[str, Any]] = None,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> ActionResponse:
+        """
+        Makes a Rest.li ACTION request to perform an action on a specified resource. See
+        `RestliClient.action` for details on the arguments.
+
+        Returns:
+            ActionResponse: An instance of ActionResponse class representing the response of the Rest.li ACTION call
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"action": action_name})
+
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        request_body = action_params if action_params else {}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.ACTION,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=ActionResponseFormatter,
+        )
+
+    async def iter_pages(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        finder_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> AsyncIterator[CollectionResponse]:
+        """
+        Lazily iterates over all pages of a Rest.li GET_ALL or FINDER collection, fetching the next page in a
+        background task while the current page is consumed. See `RestliClient.iter_pages` for details on the
+        arguments and paging behavior.
+
+        Raises:
+            PageFetchError: Error raised if a page is returned with a non-2xx status code, instead of ending the iteration
+
+        Yields:
+            CollectionResponse: The response of each page, in order
+        """
+        start = query_params.get(paging.START_PARAM, 0) if query_params else 0
+        count = page_size
+        if count is None and query_params:
+            count = query_params.get(paging.COUNT_PARAM, None)
+
+        async def fetch_page(page_start: int) -> CollectionResponse:
+            page_query_params = paging.build_page_query_params(
+                query_params, page_start, count
+            )
+            if finder_name is not None:
+                return await self.finder(
+                    resource_path=resource_path,
+                    finder_name=finder_name,
+                    access_token=access_token,
+                    path_keys=path_keys,
+                    query_params=page_query_params,
+                    version_string=version_string,
+                )
+            return await self.get_all(
+                resource_path=resource_path,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=page_query_params,
+                version_string=version_string,
+            )
+
+        if not prefetch:
+            while start is not None:
+                page = await fetch_page(start)
+                start = paging.get_next_page_start(page, start, count)
+                yield page
+            return
+
+        next_page = asyncio.ensure_future(fetch_page(start))
+        try:
+            while next_page is not None:
+                page = await next_page
+                start = paging.get_next_page_start(page, start, count)
+                next_page = (
+                    asyncio.ensure_future(fetch_page(start))
+                    if start is not None
+                    else None
+                )
+                yield page
+        finally:
+            # Runs when the collection is exhausted or the caller stops iterating early
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iter_elements(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        finder_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> AsyncIterator[RestliEntity]:
+        """
+        Lazily iterates over all elements of a Rest.li GET_ALL or FINDER collection, across pages. See
+        `RestliClient.iter_pages` for details on the arguments and paging behavior.
+
+        Raises:
+            PageFetchError: Error raised if a page is returned with a non-2xx status code, instead of ending the iteration
+
+        Yields:
+            RestliEntity: Each element of the collection, in order
+
+        Example:
+            >>> async for ad_account in async_restli_client.iter_elements(
+                    resource_path="/adAccounts",
+                    finder_name="search",
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202302"
+                ):
+                    print(ad_account["name"])
+        """
+        async for page in self.iter_pages(
+            resource_path=resource_path,
+            access_token=access_token,
+            finder_name=finder_name,
+            page_size=page_size,
+            prefetch=prefetch,
+            path_keys=path_keys,
+            query_params=query_params,
+            version_string=version_string,
+        ):
+            for element in page.elements or []:
+                yield element
+
+    async def __send_and_format_response(
+        self,
+        *,
+        restli_method: RESTLI_METHODS,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        formatter: Type[BaseResponseFormatter[T]],
+        path_keys: Optional[Dict[str, Any]] = None,
+        encoded_query_param_string: Optional[str] = None,
+        request_body: Optional[Any] = None,
+        version_string: Optional[str] = None
+    ) -> T:
+        url = apiutils.build_rest_url(
+            resource_path=resource_path,
+            path_keys=path_keys,
+            version_string=version_string,
+        )
+
+        prepared_request = maybe_apply_query_tunneling(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=restli_method,
+            original_request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            codec=self.codec,
+            compression=self.compression,
+        )
+
+        response = await self.client.send(
+            build_httpx_request(self.client, prepared_request)
+        )
+        formatted_response = formatter.format_response(
+            to_requests_response(response, prepared_request), codec=self.codec
+        )
+        if self.release_raw_responses:
+            formatted_response.response = None
+        return formatted_response
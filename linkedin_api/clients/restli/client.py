@@ -1,16 +1,57 @@
 import requests
 import copy
-from typing import Union, Dict, Any, List, Optional, Type, Tuple, TypeVar
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Union,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Tuple,
+    TypeVar,
+)
 import linkedin_api.clients.restli.utils.api as apiutils
 import linkedin_api.clients.restli.utils.encoder as encoder
+import linkedin_api.clients.restli.utils.paging as paging
+from linkedin_api.clients.restli.route import RestliRoute
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+from linkedin_api.clients.common.transport import Transport, RequestsTransport
+from linkedin_api.clients.common.connection_pool import connection_timing
 from linkedin_api.clients.restli.utils.restli import (
     encode_query_params_for_get_requests,
+    get_request_key,
 )
 from linkedin_api.clients.restli.utils.query_tunneling import (
-    maybe_apply_query_tunneling_get_requests,
-    maybe_apply_query_tunneling_requests_with_body,
+    maybe_apply_query_tunneling,
+    partition_ids_to_fit_query_string,
+)
+from linkedin_api.clients.restli.utils.rate_limit import RateLimiter
+from linkedin_api.clients.restli.utils.compression import RequestCompression
+from linkedin_api.clients.restli.utils.batching import GetBatcher
+from linkedin_api.clients.restli.utils.instrumentation import (
+    RequestTiming,
+    TimedCodec,
+    TimingHook,
+)
+from linkedin_api.clients.restli.utils.middleware import (
+    Middleware,
+    RestliCall,
+    compose_middlewares,
+)
+from linkedin_api.clients.restli.utils.retry import RetryPolicy
+from linkedin_api.clients.restli.utils.single_flight import SingleFlight
+from linkedin_api.clients.restli.utils.cache import (
+    ResponseCache,
+    IF_NONE_MATCH_HEADER,
+    NOT_MODIFIED_STATUS_CODE,
 )
-from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.common.constants import RESTLI_METHODS, VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
 from linkedin_api.clients.restli.response_formatter import (
     BaseResponseFormatter,
     ActionResponseFormatter,
@@ -24,6 +65,8 @@ from linkedin_api.clients.restli.response_formatter import (
     BatchUpdateResponseFormatter,
     DeleteResponseFormatter,
     UpdateResponseFormatter,
+    StreamingBatchFinderResponseFormatter,
+    StreamingCollectionResponseFormatter,
 )
 from linkedin_api.clients.restli.response import (
     BaseRestliResponse,
@@ -37,6 +80,7 @@ from linkedin_api.clients.restli.response import (
     BatchGetResponse,
     CollectionResponse,
     RestliEntity,
+    StreamingCollectionResponse,
     UpdateResponse,
 )
 
@@ -44,26 +88,200 @@ RestliEntityId = Union[str, int, Dict[str, Any]]
 
 T = TypeVar("T", bound=BaseRestliResponse)
 
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+READ_RESTLI_METHODS = frozenset(
+    [
+        RESTLI_METHODS.GET,
+        RESTLI_METHODS.BATCH_GET,
+        RESTLI_METHODS.GET_ALL,
+        RESTLI_METHODS.FINDER,
+        RESTLI_METHODS.BATCH_FINDER,
+    ]
+)
+
+CACHEABLE_RESTLI_METHODS = frozenset(
+    [
+        RESTLI_METHODS.GET,
+        RESTLI_METHODS.BATCH_GET,
+        RESTLI_METHODS.GET_ALL,
+        RESTLI_METHODS.FINDER,
+    ]
+)
+
 
 class RestliClient:
     """
     A client for making Rest.li-based, LinkedIn API calls.
 
     Attributes:
-        session (requests.Session): The session instance used to send the API requests. Session attributes can
-        be modified, which will affect all requests.
+        transport (Transport): The transport used to send the API requests.
+        session (Optional[requests.Session]): The session instance used to send the API requests, if the
+        transport is a RequestsTransport, otherwise None. Session attributes can be modified, which will
+        affect all requests.
+        retry_policy (Optional[RetryPolicy]): The policy used to retry throttled or failed requests. If None,
+        every request is sent exactly once.
+        rate_limiter (Optional[RateLimiter]): The client-side rate limiter applied before every request is
+        sent, including retries. If None, requests are not throttled.
+        coalesce_reads (bool): Flag whether identical read requests that are in flight at the same time share
+        a single network round trip and formatted response.
+        cache (Optional[ResponseCache]): The cache used for GET, BATCH_GET, GET_ALL and FINDER responses. If
+        None, responses are not cached.
+        release_raw_responses (bool): Flag whether the raw requests.Response is dropped from formatted
+        responses, so that retained results only hold their decoded payload.
+        codec (JsonCodec): The codec used to serialize request bodies and decode response bodies.
+        compression (Optional[RequestCompression]): The gzip compression configuration for large request
+        bodies. If None, request bodies are sent uncompressed.
+        get_batcher (Optional[GetBatcher]): The batcher that combines concurrent GET calls on the same
+        collection into BATCH_GET calls. If None, every GET call is sent on its own.
+        timing_hooks (List[TimingHook]): The functions called with the per-phase timing of every call. If
+        empty, calls are not timed.
+        middlewares (List[Middleware]): The middlewares wrapping every call, composed when the client is
+        constructed. Changing the list afterwards has no effect.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_reads: bool = False,
+        cache: Optional[ResponseCache] = None,
+        release_raw_responses: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compression: Optional[RequestCompression] = None,
+        get_batcher: Optional[GetBatcher] = None,
+        transport: Optional[Transport] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        idle_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[float] = None,
+        timing_hooks: Optional[List[TimingHook]] = None,
+        middlewares: Optional[List[Middleware]] = None,
+    ):
         """
         The constructor for the RestliClient class.
+
+        Args:
+            retry_policy (Optional[RetryPolicy], optional): The policy used to retry throttled (429) or failed requests, with jittered exponential backoff that honors the Retry-After header. Defaults to None.
+            rate_limiter (Optional[RateLimiter], optional): A client-side rate limiter with token buckets keyed by resource path template, to keep the request rate within the application quotas. Defaults to None.
+            coalesce_reads (bool, optional): Flag whether concurrent, identical read requests (GET, BATCH_GET, GET_ALL, FINDER and BATCH_FINDER) should be coalesced. Requests are identical if their method, URL, headers (including the access token) and body match. All callers then receive the same formatted response object, which should be treated as read-only. Defaults to False.
+            cache (Optional[ResponseCache], optional): A cache for GET, BATCH_GET, GET_ALL and FINDER responses. Fresh entries are served without a request, and stale entries are revalidated with their ETag. Cached response objects are shared and should be treated as read-only. Defaults to None.
+            release_raw_responses (bool, optional): Flag whether the `response` attribute of formatted responses is set to None once they are formatted, so that the raw response (its body, headers and prepared request) can be garbage collected. Useful when many responses are kept in memory. Defaults to False.
+            codec (Optional[JsonCodec], optional): The JSON codec for request and response bodies. Defaults to the OrjsonCodec if orjson is installed, otherwise the StdlibJsonCodec.
+            compression (Optional[RequestCompression], optional): Opt-in gzip compression of request bodies above a size threshold, such as large BATCH_CREATE, BATCH_UPDATE and BATCH_PARTIAL_UPDATE payloads. Defaults to None.
+            get_batcher (Optional[GetBatcher], optional): A batcher that collects concurrent `get()` calls on entities of the same collection (e.g. on "/organizations/{id}") and sends them as a single BATCH_GET. Each call still returns its own GetResponse. Defaults to None.
+            transport (Optional[Transport], optional): The transport used to send the requests, e.g. an Http2Transport to multiplex concurrent calls over a few HTTP/2 connections. Defaults to a RequestsTransport, which uses HTTP/1.1.
+            pool_connections (Optional[int], optional): The number of hosts whose connection pools are kept by the default transport. Defaults to 10.
+            pool_maxsize (Optional[int], optional): The maximum number of connections per host kept by the default transport, which should be at least the number of concurrent calls. Defaults to 32.
+            pool_block (Optional[bool], optional): Flag whether calls wait for a pooled connection when `pool_maxsize` connections are in use, instead of opening a connection that is discarded afterwards. Defaults to False.
+            idle_timeout (Optional[float], optional): The time in seconds after which idle connections of the default transport are closed instead of reused. Should be below the keep-alive timeout of the server. Defaults to None, which keeps idle connections until the server closes them.
+            dns_cache_ttl (Optional[float], optional): The time in seconds resolved host addresses are reused for by the default transport when opening connections. Defaults to None, which looks up the host for every connection.
+            timing_hooks (Optional[List[TimingHook]], optional): Functions called with a RequestTiming once each call completes (successfully or not), which holds the time spent encoding, building the URL, preparing the request, acquiring connections, waiting for the first byte, downloading and formatting the response. A RequestMetrics can be used to export latency histograms. Hooks are called on the calling thread, and exceptions they raise are propagated. Defaults to None, which disables timing.
+            middlewares (Optional[List[Middleware]], optional): Middlewares that wrap every call, from its prepared request to its formatted response, e.g. to sign requests or record metrics. The first middleware is the outermost one. Middlewares run around the response cache, the coalescing of reads and retries. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: Error raised if connection pool options are given together with a `transport`
+        """
+        pool_options = {
+            name: value
+            for (name, value) in (
+                ("pool_connections", pool_connections),
+                ("pool_maxsize", pool_maxsize),
+                ("pool_block", pool_block),
+                ("idle_timeout", idle_timeout),
+                ("dns_cache_ttl", dns_cache_ttl),
+            )
+            if value is not None
+        }
+        if transport is not None and pool_options:
+            raise InvalidArgumentError(
+                "Connection pool options can only be used with the default transport"
+            )
+
+        self.transport = transport or RequestsTransport(**pool_options)
+        self.session = (
+            self.transport.session
+            if isinstance(self.transport, RequestsTransport)
+            else None
+        )
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.coalesce_reads = coalesce_reads
+        self.cache = cache
+        self.release_raw_responses = release_raw_responses
+        self.codec = codec or get_default_codec()
+        self.compression = compression
+        self.get_batcher = get_batcher
+        self.timing_hooks = list(timing_hooks) if timing_hooks else []
+        self.middlewares = list(middlewares) if middlewares else []
+        # Without middlewares, calls go straight to the client
+        self.__send_call = compose_middlewares(
+            self.middlewares, self.__send_and_format_call
+        )
+        self.__single_flight = SingleFlight()
+
+    def close(self) -> None:
+        """
+        Closes the connections of the client's transport.
+        """
+        self.transport.close()
+
+    def warmup(self, connections: int = 1) -> None:
         """
-        self.session = requests.Session()
+        Opens connections to the LinkedIn API ahead of the first call, so that it does not pay for the
+        DNS lookup and the TCP and TLS handshakes, e.g. right after a scheduled job starts.
+
+        Args:
+            connections (int, optional): The number of connections to open, e.g. the number of calls that will be made concurrently. Defaults to 1.
+
+        Example:
+            >>> restli_client = RestliClient(idle_timeout=50)
+            >>> restli_client.warmup()
+        """
+        self.transport.warmup(VERSIONED_BASE_URL, connections)
+
+    def __enter__(self) -> "RestliClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def route(self, resource_path: str) -> RestliRoute:
+        """
+        Compiles a resource path template into a route, which can be passed to every method of this client
+        in place of the resource path string. The template is parsed and validated once, instead of on
+        every request.
+
+        Args:
+            resource_path (str): The resource path template string, beginning with a forward slash. Path key placeholders (if any) should be specified using curly-braces.
+
+        Raises:
+            InvalidArgumentError: Error if the template contains the same placeholder more than once
+
+        Returns:
+            RestliRoute: The compiled route
+
+        Example:
+            >>> comments_route = restli_client.route("/socialActions/{id}/comments/{commentId}")
+            >>> response = restli_client.get(
+                    resource_path=comments_route,
+                    path_keys={
+                        "id": "urn:li:share:123",
+                        "commentId": 456
+                    },
+                    access_token=MY_ACCESS_TOKEN
+                )
+        """
+        return RestliRoute(resource_path)
 
     def get(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
@@ -74,7 +292,7 @@ class RestliClient:
         tunneling if necessary.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
@@ -93,14 +311,26 @@ class RestliClient:
                 )
             >>> ad_account = response.entity
         """
-
-        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
+        if self.get_batcher is not None:
+            route = apiutils.get_route(resource_path)
+            if (
+                route.entity_key is not None
+                and path_keys
+                and route.entity_key in path_keys
+            ):
+                return self.__batched_get(
+                    route=route,
+                    access_token=access_token,
+                    path_keys=path_keys,
+                    query_params=query_params,
+                    version_string=version_string,
+                )
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.GET,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             version_string=version_string,
             formatter=GetResponseFormatter,
@@ -109,24 +339,28 @@ class RestliClient:
     def batch_get(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         ids: List[RestliEntityId],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
+        version_string: Optional[str] = None,
+        chunked: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ) -> BatchGetResponse:
         """
         Makes a Rest.li BATCH_GET request to fetch multiple entities on a resource. This method will perform query
         tunneling if necessary.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             ids (List[RestliEntityId]): The list of ids to fetch on a resource. These will be properly encoded by this method and added to the query parameters.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            chunked (bool, optional): Flag whether to split the ids into chunks whose query strings fit the URL length limit instead of query tunneling a single large request. The chunks are fetched concurrently and their results, statuses and errors are merged into a single response. Defaults to False.
+            max_concurrency (int, optional): The maximum number of chunks fetched at the same time when `chunked` is set. Defaults to 8.
 
         Returns:
             BatchGetResponse: An instance of the BatchGetResponse class representing the response from the Rest.li BATCH_GET call
@@ -140,18 +374,38 @@ class RestliClient:
                 )
             >>> campaign_groups = response.results.items()
         """
+        if chunked:
+            id_chunks = partition_ids_to_fit_query_string(ids, query_params)
+            if len(id_chunks) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(id_chunks))
+                ) as executor:
+                    responses = list(
+                        executor.map(
+                            lambda id_chunk: self.batch_get(
+                                resource_path=resource_path,
+                                ids=id_chunk,
+                                access_token=access_token,
+                                path_keys=path_keys,
+                                query_params=query_params,
+                                version_string=version_string,
+                            ),
+                            id_chunks,
+                        )
+                    )
+                return BatchGetResponseFormatter.merge_responses(
+                    responses, id_chunks
+                )
+
         query_params_final = copy.deepcopy(query_params) if query_params else {}
 
         query_params_final.update({"ids": ids})
-        encoded_query_param_string = encode_query_params_for_get_requests(
-            query_params_final
-        )
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.BATCH_GET,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params_final,
             access_token=access_token,
             version_string=version_string,
             formatter=BatchGetResponseFormatter,
@@ -160,24 +414,26 @@ class RestliClient:
     def get_all(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
-    ) -> CollectionResponse:
+        version_string: Optional[str] = None,
+        stream: bool = False
+    ) -> Union[CollectionResponse, StreamingCollectionResponse]:
         """
         Makes a Rest.li GET_ALL request to fetch all entities on a resource.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            stream (bool, optional): Flag whether the response body should be streamed, in which case a StreamingCollectionResponse is returned, whose elements are decoded one at a time while the body is downloaded. This keeps the memory use for very large responses to about one element. Streamed responses are not cached or coalesced. Defaults to False.
 
         Returns:
-            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li GET_ALL call
+            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li GET_ALL call. If `stream` is set, a StreamingCollectionResponse instead.
 
         Example:
             >>> response = restli_client.get_all(
@@ -192,41 +448,44 @@ class RestliClient:
             >>> fields_of_study = response.elements
             >>> total = response.paging.total
         """
-        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
-
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.GET_ALL,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             version_string=version_string,
-            formatter=CollectionResponseFormatter,
+            formatter=(
+                StreamingCollectionResponseFormatter if stream else CollectionResponseFormatter
+            ),
+            stream=stream,
         )
 
     def finder(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         finder_name: str,
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
-    ) -> CollectionResponse:
+        version_string: Optional[str] = None,
+        stream: bool = False
+    ) -> Union[CollectionResponse, StreamingCollectionResponse]:
         """
         Makes a Rest.li FINDER request to find entities by some specified criteria.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             finder_name (str): The Rest.li finder name. This will be added to the request query parameters.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            stream (bool, optional): Flag whether the response body should be streamed, in which case a StreamingCollectionResponse is returned, whose elements are decoded one at a time while the body is downloaded. This keeps the memory use for very large responses to about one element. Streamed responses are not cached or coalesced. Defaults to False.
 
         Returns:
-            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li FINDER call
+            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li FINDER call. If `stream` is set, a StreamingCollectionResponse instead.
 
         Example:
             >>> response = restli_client.finder(
@@ -251,45 +510,47 @@ class RestliClient:
 
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"q": finder_name})
-        encoded_query_param_string = encode_query_params_for_get_requests(
-            final_query_params
-        )
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.FINDER,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             access_token=access_token,
             version_string=version_string,
-            formatter=CollectionResponseFormatter,
+            formatter=(
+                StreamingCollectionResponseFormatter if stream else CollectionResponseFormatter
+            ),
+            stream=stream,
         )
 
     def batch_finder(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         finder_name: str,
         finder_criteria: Tuple[str, List[Dict[str, Any]]],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
-    ) -> BatchFinderResponse:
+        version_string: Optional[str] = None,
+        stream: bool = False
+    ) -> Union[BatchFinderResponse, StreamingCollectionResponse]:
         """
         Makes a Rest.li BATCH_FINDER request to find entities by multiple sets of criteria.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             finder_name (str): The Rest.li batch finder name. This will be added to the request query parameters.
             finder_criteria (Tuple[str, List[Dict[str, Any]]]): The required batch finder criteria information. This is a tuple with the first value being the batch finder criteria parameter name. The second value is the list of finder param objects. The batch finder results are correspondingly ordered according to this list. The batch finder criteria will be encoded and added to the request query parameters.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            stream (bool, optional): Flag whether the response body should be streamed, in which case a StreamingCollectionResponse is returned, whose elements are decoded one at a time while the body is downloaded. This keeps the memory use for very large responses to about one element. Streamed responses are not cached or coalesced. Defaults to False.
 
         Returns:
-            BatchFinderResponse: An instance of the BatchFinderResponse class representing the response from the Rest.li BATCH_FINDER call
+            BatchFinderResponse: An instance of the BatchFinderResponse class representing the response from the Rest.li BATCH_FINDER call. If `stream` is set, a StreamingCollectionResponse instead.
 
         Example:
             >>> response = restli_client.batch_finder(
@@ -318,24 +579,24 @@ class RestliClient:
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"bq": finder_name})
         final_query_params.update({finder_criteria[0]: finder_criteria[1]})
-        encoded_query_param_string = encode_query_params_for_get_requests(
-            final_query_params
-        )
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.BATCH_FINDER,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             access_token=access_token,
             version_string=version_string,
-            formatter=BatchFinderResponseFormatter,
+            formatter=(
+                StreamingBatchFinderResponseFormatter if stream else BatchFinderResponseFormatter
+            ),
+            stream=stream,
         )
 
     def create(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         entity: RestliEntity,
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
@@ -346,7 +607,7 @@ class RestliClient:
         Makes a Rest.li CREATE request to create a new resource entity.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             entity (RestliEntity): A dictionary representation of the entity to create.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
@@ -369,13 +630,11 @@ class RestliClient:
             >>> created_entity_id = response.entity_id
         """
 
-        encoded_query_param_string = encoder.param_encode(query_params)
-
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.CREATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             request_body=entity,
             version_string=version_string,
@@ -385,7 +644,7 @@ class RestliClient:
     def batch_create(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         entities: List[RestliEntity],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
@@ -396,7 +655,7 @@ class RestliClient:
         Makes a Rest.li BATCH_CREATE request to create multiple entities in a single call.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             entities (List[RestliEntity]): A list of entities to create. Each entity is represented as a dictionary.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
@@ -428,14 +687,13 @@ class RestliClient:
             >>> first_created_element_id = response.elements[0].id
         """
 
-        encoded_query_param_string = encoder.param_encode(query_params)
         request_body = {"elements": entities}
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.BATCH_CREATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             request_body=request_body,
             version_string=version_string,
@@ -445,7 +703,7 @@ class RestliClient:
     def update(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         entity: RestliEntity,
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
@@ -456,7 +714,7 @@ class RestliClient:
         Makes a Rest.li UPDATE request to update an entity (overwriting the entity with the provided value).
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             entity (RestliEntity): The value of the updated entity. This will completely overwrite the entity.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
@@ -486,13 +744,11 @@ class RestliClient:
             >>> status = response.status_code
         """
 
-        encoded_query_param_string = encoder.param_encode(query_params)
-
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.UPDATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             request_body=entity,
             version_string=version_string,
@@ -502,7 +758,7 @@ class RestliClient:
     def batch_update(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         entities: List[RestliEntity],
         ids: List[RestliEntityId],
         access_token: str,
@@ -514,7 +770,7 @@ class RestliClient:
         Makes a Rest.li BATCH_UPDATE request to update multiple entities in a single call.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             ids (List[RestliEntityId]): The ids of the entities to update. These will be properly encoded and added to the query parameters.
             entities (List[RestliEntity]): A list of entities to create. Each entity is represented as a dictionary.
             access_token (str): The access token that should provide the application access to the specified API.
@@ -544,7 +800,6 @@ class RestliClient:
 
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"ids": ids})
-        encoded_query_param_string = encoder.param_encode(final_query_params)
 
         encoded_ids = [encoder.encode(id) for id in ids]
         entities_map = dict(zip(encoded_ids, entities))
@@ -554,7 +809,7 @@ class RestliClient:
             restli_method=RESTLI_METHODS.BATCH_UPDATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             request_body=request_body,
             access_token=access_token,
             version_string=version_string,
@@ -564,7 +819,7 @@ class RestliClient:
     def partial_update(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         patch_set_object: Dict[str, Any],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
@@ -577,7 +832,7 @@ class RestliClient:
         Note: While the Rest.li protocol supports very granular patch objects with setting and deletion of nested properties, most LinkedIn APIs only support partial update on the top-level fields of an entity.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             patch_set_object (Dict[str, Any]): The value of the entity with only the modified fields present. This will be sent directly in the request body as `patch: { $set: patch_set_object }`.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
@@ -600,15 +855,13 @@ class RestliClient:
                 )
             >>> status = response.status_code
         """
-        encoded_query_param_string = encoder.param_encode(query_params)
-
         request_body = {"patch": {"$set": patch_set_object}}
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.PARTIAL_UPDATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             request_body=request_body,
             access_token=access_token,
             version_string=version_string,
@@ -618,7 +871,7 @@ class RestliClient:
     def batch_partial_update(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         ids: List[RestliEntityId],
         patch_set_objects: List[Dict[str, Any]],
         access_token: str,
@@ -630,7 +883,7 @@ class RestliClient:
         Makes a Rest.li BATCH_PARTIAL_UPDATE request to update multiple entities at once, by only providing the fields of the entities that require updating.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             ids (List[RestliEntityId]): The list of entity ids to update. These will be encoded and added to the query parameters.
             patch_set_objects (List[Dict[str, Any]]): The list of entity values, represented as a dictionary, with only the modified fields present.
             access_token (str): The access token that should provide the application access to the specified API.
@@ -662,7 +915,6 @@ class RestliClient:
 
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"ids": ids})
-        encoded_query_param_string = encoder.param_encode(final_query_params)
 
         id_to_patch_map = dict(zip(ids, patch_set_objects))
         entities_map = {
@@ -675,7 +927,7 @@ class RestliClient:
             restli_method=RESTLI_METHODS.BATCH_PARTIAL_UPDATE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             request_body=request_body,
             access_token=access_token,
             version_string=version_string,
@@ -685,7 +937,7 @@ class RestliClient:
     def delete(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
@@ -695,7 +947,7 @@ class RestliClient:
         Makes a Rest.li DELETE request to delete an entity.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
@@ -714,13 +966,11 @@ class RestliClient:
             >>> status_code = response.status_code
         """
 
-        encoded_query_param_string = encoder.param_encode(query_params)
-
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.DELETE,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=query_params,
             access_token=access_token,
             version_string=version_string,
             formatter=DeleteResponseFormatter,
@@ -729,7 +979,7 @@ class RestliClient:
     def batch_delete(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         ids: List[RestliEntityId],
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
@@ -740,7 +990,7 @@ class RestliClient:
         Makes a Rest.li BATCH_DELETE request to delete multiple entities at once.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             ids (List[RestliEntityId]): The list of entity ids to delete. These will be encoded and added to the query parameters.
             access_token (str): The access token that should provide the application access to the specified API.
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
@@ -762,12 +1012,11 @@ class RestliClient:
 
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"ids": ids})
-        encoded_query_param_string = encoder.param_encode(final_query_params)
 
         return self.__send_and_format_response(
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             restli_method=RESTLI_METHODS.BATCH_DELETE,
             access_token=access_token,
             version_string=version_string,
@@ -777,7 +1026,7 @@ class RestliClient:
     def action(
         self,
         *,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         action_name: str,
         access_token: str,
         action_params: Optional[Dict[str, Any]] = None,
@@ -789,7 +1038,7 @@ class RestliClient:
         Makes a Rest.li ACTION request to perform an action on a specified resource. This method is flexible and generally used when the action does not fit within the standard behavior defined by the other Rest.li methods.
 
         Args:
-            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
             action_name (str): The action method name. This will be added to the query parameters.
             access_token (str): The access token that should provide the application access to the specified API.
             action_params (Optional[Dict[str,Any]], optional): An optional map of action parameters and their values. This will be sent in the request body. Defaults to None.
@@ -819,56 +1068,499 @@ class RestliClient:
         final_query_params = copy.deepcopy(query_params) if query_params else {}
         final_query_params.update({"action": action_name})
 
-        encoded_query_param_string = encoder.param_encode(final_query_params)
-
         request_body = action_params if action_params else {}
 
         return self.__send_and_format_response(
             restli_method=RESTLI_METHODS.ACTION,
             resource_path=resource_path,
             path_keys=path_keys,
-            encoded_query_param_string=encoded_query_param_string,
+            query_params=final_query_params,
             request_body=request_body,
             access_token=access_token,
             version_string=version_string,
             formatter=ActionResponseFormatter,
         )
 
+    def iter_pages(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        finder_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> Iterator[CollectionResponse]:
+        """
+        Lazily iterates over all pages of a Rest.li GET_ALL or FINDER collection. Pages are requested using the
+        `start` and `count` query parameters until the collection is exhausted. While a page is being consumed, the
+        next page is fetched in the background, and no further requests are made once the caller stops iterating.
+
+        Args:
+            resource_path (Union[str, RestliRoute]): The resource path after the base URL, beginning with a forward slash, or a route compiled with `route()`. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            access_token (str): The access token that should provide the application access to the specified API.
+            finder_name (Optional[str], optional): The Rest.li finder name. If specified, FINDER requests are made, otherwise GET_ALL requests are made. Defaults to None.
+            page_size (Optional[int], optional): The number of elements to request per page. If not specified, the `count` query parameter is used, or otherwise the server default. Defaults to None.
+            prefetch (bool, optional): Flag whether to fetch the next page in the background while the current page is consumed. Defaults to True.
+            path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
+            query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. A `start` query parameter sets the index of the first page. Defaults to {}.
+            version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+
+        Raises:
+            PageFetchError: Error raised if a page is returned with a non-2xx status code, instead of ending the iteration
+
+        Yields:
+            CollectionResponse: The response of each page, in order
+
+        Example:
+            >>> for page in restli_client.iter_pages(
+                    resource_path="/adAccounts",
+                    finder_name="search",
+                    page_size=100,
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202302"
+                ):
+                    process(page.elements)
+        """
+        start = query_params.get(paging.START_PARAM, 0) if query_params else 0
+        count = page_size
+        if count is None and query_params:
+            count = query_params.get(paging.COUNT_PARAM, None)
+
+        def fetch_page(page_start: int) -> CollectionResponse:
+            page_query_params = paging.build_page_query_params(
+                query_params, page_start, count
+            )
+            if finder_name is not None:
+                return self.finder(
+                    resource_path=resource_path,
+                    finder_name=finder_name,
+                    access_token=access_token,
+                    path_keys=path_keys,
+                    query_params=page_query_params,
+                    version_string=version_string,
+                )
+            return self.get_all(
+                resource_path=resource_path,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=page_query_params,
+                version_string=version_string,
+            )
+
+        if not prefetch:
+            while start is not None:
+                page = fetch_page(start)
+                start = paging.get_next_page_start(page, start, count)
+                yield page
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = executor.submit(fetch_page, start)
+            while next_page is not None:
+                page = next_page.result()
+                start = paging.get_next_page_start(page, start, count)
+                next_page = (
+                    executor.submit(fetch_page, start) if start is not None else None
+                )
+                yield page
+        finally:
+            # Runs when the collection is exhausted or the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_elements(
+        self,
+        *,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        finder_name: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> Iterator[RestliEntity]:
+        """
+        Lazily iterates over all elements of a Rest.li GET_ALL or FINDER collection, across pages. See `iter_pages`
+        for details on the arguments and paging behavior.
+
+        Raises:
+            PageFetchError: Error raised if a page is returned with a non-2xx status code, instead of ending the iteration
+
+        Yields:
+            RestliEntity: Each element of the collection, in order
+
+        Example:
+            >>> for field_of_study in restli_client.iter_elements(
+                    resource_path="/fieldsOfStudy",
+                    page_size=50,
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202212"
+                ):
+                    print(field_of_study["name"])
+        """
+        for page in self.iter_pages(
+            resource_path=resource_path,
+            access_token=access_token,
+            finder_name=finder_name,
+            page_size=page_size,
+            prefetch=prefetch,
+            path_keys=path_keys,
+            query_params=query_params,
+            version_string=version_string,
+        ):
+            yield from page.elements or []
+
+    def execute_many(
+        self,
+        calls: Iterable[Callable[[], R]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Union[R, Exception]]:
+        """
+        Makes independent calls of any kind (e.g. GET, FINDER and ACTION calls) concurrently on a thread
+        pool, so that they take about as long as the slowest call instead of the sum of all calls.
+
+        The worker threads share the client's transport rather than each having a session, since
+        transports are safe to use from several threads: the session of the default transport is only
+        read when sending, and its connection pool gives each thread its own connection. The number of
+        threads is capped at the `max_concurrency` of the transport (the `pool_maxsize` of the default
+        transport), so that every thread gets a pooled connection instead of opening one that is
+        discarded after the call.
+
+        Like `asyncio.gather(..., return_exceptions=True)`, an exception raised by a call is returned in
+        place of its result, so that one failed call does not discard the results of the others.
+
+        Args:
+            calls (Iterable[Callable[[], R]]): The calls, as functions without arguments that call a method of the client, e.g. with functools.partial
+            max_concurrency (int, optional): The maximum number of calls made at the same time, capped at the `max_concurrency` of the transport. Defaults to 8.
+
+        Raises:
+            InvalidArgumentError: Error raised if `max_concurrency` is less than 1
+
+        Returns:
+            List[Union[R, Exception]]: The result of each call, or the exception it raised, in the order of the calls
+
+        Example:
+            >>> results = restli_client.execute_many(
+                    [
+                        partial(
+                            restli_client.get,
+                            resource_path="/adAccounts/{id}",
+                            path_keys={ "id": 123 },
+                            access_token=MY_ACCESS_TOKEN
+                        ),
+                        partial(
+                            restli_client.finder,
+                            resource_path="/adAccounts",
+                            finder_name="search",
+                            access_token=MY_ACCESS_TOKEN
+                        ),
+                    ],
+                    max_concurrency=16
+                )
+            >>> for result in results:
+                    if isinstance(result, Exception):
+                        print(f"Call failed: {result}")
+        """
+        if max_concurrency < 1:
+            raise InvalidArgumentError("max_concurrency must be at least 1")
+
+        calls = list(calls)
+        if not calls:
+            return []
+
+        max_workers = min(max_concurrency, len(calls))
+        if self.transport.max_concurrency is not None:
+            max_workers = min(max_workers, self.transport.max_concurrency)
+        if max_workers == 1:
+            return [_call_capturing_exception(call) for call in calls]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_call_capturing_exception, calls))
+
+    def __batched_get(
+        self,
+        *,
+        route: RestliRoute,
+        access_token: str,
+        path_keys: Dict[str, Any],
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> GetResponse:
+        entity_id = path_keys[route.entity_key]
+        collection_path_keys = {
+            name: value
+            for (name, value) in path_keys.items()
+            if name != route.entity_key
+        } or None
+
+        # Calls can share a BATCH_GET if everything but the entity id is the same
+        batch_key = (
+            apiutils.build_rest_url(
+                resource_path=route.collection_path,
+                path_keys=collection_path_keys,
+                version_string=version_string,
+            ),
+            encode_query_params_for_get_requests(query_params),
+            access_token,
+            version_string,
+        )
+        batch_response = self.get_batcher.load(
+            batch_key,
+            entity_id,
+            lambda ids: self.batch_get(
+                resource_path=route.collection_path,
+                ids=ids,
+                access_token=access_token,
+                path_keys=collection_path_keys,
+                query_params=query_params,
+                version_string=version_string,
+                chunked=True,
+            ),
+        )
+        return GetResponseFormatter.format_batch_result(batch_response, entity_id)
+
     def __send_and_format_response(
         self,
         *,
         restli_method: RESTLI_METHODS,
-        resource_path: str,
+        resource_path: Union[str, RestliRoute],
         access_token: str,
         formatter: Type[BaseResponseFormatter[T]],
         path_keys: Optional[Dict[str, Any]] = None,
-        encoded_query_param_string: Optional[str] = None,
+        query_params: Optional[Dict[str, Any]] = None,
         request_body: Optional[Any] = None,
-        version_string: Optional[str] = None
+        version_string: Optional[str] = None,
+        stream: bool = False
+    ) -> T:
+        request = dict(
+            restli_method=restli_method,
+            resource_path=resource_path,
+            access_token=access_token,
+            formatter=formatter,
+            path_keys=path_keys,
+            query_params=query_params,
+            request_body=request_body,
+            version_string=version_string,
+            stream=stream,
+        )
+        if not self.timing_hooks:
+            return self.__prepare_send_and_format(timing=None, **request)
+
+        timing = RequestTiming(
+            restli_method=restli_method,
+            resource_path=apiutils.get_resource_path_template(resource_path),
+        )
+        try:
+            return self.__prepare_send_and_format(timing=timing, **request)
+        except BaseException as error:
+            timing.error = type(error).__name__
+            raise
+        finally:
+            timing.finish()
+            for hook in self.timing_hooks:
+                hook(timing)
+
+    def __prepare_send_and_format(
+        self,
+        *,
+        timing: Optional[RequestTiming],
+        restli_method: RESTLI_METHODS,
+        resource_path: Union[str, RestliRoute],
+        access_token: str,
+        formatter: Type[BaseResponseFormatter[T]],
+        path_keys: Optional[Dict[str, Any]],
+        query_params: Optional[Dict[str, Any]],
+        request_body: Optional[Any],
+        version_string: Optional[str],
+        stream: bool
     ) -> T:
+        # Read methods keep the "fields" projection parameter unencoded
+        encoded_query_param_string = (
+            encode_query_params_for_get_requests(query_params)
+            if restli_method in READ_RESTLI_METHODS
+            else encoder.param_encode(query_params)
+        )
+        if timing is not None:
+            timing.lap("encode")
+
         url = apiutils.build_rest_url(
             resource_path=resource_path,
             path_keys=path_keys,
             version_string=version_string,
         )
+        if timing is not None:
+            timing.lap("build_url")
 
-        if request_body is not None:
-            prepared_request = maybe_apply_query_tunneling_requests_with_body(
-                encoded_query_param_string=encoded_query_param_string,
-                url=url,
-                original_restli_method=restli_method,
-                original_request_body=request_body,
-                access_token=access_token,
-                version_string=version_string,
+        prepared_request = maybe_apply_query_tunneling(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=restli_method,
+            original_request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            # The request body is serialized while preparing, but counted as encoding
+            codec=self.codec if timing is None else TimedCodec(self.codec, timing),
+            compression=self.compression,
+        )
+
+        return self.__send_call(
+            RestliCall(
+                restli_method=restli_method,
+                resource_path=apiutils.get_resource_path_template(resource_path),
+                prepared_request=prepared_request,
+                formatter=formatter,
+                stream=stream,
+                timing=timing,
             )
-        else:
-            prepared_request = maybe_apply_query_tunneling_get_requests(
-                encoded_query_param_string=encoded_query_param_string,
-                url=url,
-                original_restli_method=restli_method,
-                access_token=access_token,
-                version_string=version_string,
+        )
+
+    def __send_and_format_call(self, call: RestliCall) -> BaseRestliResponse:
+        # The last handler of the middleware chain
+        restli_method = call.restli_method
+        prepared_request = call.prepared_request
+        formatter = call.formatter
+        timing = call.timing
+
+        if call.stream:
+            if timing is not None:
+                timing.lap("prepare")
+            # The body is read by the formatted response, so it cannot be shared or cached
+            response = self.__send_with_retries(
+                prepared_request=prepared_request,
+                restli_method=restli_method,
+                resource_path=call.resource_path,
+                stream=True,
+                timing=timing,
+            )
+            formatted_response = formatter.format_response(response, codec=self.codec)
+            if timing is not None:
+                timing.lap("format")
+            return formatted_response
+
+        cache = self.cache
+        cache_key = None
+        cached_entry = None
+        if cache is not None and restli_method in CACHEABLE_RESTLI_METHODS:
+            cache_key = get_request_key(prepared_request)
+            cached_entry = cache.lookup(cache_key, formatter, codec=self.codec)
+            if cached_entry is not None:
+                if cached_entry.is_fresh():
+                    if timing is not None:
+                        timing.lap("prepare")
+                        timing.from_cache = True
+                    return cached_entry.response
+                if cached_entry.etag is not None:
+                    prepared_request.headers[IF_NONE_MATCH_HEADER] = cached_entry.etag
+        if timing is not None:
+            timing.lap("prepare")
+
+        def send_and_format() -> BaseRestliResponse:
+            response = self.__send_with_retries(
+                prepared_request=prepared_request,
+                restli_method=restli_method,
+                resource_path=call.resource_path,
+                timing=timing,
             )
+            if (
+                cached_entry is not None
+                and response.status_code == NOT_MODIFIED_STATUS_CODE
+            ):
+                cache.refresh(cached_entry)
+                if timing is not None:
+                    timing.from_cache = True
+                return cached_entry.response
+
+            formatted_response = formatter.format_response(
+                response, codec=self.codec
+            )
+            if cache_key is not None and response.status_code == requests.codes.ok:
+                cache.store(cache_key, response, formatted_response)
+            if self.release_raw_responses:
+                formatted_response.response = None
+            if timing is not None:
+                timing.lap("format")
+            return formatted_response
+
+        if self.coalesce_reads and restli_method in READ_RESTLI_METHODS:
+            return self.__single_flight.do(
+                cache_key or get_request_key(prepared_request),
+                send_and_format,
+            )
+        return send_and_format()
 
-        response = self.session.send(prepared_request)
-        return formatter.format_response(response)
+    def __send_with_retries(
+        self,
+        *,
+        prepared_request: requests.PreparedRequest,
+        restli_method: RESTLI_METHODS,
+        resource_path: Union[str, RestliRoute],
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
+    ) -> requests.Response:
+        retry_policy = self.retry_policy
+        resource_path_template = apiutils.get_resource_path_template(resource_path)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(resource_path_template)
+
+            if retry_policy is None:
+                return self.__send(prepared_request, stream, timing)
+
+            try:
+                response = self.__send(prepared_request, stream, timing)
+            except (requests.ConnectionError, requests.Timeout):
+                if not retry_policy.should_retry_error(restli_method, attempt):
+                    raise
+                backoff = retry_policy.get_backoff(attempt)
+            else:
+                if not retry_policy.should_retry_response(
+                    restli_method, response, attempt
+                ):
+                    return response
+                backoff = retry_policy.get_backoff(attempt, response)
+                # Release the connection of the discarded response
+                response.close()
+
+            time.sleep(backoff)
+            attempt += 1
+
+    def __send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        stream: bool,
+        timing: Optional[RequestTiming],
+    ) -> requests.Response:
+        if timing is None:
+            return self.transport.send(prepared_request, stream=stream)
+
+        # The time since the previous phase was spent on the rate limiter or backing off
+        timing.lap("wait")
+        timing.attempts += 1
+        connection_timing.start()
+        try:
+            # The body is read separately, so that its download is timed on its own
+            response = self.transport.send(prepared_request, stream=True)
+        finally:
+            connect = connection_timing.stop()
+            if connect is not None:
+                timing.add("connect", connect)
+            timing.lap("time_to_first_byte")
+
+        timing.status_code = response.status_code
+        if not stream:
+            response.content
+            timing.lap("download")
+        return response
+
+
+def _call_capturing_exception(call: Callable[[], R]) -> Union[R, Exception]:
+    try:
+        return call()
+    except Exception as error:
+        return error
@@ -1,10 +1,59 @@
-from typing import Dict, Optional, Any, Union, List
+from typing import Dict, Iterator, Mapping, Optional, Any, Union, List
 from requests import Response
-from linkedin_api.clients.common.response import BaseResponse
-from linkedin_api.clients.restli.types import RestliEntity, EncodedEntityId
+from linkedin_api.clients.common.response import BaseResponse, lazy_attribute
+from linkedin_api.clients.restli.types import (
+    RestliEntity,
+    EncodedEntityId,
+    DecodedEntityId,
+)
+from linkedin_api.clients.restli.utils.restli import (
+    decode_entity_id_key,
+    freeze_entity_id,
+)
+
+
+class DecodedIdMap(Mapping):
+    """
+    A read-only view of a batch response map (e.g. BatchGetResponse.results) keyed by the decoded entity
+    ids instead of the encoded ones. The keys are decoded once, in a single pass, through a cache that
+    is shared across responses.
+
+    Simple ids are strings, and complex keys are FrozenDict instances. Lookups accept the decoded ids in
+    their plain form, so a result can be retrieved with
+    `decoded_results[{"account": account_urn, "campaign": campaign_urn}]`.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, encoded_map: Mapping[EncodedEntityId, Any]):
+        """
+        Args:
+            encoded_map (Mapping[EncodedEntityId, Any]): The map keyed by the reduced-encoded entity ids
+        """
+        self._values = {
+            decode_entity_id_key(encoded_id): value
+            for (encoded_id, value) in encoded_map.items()
+        }
+
+    def __getitem__(self, entity_id: Any) -> Any:
+        return self._values[freeze_entity_id(entity_id)]
+
+    def __contains__(self, entity_id: Any) -> bool:
+        return freeze_entity_id(entity_id) in self._values
+
+    def __iter__(self) -> Iterator[DecodedEntityId]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"DecodedIdMap({self._values!r})"
 
 
 class Paging:
+    __slots__ = ("start", "count", "total")
+
     def __init__(
         self,
         start: Optional[int] = None,
@@ -28,10 +77,14 @@ class Paging:
 
 
 class BaseRestliResponse(BaseResponse):
-    pass
+    __slots__ = ()
 
 
 class GetResponse(BaseRestliResponse):
+    __slots__ = ("_entity",)
+
+    entity = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -49,6 +102,21 @@ class GetResponse(BaseRestliResponse):
 
 
 class BatchGetResponse(BaseRestliResponse):
+    __slots__ = (
+        "_results",
+        "_statuses",
+        "_errors",
+        "_error",
+        "_decoded_results",
+        "_decoded_statuses",
+        "_decoded_errors",
+    )
+
+    results = lazy_attribute()
+    statuses = lazy_attribute()
+    errors = lazy_attribute()
+    error = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -58,6 +126,7 @@ class BatchGetResponse(BaseRestliResponse):
         results: Dict[EncodedEntityId, RestliEntity],
         statuses: Dict[EncodedEntityId, int],
         errors: Dict[EncodedEntityId, Any],
+        error: Optional[Any] = None,
     ):
         super().__init__(
             status_code=status_code, headers=headers, url=url, response=response
@@ -80,8 +149,51 @@ class BatchGetResponse(BaseRestliResponse):
         encoded entity id, and the value being the error response.
         """
 
+        self.error = error
+        """
+        The error response of a failed call (e.g. a dictionary with the "status" and "message"), or None
+        if the call succeeded. It remains available when the raw response is released.
+        """
+
+        self._decoded_results = None
+        self._decoded_statuses = None
+        self._decoded_errors = None
+
+    @property
+    def decoded_results(self) -> DecodedIdMap:
+        """
+        The results map keyed by the decoded entity ids, built on first access.
+        """
+        if self._decoded_results is None:
+            self._decoded_results = DecodedIdMap(self.results or {})
+        return self._decoded_results
+
+    @property
+    def decoded_statuses(self) -> DecodedIdMap:
+        """
+        The statuses map keyed by the decoded entity ids, built on first access.
+        """
+        if self._decoded_statuses is None:
+            self._decoded_statuses = DecodedIdMap(self.statuses or {})
+        return self._decoded_statuses
+
+    @property
+    def decoded_errors(self) -> DecodedIdMap:
+        """
+        The errors map keyed by the decoded entity ids, built on first access.
+        """
+        if self._decoded_errors is None:
+            self._decoded_errors = DecodedIdMap(self.errors or {})
+        return self._decoded_errors
+
 
 class CollectionResponse(BaseRestliResponse):
+    __slots__ = ("_elements", "_paging", "_metadata")
+
+    elements = lazy_attribute()
+    paging = lazy_attribute()
+    metadata = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -111,7 +223,81 @@ class CollectionResponse(BaseRestliResponse):
         """
 
 
+class StreamingCollectionResponse(BaseRestliResponse):
+    """
+    A collection response whose elements are decoded one at a time while the response body is being
+    downloaded. The response should be closed (or used as a context manager) if its elements are not
+    fully consumed, to release the connection.
+    """
+
+    __slots__ = ("elements", "fields")
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        headers: Dict[str, str],
+        response: Response,
+        elements: Iterator[Any],
+        fields: Dict[str, Any],
+    ):
+        super().__init__(
+            status_code=status_code, headers=headers, url=url, response=response
+        )
+        self.elements = elements
+        """
+        An iterator over the entities returned in the response (or the BatchFinderResult of each search
+        criteria, for BATCH_FINDER requests). It can only be consumed once.
+        """
+
+        self.fields = fields
+        """
+        The other top-level values of the response body (e.g. "paging"), which are parsed while the
+        elements are consumed.
+        """
+
+    @property
+    def paging(self) -> Paging:
+        """
+        Paging metadata object. Only available once the elements are consumed, unless the paging
+        metadata precedes the elements in the response body.
+        """
+        paging = self.fields.get("paging", None)
+        return (
+            Paging(
+                paging.get("start", None),
+                paging.get("count", None),
+                paging.get("total", None),
+            )
+            if paging
+            else Paging()
+        )
+
+    @property
+    def metadata(self) -> Optional[Any]:
+        """
+        Optional response metadata object, with the same availability as the paging metadata.
+        """
+        return self.fields.get("metadata", None)
+
+    def close(self) -> None:
+        """
+        Stops reading the response body and releases the connection.
+        """
+        self.elements.close()
+        if self.response is not None:
+            self.response.close()
+
+    def __enter__(self) -> "StreamingCollectionResponse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
 class BatchFinderResult:
+    __slots__ = ("elements", "paging", "metadata", "error", "isError")
+
     def __init__(
         self,
         elements: List[RestliEntity],
@@ -147,6 +333,10 @@ class BatchFinderResult:
 
 
 class BatchFinderResponse(BaseRestliResponse):
+    __slots__ = ("_results",)
+
+    results = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -166,6 +356,11 @@ class BatchFinderResponse(BaseRestliResponse):
 
 
 class CreateResponse(BaseRestliResponse):
+    __slots__ = ("entity_id", "_decoded_entity_id", "_entity")
+
+    decoded_entity_id = lazy_attribute()
+    entity = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -197,6 +392,8 @@ class CreateResponse(BaseRestliResponse):
 
 
 class BatchCreateResult:
+    __slots__ = ("status", "id", "error")
+
     def __init__(self, status: int, id: str, error: Any):
         self.status = status
         """
@@ -215,6 +412,10 @@ class BatchCreateResult:
 
 
 class BatchCreateResponse(BaseRestliResponse):
+    __slots__ = ("_elements",)
+
+    elements = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -234,6 +435,10 @@ class BatchCreateResponse(BaseRestliResponse):
 
 
 class UpdateResponse(BaseRestliResponse):
+    __slots__ = ("_entity",)
+
+    entity = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -253,6 +458,8 @@ class UpdateResponse(BaseRestliResponse):
 
 
 class BatchUpdateResult:
+    __slots__ = ("status",)
+
     # TODO add support for return entity
     def __init__(self, status: int):
         self.status = status
@@ -262,6 +469,10 @@ class BatchUpdateResult:
 
 
 class BatchUpdateResponse(BaseRestliResponse):
+    __slots__ = ("_results", "_decoded_results")
+
+    results = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -279,8 +490,21 @@ class BatchUpdateResponse(BaseRestliResponse):
         individual update call results, which includes the status code.
         """
 
+        self._decoded_results = None
+
+    @property
+    def decoded_results(self) -> DecodedIdMap:
+        """
+        The results map keyed by the decoded entity ids, built on first access.
+        """
+        if self._decoded_results is None:
+            self._decoded_results = DecodedIdMap(self.results or {})
+        return self._decoded_results
+
 
 class BatchDeleteResult:
+    __slots__ = ("status",)
+
     def __init__(self, status: int):
         self.status = status
         """
@@ -289,6 +513,10 @@ class BatchDeleteResult:
 
 
 class BatchDeleteResponse(BaseRestliResponse):
+    __slots__ = ("_results", "_decoded_results")
+
+    results = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
@@ -306,8 +534,23 @@ class BatchDeleteResponse(BaseRestliResponse):
         individual delete call results, which includes the status code.
         """
 
+        self._decoded_results = None
+
+    @property
+    def decoded_results(self) -> DecodedIdMap:
+        """
+        The results map keyed by the decoded entity ids, built on first access.
+        """
+        if self._decoded_results is None:
+            self._decoded_results = DecodedIdMap(self.results or {})
+        return self._decoded_results
+
 
 class ActionResponse(BaseRestliResponse):
+    __slots__ = ("_value",)
+
+    value = lazy_attribute()
+
     def __init__(
         self,
         status_code: int,
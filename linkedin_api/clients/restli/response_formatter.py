@@ -1,5 +1,7 @@
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
+from linkedin_api.clients.common.codec import JsonCodec
+from linkedin_api.clients.common.response import LazyJsonBody, LazyValue
 from linkedin_api.clients.common.response_formatter import (
     BaseResponseFormatter,
     wrap_format_exception,
@@ -21,7 +23,12 @@ from linkedin_api.clients.restli.response import (
     BatchDeleteResponse,
     BatchDeleteResult,
     ActionResponse,
+    StreamingCollectionResponse,
 )
+from linkedin_api.clients.restli.utils.json_stream import iter_json_array_items
+from linkedin_api.common.errors import ResponseFormattingError
+from linkedin_api.clients.restli.utils.decoder import reduced_decode
+from linkedin_api.clients.restli.utils.encoder import reduced_encode
 from linkedin_api.clients.restli.utils.restli import get_created_entity_id
 from requests import Response
 
@@ -29,76 +36,259 @@ from requests import Response
 class GetResponseFormatter(BaseResponseFormatter[GetResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response) -> GetResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> GetResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return GetResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            entity=json_data,
+            entity=LazyValue(body.get),
+        )
+
+    @classmethod
+    def format_batch_result(
+        cls,
+        batch_response: BatchGetResponse,
+        entity_id: Any,
+    ) -> GetResponse:
+        """
+        Builds the response of a GET call for one entity from a BATCH_GET response that includes it. The
+        url, headers and raw response are those of the BATCH_GET call.
+
+        The entity is the result for the id if it was found, or its error otherwise, with the status of
+        the individual id (e.g. the status and error of the failed chunk of a chunked BATCH_GET). If the
+        whole BATCH_GET call failed, the status and entity are those of the failed call. An id is only
+        reported as not found (404) if the call succeeded without returning it.
+
+        Args:
+            batch_response (BatchGetResponse): The BATCH_GET response
+            entity_id (Any): The (decoded) id of the entity
+
+        Returns:
+            GetResponse: The response for the entity
+        """
+        status_code = None
+        if entity_id in batch_response.decoded_results:
+            entity = batch_response.decoded_results[entity_id]
+            default_status_code = 200
+        elif entity_id in batch_response.decoded_errors:
+            entity = batch_response.decoded_errors[entity_id]
+            default_status_code = (
+                entity.get("status", 500) if isinstance(entity, dict) else 500
+            )
+        elif batch_response.status_code >= 400:
+            entity = batch_response.error
+            status_code = batch_response.status_code
+            default_status_code = status_code
+        else:
+            entity = None
+            default_status_code = 404
+
+        if status_code is None:
+            status_code = batch_response.decoded_statuses.get(entity_id, None)
+
+        return GetResponse(
+            status_code=status_code or default_status_code,
+            url=batch_response.url,
+            headers=batch_response.headers,
+            response=batch_response.response,
+            entity=entity,
         )
 
 
 class BatchGetResponseFormatter(BaseResponseFormatter[BatchGetResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchGetResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BatchGetResponse:
+        if response.status_code >= 400:
+            # The body of a failed call is an error, which may not be JSON (e.g. from a proxy)
+            error_body = LazyJsonBody(response, optional=True, codec=codec)
+            return BatchGetResponse(
+                status_code=response.status_code,
+                url=response.url,
+                headers=response.headers,
+                response=response,
+                results=None,
+                statuses=None,
+                errors=None,
+                error=LazyValue(error_body.get),
+            )
+
+        body = LazyJsonBody(response, codec=codec)
         return BatchGetResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=json_data.get("results", None),
-            statuses=json_data.get("statuses", None),
-            errors=json_data.get("errors", None),
+            results=LazyValue(lambda: body.get().get("results", None)),
+            statuses=LazyValue(lambda: body.get().get("statuses", None)),
+            errors=LazyValue(lambda: body.get().get("errors", None)),
+        )
+
+    @classmethod
+    def merge_responses(
+        cls,
+        responses: List[BatchGetResponse],
+        id_chunks: Optional[List[List[Any]]] = None,
+    ) -> BatchGetResponse:
+        """
+        Merges the responses of several BATCH_GET requests on the same resource into a single response. The
+        results, statuses and errors maps of the successful responses are combined.
+
+        The ids requested by a failed response are added to the statuses and errors maps, with the status
+        code and error of the failed response, so that they are not silently missing from the results. The
+        merged response then has the status code, error and remaining attributes of the first failed
+        response, and otherwise those of the first response.
+
+        Args:
+            responses (List[BatchGetResponse]): The responses to merge
+            id_chunks (Optional[List[List[Any]]], optional): The ids requested by each response, in the same order. Defaults to None, in which case the ids of failed responses are not added to the maps.
+
+        Returns:
+            BatchGetResponse: The merged response
+        """
+        failed_response = None
+        results = {}
+        statuses = {}
+        errors = {}
+        for index, response in enumerate(responses):
+            if response.status_code < 400:
+                results.update(response.results or {})
+                statuses.update(response.statuses or {})
+                errors.update(response.errors or {})
+                continue
+
+            if failed_response is None:
+                failed_response = response
+            if id_chunks is not None:
+                error = response.error or {"status": response.status_code}
+                for entity_id in id_chunks[index]:
+                    encoded_id = reduced_encode(entity_id)
+                    statuses[encoded_id] = response.status_code
+                    errors[encoded_id] = error
+
+        base_response = failed_response or responses[0]
+        return BatchGetResponse(
+            status_code=base_response.status_code,
+            url=base_response.url,
+            headers=base_response.headers,
+            response=base_response.response,
+            results=results,
+            statuses=statuses,
+            errors=errors,
+            error=failed_response.error if failed_response is not None else None,
         )
 
 
 class CollectionResponseFormatter(BaseResponseFormatter[CollectionResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> CollectionResponse:
-        json_data = response.json()
-        paging = json_data.get("paging", None)
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> CollectionResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return CollectionResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            elements=json_data.get("elements", None),
-            paging=Paging(
+            elements=LazyValue(lambda: body.get().get("elements", None)),
+            paging=LazyValue(
+                lambda: cls.format_paging(body.get().get("paging", None))
+            ),
+            metadata=LazyValue(lambda: getattr(body.get(), "metadata", None)),
+        )
+
+    @classmethod
+    def format_paging(cls, paging: Optional[Dict]) -> Paging:
+        return (
+            Paging(
                 paging.get("start", None),
                 paging.get("count", None),
                 paging.get("total", None),
             )
             if paging
-            else Paging(),
-            metadata=getattr(json_data, "metadata", None),
+            else Paging()
         )
 
 
-class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_streamed_elements(
+    response: Response,
+    codec: Optional[JsonCodec] = None,
+    fields: Optional[Dict[str, Any]] = None,
+    format_element: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[Any]:
+    """
+    Yields the decoded "elements" of a streamed collection response while its body is downloaded,
+    and closes the response once they are consumed.
+    """
+    try:
+        for element in iter_json_array_items(
+            response.iter_content(STREAM_CHUNK_SIZE), "elements", codec, fields
+        ):
+            yield format_element(element) if format_element else element
+    except ValueError as e:
+        raise ResponseFormattingError from e
+    finally:
+        response.close()
+
+
+class StreamingCollectionResponseFormatter(
+    BaseResponseFormatter[StreamingCollectionResponse]
+):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchFinderResponse:
-        json_data = response.json()
-        elements = json_data.get("elements", None)
-        finder_results = (
-            [cls.format_finder_result(result) for result in elements]
-            if elements
-            else None
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> StreamingCollectionResponse:
+        fields = {}
+
+        return StreamingCollectionResponse(
+            status_code=response.status_code,
+            url=response.url,
+            headers=response.headers,
+            response=response,
+            elements=iter_streamed_elements(response, codec, fields),
+            fields=fields,
         )
 
+
+class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
+    @classmethod
+    @wrap_format_exception
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BatchFinderResponse:
+        body = LazyJsonBody(response, codec=codec)
+
         return BatchFinderResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=finder_results,
+            results=LazyValue(
+                lambda: cls.format_finder_results(body.get().get("elements", None))
+            ),
+        )
+
+    @classmethod
+    def format_finder_results(
+        cls, elements: Optional[List[Dict]]
+    ) -> Optional[List[BatchFinderResult]]:
+        return (
+            [cls.format_finder_result(result) for result in elements]
+            if elements
+            else None
         )
 
     @classmethod
@@ -113,43 +303,74 @@ class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
         )
 
 
+class StreamingBatchFinderResponseFormatter(
+    BaseResponseFormatter[StreamingCollectionResponse]
+):
+    @classmethod
+    @wrap_format_exception
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> StreamingCollectionResponse:
+        fields = {}
+
+        return StreamingCollectionResponse(
+            status_code=response.status_code,
+            url=response.url,
+            headers=response.headers,
+            response=response,
+            elements=iter_streamed_elements(
+                response,
+                codec,
+                fields,
+                format_element=BatchFinderResponseFormatter.format_finder_result,
+            ),
+            fields=fields,
+        )
+
+
 class CreateResponseFormatter(BaseResponseFormatter[CreateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> CreateResponse:
-        try:
-            json_data = response.json()
-        except ValueError:
-            # Handle case of no entity returned in the response
-            json_data = None
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> CreateResponse:
+        # Handle case of no entity returned in the response
+        body = LazyJsonBody(response, optional=True, codec=codec)
+        entity_id = get_created_entity_id(response, False)
 
         return CreateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            entity_id=get_created_entity_id(response, False),
-            decoded_entity_id=get_created_entity_id(response, True),
-            entity=json_data if json_data else None,
+            entity_id=entity_id,
+            # Decode from the encoded id, so that the lazy value does not keep the raw response alive
+            decoded_entity_id=LazyValue(
+                lambda: reduced_decode(entity_id) if entity_id is not None else None
+            ),
+            entity=LazyValue(lambda: body.get() or None),
         )
 
 
 class BatchCreateResponseFormatter(BaseResponseFormatter[BatchCreateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchCreateResponse:
-        json_data = response.json()
-        elements = json_data.get("elements", None)
-        batch_create_results = [
-            cls.format_batch_create_result(result) for result in elements
-        ]
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BatchCreateResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return BatchCreateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            elements=batch_create_results,
+            elements=LazyValue(
+                lambda: [
+                    cls.format_batch_create_result(result)
+                    for result in body.get().get("elements", None)
+                ]
+            ),
         )
 
     @classmethod
@@ -165,43 +386,49 @@ class BatchCreateResponseFormatter(BaseResponseFormatter[BatchCreateResponse]):
 class UpdateResponseFormatter(BaseResponseFormatter[UpdateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> UpdateResponse:
-        try:
-            json_data = response.json()
-        except ValueError:
-            json_data = None
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> UpdateResponse:
+        body = LazyJsonBody(response, optional=True, codec=codec)
 
         return UpdateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            entity=json_data if json_data is not None else None,
+            entity=LazyValue(body.get),
         )
 
 
 class BatchUpdateResponseFormatter(BaseResponseFormatter[BatchUpdateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchUpdateResponse:
-        json_data = response.json()
-        results = json_data.get("results", None)
-        if results is not None:
-            batch_update_results = {
-                encoded_id: cls.format_batch_update_result(result)
-                for (encoded_id, result) in results.items()
-            }
-        else:
-            batch_update_results = None
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BatchUpdateResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return BatchUpdateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=batch_update_results,
+            results=LazyValue(
+                lambda: cls.format_batch_update_results(body.get().get("results", None))
+            ),
         )
 
+    @classmethod
+    def format_batch_update_results(
+        cls, results: Optional[Dict]
+    ) -> Optional[Dict[str, BatchUpdateResult]]:
+        if results is None:
+            return None
+        return {
+            encoded_id: cls.format_batch_update_result(result)
+            for (encoded_id, result) in results.items()
+        }
+
     @classmethod
     @wrap_format_exception
     def format_batch_update_result(cls, result) -> BatchUpdateResult:
@@ -211,7 +438,9 @@ class BatchUpdateResponseFormatter(BaseResponseFormatter[BatchUpdateResponse]):
 class DeleteResponseFormatter(BaseResponseFormatter[BaseRestliResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BaseRestliResponse:
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BaseRestliResponse:
         return BaseRestliResponse(
             status_code=response.status_code,
             url=response.url,
@@ -223,23 +452,32 @@ class DeleteResponseFormatter(BaseResponseFormatter[BaseRestliResponse]):
 class BatchDeleteResponseFormatter(BaseResponseFormatter[BatchDeleteResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchDeleteResponse:
-        json_data = response.json()
-        results = json_data.get("results", None)
-        if results is not None:
-            batch_delete_results = {
-                encoded_id: cls.format_batch_delete_result(result)
-                for (encoded_id, result) in results.items()
-            }
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> BatchDeleteResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return BatchDeleteResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=batch_delete_results,
+            results=LazyValue(
+                lambda: cls.format_batch_delete_results(body.get().get("results", None))
+            ),
         )
 
+    @classmethod
+    def format_batch_delete_results(
+        cls, results: Optional[Dict]
+    ) -> Optional[Dict[str, BatchDeleteResult]]:
+        if results is None:
+            return None
+        return {
+            encoded_id: cls.format_batch_delete_result(result)
+            for (encoded_id, result) in results.items()
+        }
+
     @classmethod
     @wrap_format_exception
     def format_batch_delete_result(cls, result) -> BatchDeleteResult:
@@ -249,13 +487,15 @@ class BatchDeleteResponseFormatter(BaseResponseFormatter[BatchDeleteResponse]):
 class ActionResponseFormatter(BaseResponseFormatter[ActionResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> ActionResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, codec: Optional[JsonCodec] = None
+    ) -> ActionResponse:
+        body = LazyJsonBody(response, codec=codec)
 
         return ActionResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            value=json_data.get("value", None),
+            value=LazyValue(lambda: body.get().get("value", None)),
         )
@@ -0,0 +1,104 @@
+import linkedin_api.common.constants as constants
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.common.errors import InvalidArgumentError
+from typing import Any, Dict, Optional
+import re
+
+PLACEHOLDER_PATTERN = re.compile(r"{(.*?)}")
+
+
+class RestliRoute:
+    """
+    A resource path template that is parsed and validated once, so that URLs for it can be built without
+    parsing the template on every request. Routes can be passed to every RestliClient method in place of
+    the resource path string.
+
+    Attributes:
+        resource_path (str): The resource path template, e.g. "/socialActions/{id}/comments/{commentId}"
+        placeholders (Tuple[str, ...]): The names of the path key placeholders, in order
+        entity_key (Optional[str]): The name of the placeholder that ends the template, if the route addresses
+        an entity of a collection (e.g. "id" in "/adAccounts/{id}"), otherwise None
+        collection_path (Optional[str]): The resource path template of that collection (e.g. "/adAccounts"),
+        if the route addresses an entity of a collection, otherwise None
+    """
+
+    def __init__(self, resource_path: str):
+        """
+        The constructor for the RestliRoute class.
+
+        Args:
+            resource_path (str): The resource path template string, beginning with a forward slash. Path key placeholders (if any) should be specified using curly-braces.
+
+        Raises:
+            InvalidArgumentError: Error if the template contains the same placeholder more than once
+        """
+        # Splitting on the placeholder pattern alternates literal segments and placeholder names
+        segments = PLACEHOLDER_PATTERN.split(resource_path)
+        placeholders = tuple(segments[1::2])
+        if len(set(placeholders)) != len(placeholders):
+            raise InvalidArgumentError(
+                "The 'resource_path' argument contains duplicate placeholders"
+            )
+
+        self.resource_path = resource_path
+        self.placeholders = placeholders
+        self._segments = segments
+        self._placeholder_indexes = tuple(
+            (2 * position + 1, name) for (position, name) in enumerate(placeholders)
+        )
+
+        # A template ending with "/{key}" addresses an entity, which can also be fetched with a
+        # BATCH_GET on the collection path
+        entity_key_suffix = f"/{{{placeholders[-1]}}}" if placeholders else None
+        if entity_key_suffix and resource_path.endswith(entity_key_suffix) and (
+            len(resource_path) > len(entity_key_suffix)
+        ):
+            self.entity_key = placeholders[-1]
+            self.collection_path = resource_path[: -len(entity_key_suffix)]
+        else:
+            self.entity_key = None
+            self.collection_path = None
+
+    def build(
+        self, path_keys: Optional[Dict[str, Any]] = None, version_string=None
+    ) -> str:
+        """
+        Builds the URL (not including query parameters) of a request on this route.
+
+        Args:
+            path_keys (Optional[Dict[str, Any]], optional): The path keys dictionary whose keys map to the placeholders of the route. The path keys may be complex keys (objects), which will be properly encoded. Defaults to None.
+            version_string (Optional[str], optional): Optional version string to be provided if versioned APIs are being used. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: Error if the placeholders of the route don't match 'path_keys'
+
+        Returns:
+            str: The constructed URL of the API request, not including query parameters
+        """
+        base_url = (
+            constants.VERSIONED_BASE_URL
+            if version_string
+            else constants.NON_VERSIONED_BASE_URL
+        )
+
+        num_path_keys = len(path_keys) if path_keys else 0
+        if num_path_keys != len(self.placeholders):
+            raise InvalidArgumentError(
+                "The number of placeholders in the 'resource_path' argument do not match the number of keys in the 'path_keys' argument"
+            )
+        if not num_path_keys:
+            return f"{base_url}{self.resource_path}"
+
+        segments = self._segments.copy()
+        try:
+            for index, name in self._placeholder_indexes:
+                segments[index] = encode(path_keys[name])
+        except KeyError as error:
+            raise InvalidArgumentError(
+                "The placeholders in the 'resource_path' argument do not match the keys in the 'path_keys' argument"
+            ) from error
+
+        return base_url + "".join(segments)
+
+    def __repr__(self) -> str:
+        return f"RestliRoute({self.resource_path!r})"
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Hashable
 
 RestliEntity = Dict[str, Any]
 """
@@ -9,3 +9,9 @@ EncodedEntityId = str
 """
 Represents an encoded entity id
 """
+
+DecodedEntityId = Hashable
+"""
+Represents a decoded entity id in hashable form: a string for simple ids, a FrozenDict for complex keys
+and a tuple for lists
+"""
@@ -1,18 +1,39 @@
 import linkedin_api.common.constants as constants
-from linkedin_api.clients.restli.utils.encoder import encode
-from typing import Dict, Any, Optional
-from linkedin_api.common.errors import InvalidArgumentError
-import re
+from linkedin_api.clients.restli.route import RestliRoute
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union
 
 import sys
 
-if sys.version_info >= (3, 8):
-    from importlib.metadata import version
-else:
-    from importlib_metadata import version
+ROUTE_CACHE_SIZE = 512
 
+HEADERS_CACHE_SIZE = 256
+"""
+The maximum number of request header templates that are cached, one per combination of Rest.li method,
+access token, version, content type and method override
+"""
 
-__version__ = version("linkedin-api-client")
+
+@lru_cache(maxsize=None)
+def get_package_version() -> str:
+    """
+    Returns the installed version of the linkedin-api-client package. The installed distributions are
+    only looked up on the first call, rather than when the module is imported.
+    """
+    if sys.version_info >= (3, 8):
+        from importlib.metadata import version
+    else:
+        from importlib_metadata import version
+
+    return version("linkedin-api-client")
+
+
+def __getattr__(name: str) -> Any:
+    # Resolves the module's __version__ attribute lazily
+    if name == "__version__":
+        return get_package_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_rest_api_base_url(version_string):
@@ -30,32 +51,58 @@ def get_restli_request_headers(
     http_method_override=None,
     content_type="application/json",
 ):
+    return dict(
+        get_restli_request_headers_template(
+            restli_method,
+            access_token,
+            version_string,
+            http_method_override,
+            content_type,
+        )
+    )
+
+
+@lru_cache(maxsize=HEADERS_CACHE_SIZE)
+def get_restli_request_headers_template(
+    restli_method: constants.RESTLI_METHODS,
+    access_token,
+    version_string=None,
+    http_method_override=None,
+    content_type="application/json",
+) -> Mapping[str, str]:
+    """
+    Returns the read-only request headers for a combination of Rest.li method, access token, version,
+    method override and content type. The templates are built once and cached, so that building the
+    headers of a request is a single dictionary copy.
+    """
     headers = {
         "Connection": "Keep-Alive",
         "X-RestLi-Protocol-Version": "2.0.0",
         "X-RestLi-Method": restli_method.value,
         "Authorization": "Bearer " + access_token,
         "Content-Type": content_type,
-        "User-Agent": f"linkedin-api-python-client/{__version__}",
+        "User-Agent": f"linkedin-api-python-client/{get_package_version()}",
     }
     if version_string is not None:
-        headers.update({"LinkedIn-Version": version_string})
+        headers["LinkedIn-Version"] = version_string
     if http_method_override is not None:
-        headers.update({"X-HTTP-Method-Override": http_method_override})
+        headers["X-HTTP-Method-Override"] = http_method_override
 
-    return headers
+    return MappingProxyType(headers)
 
 
 def build_rest_url(
-    resource_path: str, path_keys: Optional[Dict[str, Any]] = None, version_string=None
+    resource_path: Union[str, RestliRoute],
+    path_keys: Optional[Dict[str, Any]] = None,
+    version_string=None,
 ) -> str:
     """Method to build the URL (not including query parameters) for a REST-based API call to LinkedIn.
 
     Args:
-        resource_path (str): The resource path template string, beginning with a forward slash.
+        resource_path (Union[str, RestliRoute]): The resource path template string, beginning with a forward slash.
           Path key placeholders (if any) should be specified using curly-braces, and the placeholders
           must match the keys defined in the 'path_keys' argument. Examples: `/me` or `/adAccounts/{adAccountId}`
-          or `/socialActions/{id}/comments/{commentId}`
+          or `/socialActions/{id}/comments/{commentId}`. A precompiled RestliRoute can be passed instead.
         path_keys (Dict[str,Any], optional): Optional path keys dictionary whose keys should map to the
           placeholder values in the 'resource_path' argument. The path keys may be complex keys (objects),
           which will be properly encoded by this method. For example: `{"id": 123, "subId": 456}` or
@@ -69,31 +116,37 @@ def build_rest_url(
     Returns:
         str: The constructed URL of the API request, not including query parameters
     """
+    return get_route(resource_path).build(path_keys, version_string)
 
-    if version_string:
-        base_url = constants.VERSIONED_BASE_URL
-    else:
-        base_url = constants.NON_VERSIONED_BASE_URL
 
-    # Validate resource_path and path_keys
-    num_path_keys = 0 if path_keys is None else len(path_keys.keys())
-    if path_keys:
-        encoded_path_keys = {k: encode(v) for (k, v) in path_keys.items()}
-    else:
-        encoded_path_keys = {}
+def get_route(resource_path: Union[str, RestliRoute]) -> RestliRoute:
+    """
+    Returns the compiled route of a resource path. Compiled routes of resource path strings are
+    cached, so each template is only parsed once.
 
-    placeholders = re.findall(r"{(.*?)}", resource_path)
+    Args:
+        resource_path (Union[str, RestliRoute]): The resource path template string, or a compiled route
 
-    if len(placeholders) != num_path_keys:
-        raise InvalidArgumentError(
-            "The number of placeholders in the 'resource_path' argument do not match the number of keys in the 'path_keys' argument"
-        )
+    Raises:
+        InvalidArgumentError: Error if the template contains the same placeholder more than once
+
+    Returns:
+        RestliRoute: The compiled route
+    """
+    if isinstance(resource_path, RestliRoute):
+        return resource_path
+    return __compile_route(resource_path)
 
-    try:
-        resource_path = resource_path.format(**encoded_path_keys)
-    except Exception as error:
-        raise InvalidArgumentError(
-            "The placeholders in the 'resource_path' argument do not match the keys in the 'path_keys' argument"
-        ) from error
 
-    return f"{base_url}{resource_path}"
+@lru_cache(maxsize=ROUTE_CACHE_SIZE)
+def __compile_route(resource_path: str) -> RestliRoute:
+    return RestliRoute(resource_path)
+
+
+def get_resource_path_template(resource_path: Union[str, RestliRoute]) -> str:
+    """
+    Returns the resource path template string of a resource path or compiled route.
+    """
+    if isinstance(resource_path, RestliRoute):
+        return resource_path.resource_path
+    return resource_path
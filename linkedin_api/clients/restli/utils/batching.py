@@ -0,0 +1,109 @@
+from linkedin_api.clients.restli.utils.restli import freeze_entity_id
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, TypeVar
+import threading
+
+R = TypeVar("R")
+
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class _PendingBatch:
+    __slots__ = ("ids", "full", "future")
+
+    def __init__(self):
+        # The distinct ids of the batch by their hashable form, in the order they were added
+        self.ids: Dict[Hashable, Any] = {}
+        self.full = threading.Event()
+        self.future = Future()
+
+
+class GetBatcher:
+    """
+    Collects individual GET calls on the same collection (with the same access token, version, query
+    parameters and other path keys) that are made within a short window, and sends them as a single
+    BATCH_GET. Each caller then receives its own result, resolved from the batch response.
+
+    Like SingleFlight, the first caller of a batch (the leader) waits for the window to elapse, or for
+    the batch to reach `max_batch_size` ids, and then sends the batch for all callers. Batching therefore
+    only saves round trips when GET calls are made concurrently (e.g. from several threads), and adds up
+    to `window` seconds of latency to each call.
+
+    Example:
+        >>> restli_client = RestliClient(get_batcher=GetBatcher(window=0.01))
+        >>> with ThreadPoolExecutor() as executor:
+                responses = list(executor.map(
+                    lambda id: restli_client.get(
+                        resource_path="/organizations/{id}",
+                        path_keys={"id": id},
+                        access_token=MY_ACCESS_TOKEN
+                    ),
+                    organization_ids
+                ))
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        The constructor for the GetBatcher class.
+
+        Args:
+            window (float, optional): The time in seconds a batch collects calls before it is sent. Defaults to 0.005.
+            max_batch_size (int, optional): The maximum number of distinct ids of a batch. A batch is sent as soon as it is full. Defaults to 100.
+        """
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        key: Hashable,
+        entity_id: Any,
+        fetch: Callable[[List[Any]], R],
+    ) -> R:
+        """
+        Adds an id to the pending batch with the given key, and returns the result of fetching the batch.
+        Identical ids within a batch are only fetched once.
+
+        Args:
+            key (Hashable): The key identifying calls that can be batched together
+            entity_id (Any): The id to fetch
+            fetch (Callable[[List[Any]], R]): Fetches the distinct ids of a batch. It is only called by the leader of the batch.
+
+        Returns:
+            R: The result of fetching the batch the id was added to, shared by all callers of the batch
+        """
+        with self._lock:
+            batch = self._pending.get(key, None)
+            is_leader = batch is None
+            if is_leader:
+                batch = _PendingBatch()
+                self._pending[key] = batch
+            batch.ids.setdefault(freeze_entity_id(entity_id), entity_id)
+            if len(batch.ids) >= self.max_batch_size:
+                # Later calls start a new batch
+                del self._pending[key]
+                batch.full.set()
+
+        if not is_leader:
+            return batch.future.result()
+
+        batch.full.wait(self.window)
+        with self._lock:
+            if self._pending.get(key, None) is batch:
+                del self._pending[key]
+
+        try:
+            result = fetch(list(batch.ids.values()))
+        except BaseException as error:
+            batch.future.set_exception(error)
+            raise
+        else:
+            batch.future.set_result(result)
+            return result
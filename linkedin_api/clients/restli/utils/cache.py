@@ -0,0 +1,358 @@
+from linkedin_api.clients.common.codec import JsonCodec
+from linkedin_api.clients.common.response import BaseResponse
+from linkedin_api.clients.common.response_formatter import BaseResponseFormatter
+from collections import OrderedDict
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+CACHE_CONTROL_HEADER = "Cache-Control"
+NOT_MODIFIED_STATUS_CODE = 304
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_MAX_ENTRIES = 16384
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+
+_DISK_ENTRY_SUFFIX = ".cache"
+_DISK_TEMP_SUFFIX = ".tmp"
+
+
+class CacheEntry:
+    __slots__ = ("response", "etag", "expires_at", "size")
+
+    def __init__(
+        self,
+        response: BaseResponse,
+        etag: Optional[str],
+        expires_at: float,
+        size: int,
+    ):
+        self.response = response
+        """
+        The formatted response that is served from the cache.
+        """
+
+        self.etag = etag
+        """
+        The ETag of the cached response, used to revalidate the entry once it is stale.
+        """
+
+        self.expires_at = expires_at
+        """
+        The time (as returned by time.time()) after which the entry is stale.
+        """
+
+        self.size = size
+        """
+        The size of the response body in bytes.
+        """
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class ResponseCache:
+    """
+    A cache for formatted Rest.li read responses. Entries are kept in an in-memory LRU bounded by entry
+    count and total response body size, with an optional on-disk tier that survives restarts.
+
+    Entries are served without a request while they are fresh. Stale entries that have an ETag are
+    revalidated with an If-None-Match request, and a 304 Not Modified response serves the cached entry
+    without decoding the response again.
+
+    The on-disk tier stores the status code, headers and body of responses (but not the request, so no
+    access tokens), in pickle files. Only point it at a directory that is not writable by others. It is
+    bounded by entry count and total file size, evicting the entries that expire first, and expired
+    entries are removed from disk as they are found. Unlike in memory, stale entries on disk are not
+    kept for revalidation.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_directory: Optional[str] = None,
+        disk_max_entries: int = DEFAULT_DISK_MAX_ENTRIES,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+    ):
+        """
+        The constructor for the ResponseCache class.
+
+        Args:
+            ttl (float, optional): The number of seconds an entry is served without revalidation. Defaults to 300.
+            max_entries (int, optional): The maximum number of entries kept in memory. Defaults to 1024.
+            max_bytes (int, optional): The maximum total size of the response bodies kept in memory. Defaults to 32 MiB.
+            disk_directory (Optional[str], optional): The directory of the on-disk tier. If None, only the in-memory tier is used. Defaults to None.
+            disk_max_entries (int, optional): The maximum number of entries kept on disk. Defaults to 16384.
+            disk_max_bytes (int, optional): The maximum total size of the files kept on disk. Defaults to 256 MiB.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_directory = disk_directory
+        self.disk_max_entries = disk_max_entries
+        self.disk_max_bytes = disk_max_bytes
+        if disk_directory is not None:
+            os.makedirs(disk_directory, exist_ok=True)
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # The size and expiry time of the files on disk by file name, in the order they expire. It is
+        # built from the directory on first use, so it includes the entries of previous runs.
+        self._disk_index: "Optional[OrderedDict[str, Tuple[int, float]]]" = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+
+    def lookup(
+        self,
+        key: Hashable,
+        formatter: Type[BaseResponseFormatter],
+        codec: Optional[JsonCodec] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Returns the cache entry for a request, which may be stale. Entries found in the on-disk tier are
+        formatted with the given formatter and moved into memory.
+
+        Args:
+            key (Hashable): The request key
+            formatter (Type[BaseResponseFormatter]): The formatter of the request's response type
+            codec (Optional[JsonCodec], optional): The codec used to decode entries found on disk. Defaults to the default codec.
+
+        Returns:
+            Optional[CacheEntry]: The cache entry, or None on a cache miss
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.disk_directory is None:
+            return None
+
+        stored = self._read_from_disk(key)
+        if stored is None:
+            return None
+        response = _build_response(stored)
+        entry = CacheEntry(
+            response=formatter.format_response(response, codec=codec),
+            etag=stored["etag"],
+            expires_at=stored["expires_at"],
+            size=len(stored["content"]),
+        )
+        self._add_to_memory(key, entry)
+        return entry
+
+    def store(self, key: Hashable, response: Response, formatted_response: Any) -> None:
+        """
+        Adds a successful response to the cache, unless the response forbids storing it.
+
+        Args:
+            key (Hashable): The request key
+            response (Response): The raw response
+            formatted_response (Any): The formatted response to serve from the cache
+        """
+        cache_control = response.headers.get(CACHE_CONTROL_HEADER, "")
+        if "no-store" in cache_control.lower():
+            return
+
+        etag = response.headers.get(ETAG_HEADER, None)
+        expires_at = time.time() + self.ttl
+        content = response.content
+        self._add_to_memory(
+            key,
+            CacheEntry(
+                response=formatted_response,
+                etag=etag,
+                expires_at=expires_at,
+                size=len(content),
+            ),
+        )
+
+        if self.disk_directory is not None:
+            self._write_to_disk(
+                key,
+                {
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": content,
+                    "encoding": response.encoding,
+                    "url": response.url,
+                    "etag": etag,
+                    "expires_at": expires_at,
+                },
+            )
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """
+        Marks an entry as fresh again, after it was successfully revalidated.
+
+        Args:
+            entry (CacheEntry): The revalidated entry
+        """
+        entry.expires_at = time.time() + self.ttl
+
+    def clear(self) -> None:
+        """
+        Removes all entries from memory and from disk, including the temporary files of interrupted writes.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+        if self.disk_directory is not None:
+            with self._disk_lock:
+                self._disk_index = OrderedDict()
+                self._disk_bytes = 0
+            self._remove_disk_files(
+                file_name
+                for file_name in os.listdir(self.disk_directory)
+                if file_name.endswith((_DISK_ENTRY_SUFFIX, _DISK_TEMP_SUFFIX))
+            )
+
+    def _add_to_memory(self, key: Hashable, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous_entry = self._entries.pop(key, None)
+            if previous_entry is not None:
+                self._total_bytes -= previous_entry.size
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_entry.size
+
+    def _get_disk_file_name(self, key: Hashable) -> str:
+        file_name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return f"{file_name}{_DISK_ENTRY_SUFFIX}"
+
+    def _read_from_disk(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        file_name = self._get_disk_file_name(key)
+        try:
+            with open(os.path.join(self.disk_directory, file_name), "rb") as file:
+                stored = pickle.load(file)
+        except OSError:
+            return None
+        except (pickle.UnpicklingError, EOFError):
+            stored = None
+
+        if stored is None or stored["expires_at"] <= time.time():
+            # Expired and corrupted entries can't be served, so they are removed
+            with self._disk_lock:
+                self._forget_disk_entry(file_name)
+            self._remove_disk_files([file_name])
+            return None
+        return stored
+
+    def _write_to_disk(self, key: Hashable, stored: Dict[str, Any]) -> None:
+        file_name = self._get_disk_file_name(key)
+        expires_at = stored["expires_at"]
+        # Write to a temporary file first, so that concurrent readers never see a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.disk_directory, suffix=_DISK_TEMP_SUFFIX
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(stored, file, protocol=pickle.HIGHEST_PROTOCOL)
+                size = file.tell()
+            # The modification time of an entry is its expiry time, so that the expired entries of
+            # previous runs are found without reading them
+            os.utime(temp_path, (expires_at, expires_at))
+            os.replace(temp_path, os.path.join(self.disk_directory, file_name))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        now = time.time()
+        evicted_file_names = []
+        with self._disk_lock:
+            disk_index = self._get_disk_index()
+            self._forget_disk_entry(file_name)
+            disk_index[file_name] = (size, expires_at)
+            self._disk_bytes += size
+
+            # Entries expire in the order they were written, so the expired ones are at the front
+            while disk_index:
+                oldest_file_name, (oldest_size, oldest_expires_at) = next(
+                    iter(disk_index.items())
+                )
+                if (
+                    oldest_expires_at > now
+                    and len(disk_index) <= self.disk_max_entries
+                    and self._disk_bytes <= self.disk_max_bytes
+                ):
+                    break
+                disk_index.popitem(last=False)
+                self._disk_bytes -= oldest_size
+                evicted_file_names.append(oldest_file_name)
+        self._remove_disk_files(evicted_file_names)
+
+    def _get_disk_index(self) -> "OrderedDict[str, Tuple[int, float]]":
+        # Must be called with the disk lock held
+        if self._disk_index is None:
+            disk_entries: List[Tuple[float, str, int]] = []
+            for dir_entry in os.scandir(self.disk_directory):
+                if not dir_entry.name.endswith(_DISK_ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat_result = dir_entry.stat()
+                except OSError:
+                    continue
+                disk_entries.append(
+                    (stat_result.st_mtime, dir_entry.name, stat_result.st_size)
+                )
+            disk_entries.sort()
+
+            self._disk_index = OrderedDict(
+                (file_name, (size, expires_at))
+                for (expires_at, file_name, size) in disk_entries
+            )
+            self._disk_bytes = sum(size for (_, _, size) in disk_entries)
+        return self._disk_index
+
+    def _forget_disk_entry(self, file_name: str) -> None:
+        # Must be called with the disk lock held
+        if self._disk_index is None:
+            return
+        disk_entry = self._disk_index.pop(file_name, None)
+        if disk_entry is not None:
+            self._disk_bytes -= disk_entry[0]
+
+    def _remove_disk_files(self, file_names: Iterable[str]) -> None:
+        for file_name in file_names:
+            try:
+                os.remove(os.path.join(self.disk_directory, file_name))
+            except OSError:
+                # The file was already removed, e.g. by another process sharing the directory
+                pass
+
+
+def _build_response(stored: Dict[str, Any]) -> Response:
+    response = Response()
+    response.status_code = stored["status_code"]
+    response.headers = CaseInsensitiveDict(stored["headers"])
+    response._content = stored["content"]
+    response.encoding = stored["encoding"]
+    response.url = stored["url"]
+    return response
@@ -0,0 +1,61 @@
+from typing import Iterable, Union
+import zlib
+
+DEFAULT_MIN_COMPRESSION_SIZE = 16 * 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+GZIP_CONTENT_ENCODING = "gzip"
+
+# The zlib window size value that produces a gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class RequestCompression:
+    """
+    Configures gzip compression of request bodies (e.g. of BATCH_CREATE, BATCH_UPDATE and
+    BATCH_PARTIAL_UPDATE calls). Bodies of at least `min_size` bytes are compressed and sent with a
+    "Content-Encoding: gzip" header, both for plain and for query tunneled requests. Smaller bodies are
+    sent as they are, since compressing them costs more CPU time than it saves in upload time.
+
+    Run benchmarks/bench_compression.py to compare the sizes and CPU cost of the compression levels on
+    representative payloads.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_size: int = DEFAULT_MIN_COMPRESSION_SIZE,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+    ):
+        """
+        The constructor for the RequestCompression class.
+
+        Args:
+            min_size (int, optional): The minimum size in bytes of the uncompressed body for it to be compressed. Defaults to 16 KiB.
+            level (int, optional): The compression level, from 1 (fastest) to 9 (smallest). Defaults to 6.
+        """
+        self.min_size = min_size
+        self.level = level
+
+    def should_compress(self, body_length: int) -> bool:
+        """
+        Returns whether a request body of the given length should be compressed.
+        """
+        return body_length >= self.min_size
+
+    def compress(self, body: Union[bytes, Iterable[bytes]]) -> bytes:
+        """
+        Compresses a request body with gzip. Streamed bodies are compressed chunk by chunk, so only the
+        compressed body is held in memory.
+
+        Args:
+            body (Union[bytes, Iterable[bytes]]): The request body, or the chunks of a streamed body
+
+        Returns:
+            bytes: The gzip-compressed body
+        """
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, _GZIP_WBITS)
+        if isinstance(body, bytes):
+            return compressor.compress(body) + compressor.flush()
+        compressed = [compressor.compress(chunk) for chunk in body]
+        compressed.append(compressor.flush())
+        return b"".join(compressed)
@@ -6,8 +6,6 @@ from linkedin_api.common.constants import (
     OBJ_PREFIX,
     OBJ_SUFFIX,
     OBJ_KEY_VAL_SEP,
-    OBJ_KEY_VAL_PAIR_SEP,
-    LEFT_BRACKET,
     RIGHT_BRACKET,
 )
 from urllib.parse import unquote
@@ -16,6 +14,13 @@ import re
 
 # These special characters are URL-encoded in reduced encoded primitives: "(", ")", ",", ":", "'"
 reduced_decode_special_chars_pattern = r"%28|%29|%2C|%3A|%27"
+reduced_decode_special_chars_regex = re.compile(reduced_decode_special_chars_pattern)
+
+# A primitive list item or object value ends at the next comma, or at the end of its container
+primitive_end_regex = re.compile(r"[,)]")
+
+# An object key ends at the key-value separator
+object_key_end_regex = re.compile(r"[:,)]")
 
 
 def decode(value: str) -> Union[Dict[str, Any], List[Any], str]:
@@ -57,58 +62,13 @@ def __validateSuffix(restli_encoded_str: str, suffix: str):
 
 
 def __restli_unescape(value: str, reduced: bool):
+    if "%" not in value:
+        return value
     if not reduced:
-        value = unquote(value)
-    elif re.search(reduced_decode_special_chars_pattern, value):
-        value = re.sub(
-            reduced_decode_special_chars_pattern,
-            lambda match: unquote(match.group()),
-            value,
-        )
-    return value
-
-
-def __find_last_right_bracket(value: str, pos: int) -> int:
-    """
-    Returns the index of the last right, matching bracket, starting from specified index.
-    For example, consider value = "List(1,(k:v))".
-    If pos = 0, then return the position of the outer matching bracket (12)
-    If pos = 7, then return the position of the inner matching bracket (11)
-
-    Args:
-        value (str): The encoded string value
-        pos (int): The index at which to start searching
-
-    Raises:
-        InvalidSerializedRestliError: Exception if there are unmatched brackets
-
-    Returns:
-        int: The index of the right matching bracket
-    """
-    unmatched_brackets = 0
-    # Keep track of if we have encountered at least one left bracket
-    has_met_first = False
-    idx = pos
-
-    while idx < len(value):
-        # Iterate through the string, if find left bracket, add to unmatched_brackets.
-        # If you find right brackets, decrement unmatched_brackets
-        # Once there are 0 unmatched brackets left, break
-        curr_char = value[idx]
-        if curr_char == LEFT_BRACKET:
-            unmatched_brackets += 1
-            has_met_first = True
-        if curr_char == RIGHT_BRACKET:
-            unmatched_brackets -= 1
-        if unmatched_brackets == 0 and has_met_first:
-            break
-        idx += 1
-    if unmatched_brackets > 0:
-        # We have unmatched brackets, so throw error
-        raise InvalidSerializedRestliError(
-            f"The serialized Rest.li string has unbalanced brackets: {value}"
-        )
-    return idx
+        return unquote(value)
+    return reduced_decode_special_chars_regex.sub(
+        lambda match: unquote(match.group()), value
+    )
 
 
 def __internal_decode(restli_encoded_str: str, reduced: bool):
@@ -117,103 +77,91 @@ def __internal_decode(restli_encoded_str: str, reduced: bool):
 
     if restli_encoded_str.startswith(LIST_PREFIX):
         __validateSuffix(restli_encoded_str, LIST_SUFFIX)
-        return __decode_list(restli_encoded_str[5:-1], reduced)
+        return __decode_container(restli_encoded_str, [], len(LIST_PREFIX), reduced)
     elif restli_encoded_str.startswith(OBJ_PREFIX):
         __validateSuffix(restli_encoded_str, OBJ_SUFFIX)
-        return __decode_object(restli_encoded_str[1:-1], reduced)
+        return __decode_container(restli_encoded_str, {}, len(OBJ_PREFIX), reduced)
     else:
         return __restli_unescape(restli_encoded_str, reduced)
 
 
-def __decode_list(restli_encoded_str: str, reduced: bool) -> List[Any]:
+def __decode_container(
+    restli_encoded_str: str,
+    root: Union[Dict[str, Any], List[Any]],
+    idx: int,
+    reduced: bool,
+) -> Union[Dict[str, Any], List[Any]]:
     """
-    Decodes a Rest.li-encoded string to a list
+    Decodes a Rest.li-encoded list or object in a single pass over the string. Nested lists and objects
+    are tracked on an explicit stack of the containers that are open at the current position, so no
+    substrings are copied other than the keys and primitive values themselves.
 
     Args:
-        restli_encoded_str (str): An encoded string value that should represent a list. It is expected
-        that this is the string value inside of "List(...)". For example, if the original string is
-        "List(val1,val2,val3)", then the string that should be passed into _decode_list() should be
-        "val1,val2,val3".
+        restli_encoded_str (str): The complete encoded string, for example "List(val1,(prop1:val2))"
+        root (Union[Dict[str,Any], List[Any]]): The empty list or dict that the top-level container is decoded into
+        idx (int): The index after the prefix of the top-level container
         reduced (bool): Flag whether this is expected to be a reduced-encoded string
 
-    Returns:
-        List[Any]: The decoded list
-    """
-
-    decoded_list = []
-    idx = 0
-    while idx < len(restli_encoded_str):
-        if (restli_encoded_str[idx:].startswith(LIST_PREFIX)) or (
-            restli_encoded_str[idx:].startswith(OBJ_PREFIX)
-        ):
-            # If we encounter a List or Object as one of the current list's entries, append the decoded value
-            right_bracket_idx = __find_last_right_bracket(restli_encoded_str, idx)
-            decoded_list.append(
-                __internal_decode(
-                    restli_encoded_str[idx : right_bracket_idx + 1], reduced
-                )
-            )
-
-            # Move past the comma (separating list values)
-            idx = right_bracket_idx + 2
-        else:
-            # The current list entry is a primitive
-            end_idx = restli_encoded_str.find(LIST_ITEM_SEP, idx)
-            if end_idx < 0:
-                end_idx = len(restli_encoded_str)
-            decoded_list.append(
-                __restli_unescape(restli_encoded_str[idx:end_idx], reduced)
-            )
-
-            # Move past the comma
-            idx = end_idx + 1
-    return decoded_list
-
-
-def __decode_object(restli_encoded_str: str, reduced: bool) -> Dict[str, Any]:
-    """
-    Decodes a Rest.li-encoded string to an object.
-
-    Args:
-        restli_encoded_str (str): An encoded string value that should represent an object. It is expected
-        that this is the string value inside of the parentheses. For example, if the original string is
-        "(prop1:val,prop2:val2)", then the string that should be passed into _decode_object() should be
-        "prop1:val1,prop2:val2".
-        reduced (bool): Flag whether this is expected to be a reduced-encoded string
+    Raises:
+        InvalidSerializedRestliError: Exception if the brackets are unbalanced or an object key has no value
 
     Returns:
-        Dict[str,Any]: The decoded object
+        Union[Dict[str,Any], List[Any]]: The decoded list or object
     """
-    decoded_object = {}
-    idx = 0
-    while idx < len(restli_encoded_str):
-        # Get the key value between the start index and key-val separator (:)
-        colon_idx = restli_encoded_str.find(OBJ_KEY_VAL_SEP, idx)
-        key = __restli_unescape(restli_encoded_str[idx:colon_idx], reduced)
-
-        # Move to the next character after the colon
-        idx = colon_idx + 1
-
-        if (restli_encoded_str[idx:].startswith(LIST_PREFIX)) or (
-            restli_encoded_str[idx:].startswith(OBJ_PREFIX)
-        ):
-            # If we encounter a List or Object as the key's value, decode it
-            right_bracket_idx = __find_last_right_bracket(restli_encoded_str, idx)
-            decoded_object[key] = __internal_decode(
-                restli_encoded_str[idx : right_bracket_idx + 1], reduced
+    length = len(restli_encoded_str)
+    stack = [root]
+    while stack:
+        if idx >= length:
+            raise InvalidSerializedRestliError(
+                f"The serialized Rest.li string has unbalanced brackets: {restli_encoded_str}"
             )
 
-            # Move index past next potential comma (separating obj key-value pairs)
-            idx = right_bracket_idx + 2
+        container = stack[-1]
+        if restli_encoded_str[idx] == RIGHT_BRACKET:
+            # The current container ends. Move past the next comma separating it from the next entry
+            # of its parent, unless the parent ends as well.
+            stack.pop()
+            idx += 1
+            if stack and idx < length and restli_encoded_str[idx] != RIGHT_BRACKET:
+                idx += 1
+            continue
+
+        is_list = isinstance(container, list)
+        if not is_list:
+            # Get the key value between the current index and the key-val separator (:)
+            match = object_key_end_regex.search(restli_encoded_str, idx)
+            if match is None or match.group() != OBJ_KEY_VAL_SEP:
+                raise InvalidSerializedRestliError(
+                    f"The serialized Rest.li string has an object key without a value: {restli_encoded_str}"
+                )
+            key = __restli_unescape(restli_encoded_str[idx : match.start()], reduced)
+            idx = match.end()
+
+        if restli_encoded_str.startswith(LIST_PREFIX, idx):
+            value = []
+            idx += len(LIST_PREFIX)
+            stack.append(value)
+        elif restli_encoded_str.startswith(OBJ_PREFIX, idx):
+            value = {}
+            idx += len(OBJ_PREFIX)
+            stack.append(value)
         else:
-            # The key's value is a primitive
-            end_idx = restli_encoded_str.find(OBJ_KEY_VAL_PAIR_SEP, idx)
-            if end_idx < 0:
-                end_idx = len(restli_encoded_str)
+            # The entry is a primitive, which ends at the next comma or at the end of the container
+            match = primitive_end_regex.search(restli_encoded_str, idx)
+            end_idx = match.start() if match is not None else length
+            value = __restli_unescape(restli_encoded_str[idx:end_idx], reduced)
+            if match is not None and match.group() == LIST_ITEM_SEP:
+                idx = match.end()
+            else:
+                idx = end_idx
+
+        if is_list:
+            container.append(value)
+        else:
+            container[key] = value
 
-            decoded_object[key] = __restli_unescape(
-                restli_encoded_str[idx:end_idx], reduced
-            )
-            # end_idx is the comma index, so move 1 past it
-            idx = end_idx + 1
-    return decoded_object
+    if idx != length:
+        raise InvalidSerializedRestliError(
+            f"The serialized Rest.li string has unbalanced brackets: {restli_encoded_str}"
+        )
+    return root
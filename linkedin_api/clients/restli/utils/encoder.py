@@ -7,8 +7,29 @@ from linkedin_api.common.constants import (
     OBJ_KEY_VAL_SEP,
     OBJ_KEY_VAL_PAIR_SEP,
 )
-from typing import Optional, List, Dict, Any, Union
-from urllib.parse import quote
+from collections.abc import Hashable, Mapping
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Union
+from urllib.parse import quote, unquote
+import re
+import string
+
+ENCODE_CACHE_SIZE = 4096
+"""
+The maximum number of encoded strings, tuples and mappings kept in the encoding cache.
+"""
+
+# Characters that are not percent-encoded by quote(value, safe="")
+_SAFE_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_.-~")
+
+# Runs of URL-encoded characters, except the characters that are also escaped by the reduced encoding
+_REDUCED_UNESCAPE_REGEX = re.compile(r"(?:%(?!28|29|2C|3A|27)[0-9A-F]{2})+")
+
+# Translation table from ASCII code points to their URL-encoded form
+_QUOTE_TABLE = [
+    chr(code) if chr(code) in _SAFE_CHARACTERS else f"%{code:02X}"
+    for code in range(128)
+]
 
 
 def param_encode(raw_query_params_map: Optional[Dict[str, Any]]) -> str:
@@ -33,12 +54,14 @@ def param_encode(raw_query_params_map: Optional[Dict[str, Any]]) -> str:
     )
 
 
-def encode(value: Union[bool, str, int, float, List, Dict]) -> str:
+def encode(value: Union[bool, str, int, float, List, Tuple, Dict, Mapping]) -> str:
     """
-    Entry point for URI-encoding a single value using the Rest.li encoding protocol.
+    Entry point for URI-encoding a single value using the Rest.li encoding protocol. Tuples are encoded
+    like lists, and mappings like dicts. Strings, tuples and non-dict mappings are memoized in a bounded
+    LRU cache, since the same URNs and complex keys tend to be encoded over and over.
 
     Args:
-        value (Union[bool, str, int, float, List, Dict]): The value to encode
+        value (Union[bool, str, int, float, List, Tuple, Dict, Mapping]): The value to encode
 
     Returns:
         str: The encoded string representing the input value
@@ -48,16 +71,60 @@ def encode(value: Union[bool, str, int, float, List, Dict]) -> str:
     elif isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, str):
-        return __encode_string(value)
-    elif isinstance(value, list):
-        return __encode_list(value)
-    elif isinstance(value, dict):
-        return __encode_dict(value)
+        return __encode_frozen(value)
+    elif isinstance(value, (list, dict)):
+        return __encode_container(value)
+    elif isinstance(value, (tuple, Mapping)):
+        try:
+            frozen_value = __freeze(value)
+        except TypeError:
+            # The value contains something unhashable or is deeply nested, so it isn't memoized
+            return __encode_container(value)
+        return __encode_frozen(frozen_value)
     else:
         # Everything else (e.g. int, float)
         return str(value)
 
 
+def reduced_encode(
+    value: Union[bool, str, int, float, List, Tuple, Dict, Mapping]
+) -> str:
+    """
+    Performs the reduced Rest.li encoding of a value, used in HTTP bodies and headers (e.g. for the keys
+    of batch response maps). Unlike the URL encoding, only the characters with a meaning in Rest.li
+    values ("(", ")", ",", ":" and "'") are escaped.
+
+    Args:
+        value (Union[bool, str, int, float, List, Tuple, Dict, Mapping]): The value to encode
+
+    Returns:
+        str: The reduced-encoded string representing the input value
+    """
+    encoded_value = encode(value)
+    if "%" not in encoded_value:
+        return encoded_value
+    return _REDUCED_UNESCAPE_REGEX.sub(
+        lambda match: unquote(match.group()), encoded_value
+    )
+
+
+def encode_cache_info():
+    """
+    Returns the statistics of the encoding cache.
+
+    Returns:
+        functools._CacheInfo: The hits, misses, maximum size and current size of the cache
+    """
+    return __encode_frozen.cache_info()
+
+
+def clear_encode_cache() -> None:
+    """
+    Removes all entries from the encoding cache and resets its statistics.
+    """
+    __encode_frozen.cache_clear()
+
+
 def __encode_query_param_map(raw_query_params_map: Dict[str, Any]) -> Dict:
     # Return a Dict with the input keys and values encoded
     return {__encode_string(k): encode(v) for (k, v) in raw_query_params_map.items()}
@@ -65,18 +132,129 @@ def __encode_query_param_map(raw_query_params_map: Dict[str, Any]) -> Dict:
 
 def __encode_string(value: str) -> str:
     # Perform standard URL-encoding on strings
+    return __encode_frozen(value)
+
+
+def __quote(value: str) -> str:
+    # Equivalent to quote(value, safe=""), with a table lookup instead of a per-character loop for
+    # ASCII strings
+    if value.isascii():
+        return value.translate(_QUOTE_TABLE)
     return quote(value, safe="")
 
 
-def __encode_list(value: List[Any]) -> str:
-    # Encode a list
-    return f"{LIST_PREFIX}{LIST_ITEM_SEP.join(encode(el) for el in value)}{LIST_SUFFIX}"
+def __encode_container(value: Union[List, Tuple, Dict, Mapping]) -> str:
+    """
+    Encodes a list or dict (or tuple or mapping) by walking it iteratively with an explicit stack of the
+    containers that are open at the current position. All parts are appended to a single buffer that is
+    joined once, so nested containers don't allocate intermediate strings, and the nesting depth is not
+    limited by the recursion limit.
+    """
+    parts = []
+    append = parts.append
+    # Every frame holds the iterator over a container's items, whether it is a dict, and whether any of
+    # its items were encoded before a nested container interrupted it
+    stack = [__open_container(value, append)]
+    while stack:
+        frame = stack[-1]
+        iterator, is_dict, is_started = frame
+        for item in iterator:
+            if is_started:
+                append(OBJ_KEY_VAL_PAIR_SEP if is_dict else LIST_ITEM_SEP)
+            else:
+                is_started = True
+
+            if is_dict:
+                key, item = item
+                append(encode(key))
+                append(OBJ_KEY_VAL_SEP)
 
+            if isinstance(item, str):
+                append(__encode_frozen(item))
+            elif item is None or isinstance(item, (bool, int, float)):
+                append(encode(item))
+            elif isinstance(item, (list, dict, tuple, Mapping)):
+                frame[2] = True
+                stack.append(__open_container(item, append))
+                break
+            else:
+                append(encode(item))
+        else:
+            stack.pop()
+            append(OBJ_SUFFIX if is_dict else LIST_SUFFIX)
+    return "".join(parts)
 
-def __encode_dict(value: Dict[str, Any]) -> str:
-    # Encode a dict by encoding both key and value, both of which can be complex
-    key_values = OBJ_KEY_VAL_PAIR_SEP.join(
-        f"{encode(k)}{OBJ_KEY_VAL_SEP}{encode(v)}" for (k, v) in sorted(value.items())
-    )
 
-    return f"{OBJ_PREFIX}{key_values}{OBJ_SUFFIX}"
+def __open_container(value: Union[List, Tuple, Dict, Mapping], append) -> List:
+    # Writes the prefix of a container and returns its stack frame
+    if isinstance(value, (list, tuple)):
+        append(LIST_PREFIX)
+        return [iter(value), False, False]
+    append(OBJ_PREFIX)
+    return [iter(sorted(value.items())), True, False]
+
+
+# Tags of lists and dicts in frozen values
+_LIST_TAG = "List"
+_DICT_TAG = "Dict"
+
+# The maximum nesting depth of memoized values. Hashing and comparing frozen values recurses, so deeper
+# values are encoded iteratively without the cache instead.
+_MAX_FROZEN_DEPTH = 32
+
+
+def __freeze(value: Any, depth: int = 0) -> Hashable:
+    """
+    Converts a value to a hashable cache key that determines its encoding. Primitives other than
+    strings are tagged with their type, so that e.g. True, 1 and 1.0 (which are equal) don't share
+    an entry. Raises TypeError if the value contains something unhashable, or containers nested more
+    than _MAX_FROZEN_DEPTH levels deep.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    elif isinstance(value, (list, tuple, Mapping)) and depth >= _MAX_FROZEN_DEPTH:
+        raise TypeError("The value is nested too deeply to be memoized")
+    elif isinstance(value, (list, tuple)):
+        return (_LIST_TAG, tuple(__freeze(el, depth + 1) for el in value))
+    elif isinstance(value, Mapping):
+        return (
+            _DICT_TAG,
+            tuple(
+                (__freeze(k, depth + 1), __freeze(v, depth + 1))
+                for (k, v) in sorted(value.items())
+            ),
+        )
+    else:
+        frozen_value = (type(value), value)
+        hash(frozen_value)
+        return frozen_value
+
+
+@lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def __encode_frozen(frozen_value: Hashable) -> str:
+    if isinstance(frozen_value, str):
+        return __quote(frozen_value)
+    return __encode_frozen_value(frozen_value)
+
+
+def __encode_frozen_value(frozen_value: Hashable) -> str:
+    # Encode the value a frozen value was created from, without caching its nested values
+    if frozen_value is None:
+        return ""
+    elif isinstance(frozen_value, str):
+        return __encode_frozen(frozen_value)
+
+    tag, value = frozen_value
+    if tag is _LIST_TAG:
+        items = LIST_ITEM_SEP.join(__encode_frozen_value(el) for el in value)
+        return f"{LIST_PREFIX}{items}{LIST_SUFFIX}"
+    elif tag is _DICT_TAG:
+        key_values = OBJ_KEY_VAL_PAIR_SEP.join(
+            f"{__encode_frozen_value(k)}{OBJ_KEY_VAL_SEP}{__encode_frozen_value(v)}"
+            for (k, v) in value
+        )
+        return f"{OBJ_PREFIX}{key_values}{OBJ_SUFFIX}"
+    elif tag is bool:
+        return "true" if value else "false"
+    else:
+        return str(value)
@@ -0,0 +1,407 @@
+from linkedin_api.clients.common.codec import JsonCodec
+from linkedin_api.common.constants import RESTLI_METHODS
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+import json
+import threading
+import time
+
+PHASES = (
+    "encode",
+    "build_url",
+    "prepare",
+    "wait",
+    "connect",
+    "time_to_first_byte",
+    "download",
+    "format",
+)
+"""
+The phases of a call, in the order they happen
+"""
+
+_PHASE_ORDER = {phase: index for (index, phase) in enumerate(("total",) + PHASES)}
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_METRICS_PREFIX = "linkedin_api"
+
+
+class RequestTiming:
+    """
+    The time spent in each phase of a single RestliClient call, in seconds. The phases do not overlap,
+    so that they add up to about the total time of the call. A phase that did not happen for the call,
+    such as the network phases of a response served from the cache, is None.
+    """
+
+    __slots__ = (
+        "restli_method",
+        "resource_path",
+        "status_code",
+        "attempts",
+        "from_cache",
+        "error",
+        "total",
+        *PHASES,
+        "_start",
+        "_last",
+        "_nested",
+    )
+
+    def __init__(self, *, restli_method: RESTLI_METHODS, resource_path: str):
+        self.restli_method = restli_method
+        """
+        The Rest.li method of the call
+        """
+
+        self.resource_path = resource_path
+        """
+        The resource path template of the call, e.g. "/adAccounts/{id}"
+        """
+
+        self.status_code: Optional[int] = None
+        """
+        The HTTP status code of the final response, or None if no response was received
+        """
+
+        self.attempts = 0
+        """
+        The number of requests sent, including retries
+        """
+
+        self.from_cache = False
+        """
+        Flag whether the formatted response was served from the response cache, with or without
+        revalidating it
+        """
+
+        self.error: Optional[str] = None
+        """
+        The name of the exception class raised by the call, if any
+        """
+
+        self.total: Optional[float] = None
+        """
+        The total time of the call
+        """
+
+        self.encode: Optional[float] = None
+        """
+        The time spent encoding the query parameters and serializing the request body
+        """
+
+        self.build_url: Optional[float] = None
+        """
+        The time spent building the request URL
+        """
+
+        self.prepare: Optional[float] = None
+        """
+        The time spent preparing the request (query tunneling, headers, compression and cache lookups)
+        """
+
+        self.wait: Optional[float] = None
+        """
+        The time spent waiting on the rate limiter and backing off between retries
+        """
+
+        self.connect: Optional[float] = None
+        """
+        The time spent acquiring connections, including opening new ones. Only measured by the
+        RequestsTransport with its default session.
+        """
+
+        self.time_to_first_byte: Optional[float] = None
+        """
+        The time from sending the requests until their response headers were received, excluding
+        connection acquisition
+        """
+
+        self.download: Optional[float] = None
+        """
+        The time spent reading the response body. Not measured for streamed responses, whose body is
+        read while they are consumed.
+        """
+
+        self.format: Optional[float] = None
+        """
+        The time spent decoding and formatting the response
+        """
+
+        self._start = self._last = time.perf_counter()
+        self._nested = 0.0
+
+    def lap(self, phase: str) -> None:
+        """
+        Adds the time elapsed since the previous lap (or since the call started) to a phase, minus the
+        time added to other phases in between.
+
+        Args:
+            phase (str): The name of the phase
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last - self._nested
+        self._last = now
+        self._nested = 0.0
+        setattr(self, phase, (getattr(self, phase) or 0.0) + elapsed)
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Adds time measured separately to a phase, which is deducted from the next lap.
+
+        Args:
+            phase (str): The name of the phase
+            seconds (float): The time to add
+        """
+        self._nested += seconds
+        setattr(self, phase, (getattr(self, phase) or 0.0) + seconds)
+
+    def finish(self) -> None:
+        """
+        Sets the total time of the call.
+        """
+        self.total = time.perf_counter() - self._start
+
+    def phases(self) -> Dict[str, Optional[float]]:
+        """
+        Returns:
+            Dict[str, Optional[float]]: The time spent in each phase, by phase name
+        """
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestTiming({self.restli_method.value} {self.resource_path}, "
+            f"status_code={self.status_code}, total={self.total})"
+        )
+
+
+TimingHook = Callable[[RequestTiming], None]
+"""
+A function that is called with the RequestTiming of every call once it completes
+"""
+
+
+class TimedCodec(JsonCodec):
+    """
+    Wraps the codec of a call to add the time spent serializing the request body to its encode phase.
+    """
+
+    def __init__(self, codec: JsonCodec, timing: RequestTiming):
+        self.codec = codec
+        self.timing = timing
+        self.name = codec.name
+
+    def encode(self, value: Any) -> bytes:
+        start = time.perf_counter()
+        encoded_value = self.codec.encode(value)
+        self.timing.add("encode", time.perf_counter() - start)
+        return encoded_value
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return self.codec.decode(data)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, bucket_count: int):
+        # The last count is for values above the largest bucket
+        self.counts = [0] * (bucket_count + 1)
+        self.sum = 0.0
+
+
+class RequestMetrics:
+    """
+    A timing hook that aggregates the timings of calls into latency histograms per resource path
+    template, Rest.li method and phase (including the total time), and counts the calls by status code,
+    or by exception name for calls that failed without a response. The metrics can be exported in the
+    Prometheus text format or as JSON.
+
+    Example:
+        >>> metrics = RequestMetrics()
+        >>> restli_client = RestliClient(timing_hooks=[metrics])
+        >>> restli_client.get(
+                resource_path="/adAccounts/{id}",
+                path_keys={ "id": 123 },
+                access_token=MY_ACCESS_TOKEN
+            )
+        >>> print(metrics.to_prometheus_text())
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        prefix: str = DEFAULT_METRICS_PREFIX,
+    ):
+        """
+        The constructor for the RequestMetrics class.
+
+        Args:
+            buckets (Sequence[float], optional): The upper bounds in seconds of the histogram buckets. Defaults to 14 buckets from 0.5 ms to 10 s.
+            prefix (str, optional): The prefix of the exported Prometheus metric names. Defaults to "linkedin_api".
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, timing: RequestTiming) -> None:
+        resource_path = timing.resource_path
+        restli_method = timing.restli_method.value
+        status = (
+            str(timing.status_code)
+            if timing.status_code is not None
+            else timing.error or "none"
+        )
+        observations = [("total", timing.total)]
+        observations.extend(
+            (phase, getattr(timing, phase))
+            for phase in PHASES
+            if getattr(timing, phase) is not None
+        )
+
+        with self._lock:
+            request_key = (resource_path, restli_method, status)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            for phase, seconds in observations:
+                histogram_key = (resource_path, restli_method, phase)
+                histogram = self._histograms.get(histogram_key, None)
+                if histogram is None:
+                    histogram = _Histogram(len(self.buckets))
+                    self._histograms[histogram_key] = histogram
+                histogram.counts[bisect_left(self.buckets, seconds)] += 1
+                histogram.sum += seconds
+
+    def reset(self) -> None:
+        """
+        Discards all metrics collected so far.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the metrics as a dictionary of resource path templates, whose values are dictionaries of
+        Rest.li methods, whose values hold the call counts by status and the histogram of each phase.
+        Histogram bucket counts are cumulative, as in Prometheus, with the last count for all values.
+
+        Returns:
+            Dict[str, Any]: The metrics, e.g. { "buckets": [0.0005, ...], "resources": { "/adAccounts/{id}":
+            { "GET": { "requests": { "200": 2 }, "phases": { "total": { "count": 2, "sum": 0.09,
+            "buckets": [0, ..., 2] } } } } } }
+        """
+        with self._lock:
+            requests = sorted(self._requests.items())
+            histograms = [
+                (key, list(histogram.counts), histogram.sum)
+                for (key, histogram) in self._histograms.items()
+            ]
+        # Phases are listed in the order they happen, after the total
+        histograms.sort(
+            key=lambda item: (item[0][0], item[0][1], _PHASE_ORDER[item[0][2]])
+        )
+
+        resources: Dict[str, Dict[str, Any]] = {}
+        for (resource_path, restli_method, status), count in requests:
+            method_metrics = resources.setdefault(resource_path, {}).setdefault(
+                restli_method, {"requests": {}, "phases": {}}
+            )
+            method_metrics["requests"][status] = count
+        for (resource_path, restli_method, phase), counts, total in histograms:
+            method_metrics = resources.setdefault(resource_path, {}).setdefault(
+                restli_method, {"requests": {}, "phases": {}}
+            )
+            cumulative_counts = list(accumulate(counts))
+            method_metrics["phases"][phase] = {
+                "count": cumulative_counts[-1],
+                "sum": total,
+                "buckets": cumulative_counts,
+            }
+        return {"buckets": list(self.buckets), "resources": resources}
+
+    def to_json(self) -> str:
+        """
+        Returns:
+            str: The metrics of `to_dict()` as a JSON string
+        """
+        return json.dumps(self.to_dict())
+
+    def to_prometheus_text(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format: a `<prefix>_requests_total` counter
+        and a `<prefix>_request_phase_seconds` histogram, labeled by resource, method and status or phase.
+
+        Returns:
+            str: The metrics, e.g. to serve on a metrics endpoint
+        """
+        metrics = self.to_dict()
+        bucket_labels = [_format_float(bucket) for bucket in self.buckets] + ["+Inf"]
+        requests_name = f"{self.prefix}_requests_total"
+        seconds_name = f"{self.prefix}_request_phase_seconds"
+
+        lines = [
+            f"# HELP {requests_name} Rest.li calls by resource, method and status",
+            f"# TYPE {requests_name} counter",
+        ]
+        for resource_path, methods in metrics["resources"].items():
+            for restli_method, method_metrics in methods.items():
+                for status, count in method_metrics["requests"].items():
+                    labels = _format_labels(
+                        resource=resource_path, method=restli_method, status=status
+                    )
+                    lines.append(f"{requests_name}{{{labels}}} {count}")
+
+        lines.append(
+            f"# HELP {seconds_name} Time spent in each phase of Rest.li calls"
+        )
+        lines.append(f"# TYPE {seconds_name} histogram")
+        for resource_path, methods in metrics["resources"].items():
+            for restli_method, method_metrics in methods.items():
+                for phase, histogram in method_metrics["phases"].items():
+                    labels = _format_labels(
+                        resource=resource_path, method=restli_method, phase=phase
+                    )
+                    for bucket_label, count in zip(
+                        bucket_labels, histogram["buckets"]
+                    ):
+                        lines.append(
+                            f'{seconds_name}_bucket{{{labels},le="{bucket_label}"}} {count}'
+                        )
+                    lines.append(
+                        f"{seconds_name}_sum{{{labels}}} {_format_float(histogram['sum'])}"
+                    )
+                    lines.append(f"{seconds_name}_count{{{labels}}} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(**labels: str) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for (name, value) in labels.items()
+    )
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
@@ -0,0 +1,261 @@
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import re
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRUCTURAL_CHARACTERS = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL_CHARACTERS = re.compile(rb'["\\]')
+_SCALAR_TERMINATORS = re.compile(rb"[ \t\r\n,\]}]")
+
+# Parser states
+_EXPECT_OBJECT = 0
+_EXPECT_KEY = 1
+_EXPECT_COLON = 2
+_EXPECT_VALUE = 3
+_EXPECT_SEPARATOR = 4
+_EXPECT_ITEM = 5
+_EXPECT_ITEM_SEPARATOR = 6
+_DONE = 7
+
+
+class JsonArrayStreamParser:
+    """
+    An incremental parser for a JSON object with a large array under one key, such as the "elements" of
+    a Rest.li collection response. Chunks of the document are fed as they arrive, and every array item
+    is decoded and returned as soon as it is complete, so only the current item is held in memory.
+
+    The other top-level values (e.g. "paging") are decoded into `fields`. Values that follow the array
+    in the document are only available once it has been fed completely.
+    """
+
+    def __init__(self, array_key: str, codec: Optional[JsonCodec] = None):
+        """
+        The constructor for the JsonArrayStreamParser class.
+
+        Args:
+            array_key (str): The top-level key of the array whose items are streamed
+            codec (Optional[JsonCodec], optional): The codec used to decode the items and other values. Defaults to the default codec.
+        """
+        self.array_key = array_key
+        self.codec = codec or get_default_codec()
+        self.fields: Dict[str, Any] = {}
+        """
+        The decoded top-level values other than the streamed array.
+        """
+
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _EXPECT_OBJECT
+        self._key = None
+        # The state of the value that is currently being scanned, which may span several chunks
+        self._value_start = None
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Parses the next chunk of the document.
+
+        Args:
+            data (bytes): The next chunk
+
+        Raises:
+            ValueError: Error raised if the document is not a valid JSON object
+
+        Returns:
+            List[Any]: The array items completed by this chunk, in order
+        """
+        self._buffer += data
+        items = []
+        while self._step(items):
+            pass
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Signals the end of the document.
+
+        Raises:
+            ValueError: Error raised if the document is incomplete
+        """
+        if self._state != _DONE:
+            raise ValueError("The JSON document ended unexpectedly")
+
+    def _step(self, items: List[Any]) -> bool:
+        # Runs one transition of the state machine, returning False if more data is needed
+        state = self._state
+        if state == _DONE:
+            if self._skip_whitespace() < len(self._buffer):
+                raise ValueError("Unexpected data after the JSON document")
+            return False
+
+        if state in (_EXPECT_KEY, _EXPECT_VALUE, _EXPECT_ITEM) and (
+            self._value_start is not None
+        ):
+            return self._continue_value(items)
+
+        pos = self._skip_whitespace()
+        if pos >= len(self._buffer):
+            return False
+        char = self._buffer[pos]
+
+        if state == _EXPECT_OBJECT:
+            self._expect(char, b"{")
+            self._pos = pos + 1
+            self._state = _EXPECT_KEY
+        elif state == _EXPECT_KEY:
+            if char == ord("}"):
+                self._pos = pos + 1
+                self._state = _DONE
+            else:
+                self._expect(char, b'"')
+                self._start_value(pos)
+        elif state == _EXPECT_COLON:
+            self._expect(char, b":")
+            self._pos = pos + 1
+            self._state = _EXPECT_VALUE
+        elif state == _EXPECT_VALUE:
+            if self._key == self.array_key and char == ord("["):
+                self._pos = pos + 1
+                self._state = _EXPECT_ITEM
+            else:
+                self._start_value(pos)
+        elif state == _EXPECT_SEPARATOR:
+            self._pos = pos + 1
+            if char == ord(","):
+                self._state = _EXPECT_KEY
+            else:
+                self._expect(char, b"}")
+                self._state = _DONE
+        elif state == _EXPECT_ITEM:
+            if char == ord("]"):
+                self._pos = pos + 1
+                self._state = _EXPECT_SEPARATOR
+            else:
+                self._start_value(pos)
+        elif state == _EXPECT_ITEM_SEPARATOR:
+            self._pos = pos + 1
+            if char == ord(","):
+                self._state = _EXPECT_ITEM
+            else:
+                self._expect(char, b"]")
+                self._state = _EXPECT_SEPARATOR
+        return True
+
+    def _continue_value(self, items: List[Any]) -> bool:
+        end = self._scan_value()
+        if end is None:
+            return False
+
+        value = self.codec.decode(self._buffer[self._value_start : end])
+        self._value_start = None
+        self._pos = end
+        if self._state == _EXPECT_KEY:
+            self._key = value
+            self._state = _EXPECT_COLON
+        elif self._state == _EXPECT_VALUE:
+            self.fields[self._key] = value
+            self._state = _EXPECT_SEPARATOR
+        else:
+            items.append(value)
+            self._state = _EXPECT_ITEM_SEPARATOR
+        return True
+
+    def _start_value(self, pos: int) -> None:
+        self._value_start = pos
+        self._scan_pos = pos
+        self._depth = 0
+        self._in_string = False
+
+    def _scan_value(self) -> Optional[int]:
+        # Returns the end of the value that is being scanned, or None if it is not complete yet
+        buffer = self._buffer
+        pos = self._scan_pos
+        if pos == self._value_start and buffer[pos] not in b'"[{':
+            match = _SCALAR_TERMINATORS.search(buffer, pos)
+            return match.start() if match else None
+
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL_CHARACTERS.search(buffer, pos)
+                if match is None:
+                    self._scan_pos = len(buffer)
+                    return None
+                if buffer[match.start()] == ord("\\"):
+                    if match.end() >= len(buffer):
+                        # The escaped character is in the next chunk
+                        self._scan_pos = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    return pos
+            else:
+                match = _STRUCTURAL_CHARACTERS.search(buffer, pos)
+                if match is None:
+                    self._scan_pos = len(buffer)
+                    return None
+                char = buffer[match.start()]
+                pos = match.end()
+                if char == ord('"'):
+                    self._in_string = True
+                elif char in b"[{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return pos
+
+    def _skip_whitespace(self) -> int:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._pos
+
+    def _expect(self, char: int, expected: bytes) -> None:
+        if char != expected[0]:
+            raise ValueError(
+                f"Expected {expected.decode()!r} but found {chr(char)!r} in the JSON document"
+            )
+
+    def _compact(self) -> None:
+        # Drop the bytes that were already parsed, keeping the value that is being scanned
+        keep_from = self._value_start if self._value_start is not None else self._pos
+        if keep_from:
+            del self._buffer[:keep_from]
+            self._pos -= keep_from
+            self._scan_pos = max(0, self._scan_pos - keep_from)
+            if self._value_start is not None:
+                self._value_start -= keep_from
+
+
+def iter_json_array_items(
+    chunks: Iterable[bytes],
+    array_key: str,
+    codec: Optional[JsonCodec] = None,
+    fields: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Yields the items of the array under a top-level key of a JSON object, decoding each item as soon as
+    the chunks containing it have been read.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the JSON document
+        array_key (str): The top-level key of the array whose items are yielded
+        codec (Optional[JsonCodec], optional): The codec used to decode the items. Defaults to the default codec.
+        fields (Optional[Dict[str, Any]], optional): A dictionary that is updated with the other top-level values of the document as they are parsed. Defaults to None.
+
+    Raises:
+        ValueError: Error raised if the document is not a valid JSON object
+
+    Returns:
+        Iterator[Any]: The decoded array items
+    """
+    parser = JsonArrayStreamParser(array_key, codec)
+    if fields is not None:
+        parser.fields = fields
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
@@ -0,0 +1,122 @@
+from linkedin_api.clients.restli.response import BaseRestliResponse
+from linkedin_api.clients.restli.response_formatter import BaseResponseFormatter
+from linkedin_api.clients.restli.utils.instrumentation import RequestTiming
+from linkedin_api.common.constants import RESTLI_METHODS
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Callable, Optional, Sequence, Type
+import requests
+
+
+class RestliCall:
+    """
+    A RestliClient call whose request has been prepared, as seen by middlewares.
+    """
+
+    __slots__ = (
+        "restli_method",
+        "resource_path",
+        "prepared_request",
+        "formatter",
+        "stream",
+        "timing",
+    )
+
+    def __init__(
+        self,
+        *,
+        restli_method: RESTLI_METHODS,
+        resource_path: str,
+        prepared_request: requests.PreparedRequest,
+        formatter: Type[BaseResponseFormatter],
+        stream: bool = False,
+        timing: Optional[RequestTiming] = None,
+    ):
+        self.restli_method = restli_method
+        """
+        The Rest.li method of the call
+        """
+
+        self.resource_path = resource_path
+        """
+        The resource path template of the call, e.g. "/adAccounts/{id}"
+        """
+
+        self.prepared_request = prepared_request
+        """
+        The request that will be sent, after query tunneling. Its headers can be modified (e.g. to sign
+        the request) before the call is passed on.
+        """
+
+        self.formatter = formatter
+        """
+        The formatter that turns the response into the formatted response of the call
+        """
+
+        self.stream = stream
+        """
+        Flag whether the formatted response reads the response body on demand
+        """
+
+        self.timing = timing
+        """
+        The timing of the call, if the client has timing hooks
+        """
+
+
+CallHandler = Callable[[RestliCall], BaseRestliResponse]
+"""
+A function that sends a call and returns its formatted response
+"""
+
+
+class Middleware(ABC):
+    """
+    Wraps the calls of a RestliClient, from the prepared request to the formatted response, to add
+    cross-cutting behavior such as request signing, logging or metrics. Middlewares run around the
+    response cache, the coalescing of reads and the retries of the client, so a middleware sees each
+    call once, including calls served from the cache.
+
+    Middlewares are composed into a chain once, when the client is constructed. They must be safe to
+    use from several threads at once.
+
+    Example:
+        >>> class SigningMiddleware(Middleware):
+                def handle(self, call, call_next):
+                    call.prepared_request.headers["X-Signature"] = sign(call.prepared_request)
+                    return call_next(call)
+        >>> restli_client = RestliClient(middlewares=[SigningMiddleware()])
+    """
+
+    @abstractmethod
+    def handle(self, call: RestliCall, call_next: CallHandler) -> BaseRestliResponse:
+        """
+        Handles a call, usually by passing it on to the rest of the chain.
+
+        Args:
+            call (RestliCall): The call
+            call_next (CallHandler): Passes the call on to the next middleware, or sends it if this is the last middleware, and returns the formatted response
+
+        Returns:
+            BaseRestliResponse: The formatted response, usually the one returned by `call_next`
+        """
+        pass
+
+
+def compose_middlewares(
+    middlewares: Sequence[Middleware], handler: CallHandler
+) -> CallHandler:
+    """
+    Composes middlewares around a handler. The first middleware is the outermost one, which sees
+    the call first and the formatted response last.
+
+    Args:
+        middlewares (Sequence[Middleware]): The middlewares, which may be empty
+        handler (CallHandler): The handler that sends calls
+
+    Returns:
+        CallHandler: The composed handler, which is the given handler itself if there are no middlewares
+    """
+    for middleware in reversed(middlewares):
+        handler = partial(middleware.handle, call_next=handler)
+    return handler
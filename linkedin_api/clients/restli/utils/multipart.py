@@ -0,0 +1,112 @@
+from linkedin_api.common.constants import CONTENT_TYPE, HEADERS
+from typing import Iterator, List, Optional, Tuple, Union
+import random
+import string
+
+BOUNDARY_LENGTH = 16
+
+Content = Union[str, bytes]
+
+
+class MultipartBody:
+    """
+    A multipart/mixed request body that is streamed part by part, without joining the parts into one
+    copy of the whole body. It can be iterated more than once (e.g. when a request is retried), and its
+    length is known upfront, so it is sent with a Content-Length header rather than chunked.
+
+    The boundary is chosen so that it does not occur in any of the parts.
+
+    Example:
+        >>> body = MultipartBody([
+        ...     (CONTENT_TYPE.URL_ENCODED.value, "ids=List(1,2)"),
+        ...     (CONTENT_TYPE.JSON.value, b'{"entities":{}}'),
+        ... ])
+        >>> request = requests.Request("POST", url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    __slots__ = ("boundary", "_parts", "_length")
+
+    def __init__(
+        self, parts: List[Tuple[str, Content]], boundary: Optional[str] = None
+    ):
+        """
+        The constructor for the MultipartBody class.
+
+        Args:
+            parts (List[Tuple[str, Content]]): The (content type, content) pairs of the parts, in order. Contents given as strings are encoded as UTF-8 when the body is sent.
+            boundary (Optional[str], optional): The boundary to use. Defaults to a random boundary that does not occur in the parts.
+        """
+        self.boundary = boundary or generate_boundary(
+            [content for (_, content) in parts]
+        )
+        """
+        The boundary delimiting the parts.
+        """
+
+        self._parts = [
+            (
+                (
+                    f"--{self.boundary}\r\n"
+                    f"{HEADERS.CONTENT_TYPE.value}: {content_type}\r\n\r\n"
+                ).encode("utf-8"),
+                content,
+            )
+            for (content_type, content) in parts
+        ]
+        self._length = sum(
+            len(headers) + self.__encoded_length(content) + 2
+            for (headers, content) in self._parts
+        ) + len(self.__closing_delimiter())
+
+    @property
+    def content_type(self) -> str:
+        """
+        The value of the Content-Type header of the request.
+        """
+        return CONTENT_TYPE.MULTIPART_MIXED_WITH_BOUNDARY(self.boundary)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for index, (headers, content) in enumerate(self._parts):
+            if index:
+                yield b"\r\n"
+            yield headers
+            yield content.encode("utf-8") if isinstance(content, str) else content
+        yield b"\r\n" + self.__closing_delimiter()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self)
+
+    def __closing_delimiter(self) -> bytes:
+        return f"--{self.boundary}--".encode("utf-8")
+
+    @staticmethod
+    def __encoded_length(content: Content) -> int:
+        # Avoids encoding strings just to measure them when they are ASCII, as encoded query strings are
+        if isinstance(content, bytes) or content.isascii():
+            return len(content)
+        return len(content.encode("utf-8"))
+
+
+def generate_boundary(contents: List[Content]) -> str:
+    """
+    Generates a random boundary that does not occur in any of the given contents. The boundary only
+    contains ASCII letters, so it can be searched for in the strings without encoding them first.
+
+    Args:
+        contents (List[Content]): The contents of the parts
+
+    Returns:
+        str: The boundary
+    """
+    while True:
+        boundary = "".join(random.choices(string.ascii_letters, k=BOUNDARY_LENGTH))
+        encoded_boundary = boundary.encode("ascii")
+        if not any(
+            (boundary if isinstance(content, str) else encoded_boundary) in content
+            for content in contents
+        ):
+            return boundary
+
@@ -0,0 +1,66 @@
+from linkedin_api.clients.restli.response import CollectionResponse
+from linkedin_api.common.errors import PageFetchError
+from typing import Dict, Any, Optional
+import copy
+
+START_PARAM = "start"
+COUNT_PARAM = "count"
+
+
+def build_page_query_params(
+    query_params: Optional[Dict[str, Any]], start: int, count: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Returns a copy of the query params with the paging parameters set for the requested page.
+
+    Args:
+        query_params (Optional[Dict[str, Any]]): The original query params
+        start (int): The start index of the page
+        count (Optional[int]): The page size. If None, the server default page size is used.
+
+    Returns:
+        Dict[str, Any]: The query params for the page
+    """
+    page_query_params = copy.deepcopy(query_params) if query_params else {}
+    page_query_params[START_PARAM] = start
+    if count is not None:
+        page_query_params[COUNT_PARAM] = count
+    return page_query_params
+
+
+def get_next_page_start(
+    page: CollectionResponse, start: int, count: Optional[int]
+) -> Optional[int]:
+    """
+    Determines the start index of the page following the given page. A page with an error status (e.g.
+    a throttled 429) is not treated as the last page, so that a failure does not silently truncate the
+    collection.
+
+    Args:
+        page (CollectionResponse): The page that was just fetched
+        start (int): The start index that was requested for the page
+        count (Optional[int]): The requested page size, if any
+
+    Raises:
+        PageFetchError: Error raised if the page has a non-2xx status code
+
+    Returns:
+        Optional[int]: The start index of the next page, or None if the given page is the last one
+    """
+    if not 200 <= page.status_code < 300:
+        raise PageFetchError(
+            f"The page starting at {start} failed with status code {page.status_code}",
+            page,
+        )
+
+    num_elements = len(page.elements) if page.elements else 0
+    if num_elements == 0:
+        return None
+
+    next_start = start + num_elements
+    total = page.paging.total if page.paging else None
+    if total is not None and next_start >= total:
+        return None
+    if count is not None and num_elements < count:
+        return None
+    return next_start
@@ -7,10 +7,18 @@ from linkedin_api.common.constants import (
     HEADERS,
 )
 import linkedin_api.clients.restli.utils.api as apiutils
-import random
-import string
-import json
-from typing import Optional
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+)
+from linkedin_api.clients.restli.utils.multipart import MultipartBody
+from linkedin_api.clients.restli.utils.compression import (
+    RequestCompression,
+    GZIP_CONTENT_ENCODING,
+)
+from linkedin_api.clients.common.codec import JsonCodec, get_default_codec
+import copy
+from typing import Any, Dict, List, Optional
 
 MAX_QUERY_STRING_LENGTH = 4000
 
@@ -22,6 +30,47 @@ def is_query_tunneling_required(encoded_query_param_string):
     )
 
 
+def partition_ids_to_fit_query_string(
+    ids: List[Any], query_params: Optional[Dict[str, Any]] = None
+) -> List[List[Any]]:
+    """
+    Splits the ids of a batch request into consecutive chunks, such that the encoded query string of
+    each chunk (including the other query parameters) does not exceed the maximum query string length,
+    and so does not require query tunneling. An id that does not fit on its own is placed in a chunk by
+    itself.
+
+    Args:
+        ids (List[Any]): The ids to split
+        query_params (Optional[Dict[str, Any]], optional): The other query parameters of the request. Defaults to None.
+
+    Returns:
+        List[List[Any]]: The chunks of ids, in their original order
+    """
+    query_params_without_ids = copy.deepcopy(query_params) if query_params else {}
+    query_params_without_ids.update({"ids": []})
+    base_query_string_length = len(
+        encode_query_params_for_get_requests(query_params_without_ids)
+    )
+
+    chunks = []
+    current_chunk = []
+    current_length = base_query_string_length
+    for id in ids:
+        encoded_id = encode(id)
+        # Every id after the first one in a chunk is preceded by a list item separator
+        id_length = len(encoded_id) + (1 if current_chunk else 0)
+        if current_chunk and current_length + id_length > MAX_QUERY_STRING_LENGTH:
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_length = base_query_string_length
+            id_length = len(encoded_id)
+        current_chunk.append(id)
+        current_length += id_length
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
 def maybe_apply_query_tunneling_get_requests(
     *,
     url: str,
@@ -69,29 +118,24 @@ def maybe_apply_query_tunneling_requests_with_body(
     original_request_body,
     access_token,
     version_string,
+    codec: Optional[JsonCodec] = None,
+    compression: Optional[RequestCompression] = None,
 ):
     original_http_method = RESTLI_METHOD_TO_HTTP_METHOD_MAP[
         original_restli_method.value.upper()
     ]
+    # Serialize the body exactly once, whether or not the request is tunneled
+    encoded_request_body = (codec or get_default_codec()).encode(original_request_body)
 
     if encoded_query_param_string and is_query_tunneling_required(
         encoded_query_param_string
     ):
-        boundary = generate_random_string()
-        raw_request_body_string = encoded_query_param_string + json.dumps(
-            original_request_body
-        )
-        while raw_request_body_string.find(boundary) >= 0:
-            boundary = generate_random_string()
-
-        multipart_request_body = (
-            f"--{boundary}\r\n"
-            f"{HEADERS.CONTENT_TYPE.value}: {CONTENT_TYPE.URL_ENCODED.value}\r\n\r\n"
-            f"{encoded_query_param_string}\r\n"
-            f"--{boundary}\r\n"
-            f"{HEADERS.CONTENT_TYPE.value}: {CONTENT_TYPE.JSON.value}\r\n\r\n"
-            f"{json.dumps(original_request_body)}\r\n"
-            f"--{boundary}--"
+        # The parts are streamed as they are, so the body is never copied into one buffer
+        multipart_request_body = MultipartBody(
+            [
+                (CONTENT_TYPE.URL_ENCODED.value, encoded_query_param_string),
+                (CONTENT_TYPE.JSON.value, encoded_request_body),
+            ]
         )
 
         request = requests.Request(
@@ -99,7 +143,7 @@ def maybe_apply_query_tunneling_requests_with_body(
             url=url,
             data=multipart_request_body,
             headers=apiutils.get_restli_request_headers(
-                content_type=CONTENT_TYPE.MULTIPART_MIXED_WITH_BOUNDARY.value(boundary),
+                content_type=multipart_request_body.content_type,
                 http_method_override=original_http_method,
                 restli_method=original_restli_method,
                 access_token=access_token,
@@ -114,15 +158,53 @@ def maybe_apply_query_tunneling_requests_with_body(
         request = requests.Request(
             method=original_http_method,
             url=final_url,
-            json=original_request_body,
+            data=encoded_request_body,
             headers=apiutils.get_restli_request_headers(
                 restli_method=original_restli_method,
                 access_token=access_token,
                 version_string=version_string,
             ),
         )
+    # The whole body is compressed, including the query string part of multipart bodies
+    if compression is not None and compression.should_compress(len(request.data)):
+        request.data = compression.compress(request.data)
+        request.headers[HEADERS.CONTENT_ENCODING.value] = GZIP_CONTENT_ENCODING
     return request.prepare()
 
 
-def generate_random_string():
-    return "".join(random.choices(string.ascii_letters, k=10))
+def maybe_apply_query_tunneling(
+    *,
+    url: str,
+    encoded_query_param_string: Optional[str],
+    original_restli_method: RESTLI_METHODS,
+    access_token,
+    version_string,
+    original_request_body=None,
+    codec: Optional[JsonCodec] = None,
+    compression: Optional[RequestCompression] = None,
+):
+    """
+    Builds the prepared request for a Rest.li call, applying query tunneling if necessary. Requests
+    with a body are tunneled as multipart requests, otherwise the query string is moved into an
+    url-encoded POST body. Request bodies are serialized with the given codec, or the default codec,
+    and are gzip-compressed if a compression configuration is given and they are large enough.
+    """
+    if original_request_body is not None:
+        return maybe_apply_query_tunneling_requests_with_body(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=original_restli_method,
+            original_request_body=original_request_body,
+            access_token=access_token,
+            version_string=version_string,
+            codec=codec,
+            compression=compression,
+        )
+    else:
+        return maybe_apply_query_tunneling_get_requests(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=original_restli_method,
+            access_token=access_token,
+            version_string=version_string,
+        )
@@ -0,0 +1,115 @@
+from linkedin_api.common.errors import InvalidArgumentError
+from typing import Dict, Optional
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Tokens are refilled continuously at a fixed rate, up to the bucket
+    capacity, which allows short bursts while limiting the sustained request rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        The constructor for the TokenBucket class.
+
+        Args:
+            rate (float): The number of tokens added per second
+            capacity (Optional[float], optional): The maximum number of tokens the bucket can hold, which is the largest possible burst. Defaults to the rate (one second of tokens), with a minimum of 1.
+        """
+        if rate <= 0:
+            raise InvalidArgumentError("The token bucket rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket, blocking until enough tokens are available.
+
+        Args:
+            tokens (float, optional): The number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: The number of seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            # Reserve the tokens right away, so that concurrent callers queue up behind each other
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter with a separate token bucket per resource path template (e.g.
+    "/adAccounts/{id}"), so that the request rate of each resource can match its quota.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_rate: Optional[float] = None,
+        default_capacity: Optional[float] = None,
+        resource_rates: Optional[Dict[str, float]] = None,
+        resource_capacities: Optional[Dict[str, float]] = None,
+    ):
+        """
+        The constructor for the RateLimiter class.
+
+        Args:
+            default_rate (Optional[float], optional): The requests per second allowed for resources without a specific rate. If None, those resources are not limited. Defaults to None.
+            default_capacity (Optional[float], optional): The burst capacity for resources without a specific capacity. Defaults to None.
+            resource_rates (Optional[Dict[str, float]], optional): The requests per second allowed for specific resource path templates. Defaults to None.
+            resource_capacities (Optional[Dict[str, float]], optional): The burst capacity for specific resource path templates. Defaults to None.
+        """
+        self.default_rate = default_rate
+        self.default_capacity = default_capacity
+        self.resource_rates = dict(resource_rates) if resource_rates else {}
+        self.resource_capacities = (
+            dict(resource_capacities) if resource_capacities else {}
+        )
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, resource_path: str) -> float:
+        """
+        Waits until a request to the given resource is allowed.
+
+        Args:
+            resource_path (str): The resource path template of the request
+
+        Returns:
+            float: The number of seconds spent waiting
+        """
+        bucket = self._get_bucket(resource_path)
+        return bucket.acquire() if bucket is not None else 0.0
+
+    def _get_bucket(self, resource_path: str) -> Optional[TokenBucket]:
+        try:
+            return self._buckets[resource_path]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if resource_path not in self._buckets:
+                rate = self.resource_rates.get(resource_path, self.default_rate)
+                capacity = self.resource_capacities.get(
+                    resource_path, self.default_capacity
+                )
+                self._buckets[resource_path] = (
+                    TokenBucket(rate, capacity) if rate is not None else None
+                )
+            return self._buckets[resource_path]
@@ -1,9 +1,15 @@
 from linkedin_api.clients.restli.utils.encoder import param_encode
 from linkedin_api.clients.restli.utils.decoder import reduced_decode
 from linkedin_api.common.constants import HEADERS
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Hashable, Mapping, Optional
+from functools import lru_cache
 import copy
-from requests import Response
+from requests import PreparedRequest, Response
+
+DECODE_CACHE_SIZE = 4096
+"""
+The maximum number of decoded entity id keys that are cached and shared across responses
+"""
 
 
 def get_created_entity_id(response: Response, decode: bool = False) -> Any:
@@ -64,3 +70,90 @@ def encode_query_params_for_get_requests(query_params: Optional[Dict[str, Any]])
         )
 
     return encoded_query_param_string
+
+
+def get_request_key(prepared_request: PreparedRequest) -> Hashable:
+    """
+    Returns a key identifying a fully built HTTP request, which is stable across processes. The headers
+    are part of the key, since they carry the access token and the API version.
+
+    Args:
+        prepared_request (PreparedRequest): The prepared request
+
+    Returns:
+        Hashable: The request key
+    """
+    return (
+        prepared_request.method,
+        prepared_request.url,
+        prepared_request.body,
+        tuple(sorted(prepared_request.headers.items())),
+    )
+
+
+class FrozenDict(dict):
+    """
+    An immutable and hashable dictionary, used to represent decoded complex entity ids (e.g.
+    {"account": "urn:li:sponsoredAccount:123", "campaign": "urn:li:sponsoredCampaign:456"}) as
+    dictionary keys. It compares equal to a plain dictionary with the same items.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("FrozenDict is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+def freeze_entity_id(entity_id: Any) -> Hashable:
+    """
+    Converts a decoded entity id into its hashable form, so that it can be used as a dictionary key.
+    Since decoding Rest.li values yields strings, primitive values are converted the way they are
+    encoded, so that e.g. 123 and "123" identify the same entity.
+
+    Args:
+        entity_id (Any): The decoded entity id, which may be a primitive, a list or a dictionary
+
+    Returns:
+        Hashable: The hashable entity id
+    """
+    if isinstance(entity_id, str):
+        return entity_id
+    if isinstance(entity_id, bool):
+        return "true" if entity_id else "false"
+    if entity_id is None:
+        return ""
+    if isinstance(entity_id, Mapping):
+        return FrozenDict(
+            (key, freeze_entity_id(value)) for (key, value) in entity_id.items()
+        )
+    if isinstance(entity_id, (list, tuple)):
+        return tuple(freeze_entity_id(value) for value in entity_id)
+    return str(entity_id)
+
+
+@lru_cache(maxsize=DECODE_CACHE_SIZE)
+def decode_entity_id_key(encoded_entity_id: str) -> Hashable:
+    """
+    Decodes a reduced-encoded entity id, such as a key of a batch response map, into its hashable form.
+    The results are cached and shared, so ids that recur across responses are only decoded once.
+
+    Args:
+        encoded_entity_id (str): The reduced-encoded entity id
+
+    Returns:
+        Hashable: The decoded entity id, as returned by freeze_entity_id()
+    """
+    return freeze_entity_id(reduced_decode(encoded_entity_id))
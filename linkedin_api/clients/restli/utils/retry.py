@@ -0,0 +1,161 @@
+from linkedin_api.common.constants import RESTLI_METHODS
+from email.utils import parsedate_to_datetime
+from requests import Response
+from typing import Optional, Iterable
+import datetime
+import random
+
+DEFAULT_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Rest.li methods that can be safely repeated if the outcome of a previous attempt is unknown
+IDEMPOTENT_RESTLI_METHODS = frozenset(
+    [
+        RESTLI_METHODS.GET,
+        RESTLI_METHODS.BATCH_GET,
+        RESTLI_METHODS.GET_ALL,
+        RESTLI_METHODS.FINDER,
+        RESTLI_METHODS.BATCH_FINDER,
+        RESTLI_METHODS.UPDATE,
+        RESTLI_METHODS.BATCH_UPDATE,
+        RESTLI_METHODS.DELETE,
+        RESTLI_METHODS.BATCH_DELETE,
+    ]
+)
+
+RETRY_AFTER_HEADER = "Retry-After"
+TOO_MANY_REQUESTS_STATUS_CODE = 429
+
+
+class RetryPolicy:
+    """
+    Configures how failed Rest.li requests are retried. Retries wait using exponential backoff with full
+    jitter, unless the response specifies a Retry-After header, which is honored instead.
+
+    Throttled requests (429) were not processed by the server, so they are retried for every Rest.li method.
+    Server errors and connection errors are only retried for idempotent methods, unless
+    `retry_non_idempotent` is set, since repeating a CREATE or ACTION could apply it twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 60.0,
+        retry_status_codes: Iterable[int] = DEFAULT_RETRY_STATUS_CODES,
+        retry_connection_errors: bool = True,
+        retry_non_idempotent: bool = False,
+    ):
+        """
+        The constructor for the RetryPolicy class.
+
+        Args:
+            max_retries (int, optional): The maximum number of retries after the initial attempt. Defaults to 3.
+            backoff_factor (float, optional): The base backoff in seconds. The backoff before retry n is chosen uniformly between 0 and backoff_factor * 2^n. Defaults to 0.5.
+            max_backoff (float, optional): The maximum backoff in seconds between attempts, when no Retry-After header is present. Defaults to 30.0.
+            max_retry_after (float, optional): The longest Retry-After value in seconds that is waited for. If the server asks to wait longer, the response is returned without retrying. Defaults to 60.0.
+            retry_status_codes (Iterable[int], optional): The response status codes that should be retried. Defaults to (429, 500, 502, 503, 504).
+            retry_connection_errors (bool, optional): Flag whether connection errors and timeouts should be retried. Defaults to True.
+            retry_non_idempotent (bool, optional): Flag whether server errors and connection errors should also be retried for non-idempotent Rest.li methods. Defaults to False.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_connection_errors = retry_connection_errors
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def should_retry_response(
+        self, restli_method: RESTLI_METHODS, response: Response, attempt: int
+    ) -> bool:
+        """
+        Returns whether a request should be retried after receiving the given response.
+
+        Args:
+            restli_method (RESTLI_METHODS): The Rest.li method of the request
+            response (Response): The response of the latest attempt
+            attempt (int): The zero-based number of the latest attempt
+
+        Returns:
+            bool: Whether the request should be retried
+        """
+        if attempt >= self.max_retries:
+            return False
+        if response.status_code not in self.retry_status_codes:
+            return False
+        if response.status_code != TOO_MANY_REQUESTS_STATUS_CODE and not (
+            self.retry_non_idempotent or restli_method in IDEMPOTENT_RESTLI_METHODS
+        ):
+            return False
+
+        retry_after = get_retry_after(response)
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def should_retry_error(self, restli_method: RESTLI_METHODS, attempt: int) -> bool:
+        """
+        Returns whether a request should be retried after a connection error or timeout.
+
+        Args:
+            restli_method (RESTLI_METHODS): The Rest.li method of the request
+            attempt (int): The zero-based number of the latest attempt
+
+        Returns:
+            bool: Whether the request should be retried
+        """
+        return (
+            attempt < self.max_retries
+            and self.retry_connection_errors
+            and (self.retry_non_idempotent or restli_method in IDEMPOTENT_RESTLI_METHODS)
+        )
+
+    def get_backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """
+        Returns the number of seconds to wait before retrying.
+
+        Args:
+            attempt (int): The zero-based number of the latest attempt
+            response (Optional[Response], optional): The response of the latest attempt, if any. Defaults to None.
+
+        Returns:
+            float: The number of seconds to wait
+        """
+        if response is not None:
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * (2**attempt))
+        )
+
+
+def get_retry_after(response: Response) -> Optional[float]:
+    """
+    Parses the Retry-After header of a response, which is either a number of seconds or an HTTP date.
+
+    Args:
+        response (Response): The response
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the header is missing or invalid
+    """
+    retry_after = response.headers.get(RETRY_AFTER_HEADER, None)
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(
+        0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    )
@@ -0,0 +1,51 @@
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+import threading
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key, so that only the first caller (the leader) runs the
+    call, and every caller that arrives while it is in flight waits for and shares its result. Once the
+    call completes, the next call with the same key runs again; results are not cached.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """
+        Runs `fn`, unless a call with the same key is already in flight, in which case its result is
+        returned (or its exception raised) instead.
+
+        Args:
+            key (Hashable): The key identifying identical calls
+            fn (Callable[[], R]): The call to run
+
+        Returns:
+            R: The result of the call
+        """
+        with self._lock:
+            future = self._in_flight.get(key, None)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
@@ -7,6 +7,7 @@ VERSIONED_BASE_URL = "https://api.linkedin.com/rest"
 
 class HEADERS(Enum):
     CONTENT_TYPE = "Content-Type"
+    CONTENT_ENCODING = "Content-Encoding"
     CONNECTION = "Connection"
     RESTLI_PROTOCOL_VERSION = "X-RestLi-Protocol_Version"
     RESTLI_METHOD = "X-RestLi-Method"
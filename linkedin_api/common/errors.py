@@ -12,3 +12,12 @@ class ResponseFormattingError(Exception):
 
 class InvalidSerializedRestliError(Exception):
     """Error raised when an incorrectly serialized Rest.li string is encountered"""
+
+
+class PageFetchError(Exception):
+    """Error raised when a page of a collection is returned with an error status while paging"""
+
+    def __init__(self, message: str, page):
+        super().__init__(message)
+        self.page = page
+        """The response of the failed page"""
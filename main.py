@@ -1,16 +1,15 @@
 import asyncio
 import datetime
+import functools
 import json
 import logging
 import os
 import sys
 from typing import Dict, List
 
-from openai import OpenAI
-import requests
-from linkedin_api.clients.restli.client import RestliClient
-from newsapi.newsapi_client import NewsApiClient
-from telegram.ext import Application, MessageHandler, filters
+# The third-party clients (openai, newsapi, telegram, requests, bs4 and the
+# LinkedIn client) are imported when they are first needed, so that a scheduled
+# run reaches its first network call without paying for every import up front.
 
 # Configure logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -25,11 +24,38 @@ class Config:
     TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
     LINKEDIN_ACCESS_TOKEN = os.environ.get('LINKEDIN_ACCESS_TOKEN')
     LINKEDIN_MEMBER_ID = os.environ.get('LINKEDIN_MEMBER_ID')
-    # Initialize OpenAI client
 
 
-openai_client = OpenAI(api_key=Config.OPENAI_API_KEY)
-newsapi = NewsApiClient(api_key=Config.NEWS_API_KEY)
+@functools.lru_cache(maxsize=None)
+def get_openai_client():
+    """Create the OpenAI client on first use"""
+    from openai import OpenAI
+    return OpenAI(api_key=Config.OPENAI_API_KEY)
+
+
+@functools.lru_cache(maxsize=None)
+def get_newsapi_client():
+    """Create the NewsAPI client on first use"""
+    from newsapi.newsapi_client import NewsApiClient
+    return NewsApiClient(api_key=Config.NEWS_API_KEY)
+
+
+@functools.lru_cache(maxsize=None)
+def get_application():
+    """Create the Telegram bot application on first use, once the posts are ready"""
+    from telegram.ext import Application, MessageHandler, filters
+    application = Application.builder().token(
+        Config.TELEGRAM_BOT_TOKEN).build()
+    application.add_handler(
+        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_selection))
+    return application
+
+
+@functools.lru_cache(maxsize=None)
+def get_post_database():
+    """Import the post database once, on first use"""
+    from db_manager import PostDatabase
+    return PostDatabase
 
 
 def check_environment():
@@ -66,6 +92,7 @@ class NewsCollector:
         priority_3_query = '"Künstliche Intelligenz" OR "KI" OR "ChatGPT" OR "Perplexity.io" OR "Anthropic" OR "Grok"' + exclusions
 
         articles = []
+        newsapi = get_newsapi_client()
 
         # Try Priority 1
         print("Fetching Priority 1 articles (KI-Agenten)...")
@@ -146,13 +173,7 @@ class ContentGenerator:
     @staticmethod
     def _generate_post_content(content: str) -> str:
         """Generate LinkedIn post content"""
-        from db_manager import PostDatabase
-        stored_posts = PostDatabase.get_all_posts()
-        stored_posts_text = "\n\n".join([
-            post.get('content', '') for post in stored_posts[-30:]
-        ])  # Last 30 posts
-
-        response = openai_client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="o3-mini-2025-01-31",
             messages=[{
                 "role":
@@ -205,6 +226,7 @@ class SocialMedia:
         SocialMedia.stored_posts = posts
         try:
             print("Starting Telegram bot...")
+            from telegram.ext import Application
             bot = Application.builder().token(
                 Config.TELEGRAM_BOT_TOKEN).connection_pool_size(
                     8).pool_timeout(30.0).connect_timeout(30.0).read_timeout(
@@ -214,10 +236,10 @@ class SocialMedia:
             await bot.initialize()
             Storage.store_posts(posts)
 
-            from db_manager import PostDatabase
+            post_database = get_post_database()
             unique_posts = [
                 post for post in posts['posts']
-                if not PostDatabase.is_duplicate_article(post['sourceUrl'])
+                if not post_database.is_duplicate_article(post['sourceUrl'])
             ]
             print(f"Sending {len(unique_posts)} unique posts to Telegram...")
 
@@ -278,8 +300,9 @@ class SocialMedia:
         # Get meta tags from source URL
         thumbnail_url = None
         try:
-            response = requests.get(source_url)
+            import requests
             from bs4 import BeautifulSoup
+            response = requests.get(source_url)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # Try to get OpenGraph image first, then Twitter image, then any other image meta tag
@@ -292,12 +315,6 @@ class SocialMedia:
             print(f"Error fetching meta tags: {str(e)}")
 
         try:
-            headers = {
-                "Authorization": f"Bearer {Config.LINKEDIN_ACCESS_TOKEN}",
-                "Content-Type": "application/json",
-                "X-Restli-Protocol-Version": "2.0.0"
-            }
-
             payload = {
                 "author": f"urn:li:person:{Config.LINKEDIN_MEMBER_ID}",
                 "lifecycleState": "PUBLISHED",
@@ -330,11 +347,12 @@ class SocialMedia:
                 }
             }
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: requests.post("https://api.linkedin.com/v2/ugcPosts",
-                                      headers=headers,
-                                      json=payload))
+            from linkedin_api.clients.restli.async_client import AsyncRestliClient
+            async with AsyncRestliClient() as restli_client:
+                response = await restli_client.create(
+                    resource_path="/ugcPosts",
+                    entity=payload,
+                    access_token=Config.LINKEDIN_ACCESS_TOKEN)
 
             if response.status_code == 201:
                 print("Successfully posted to LinkedIn!")
@@ -344,13 +362,13 @@ class SocialMedia:
                 print(
                     f"Failed to post to LinkedIn. Status Code: {response.status_code}"
                 )
-                print(f"Response: {response.text}")
+                print(f"Response: {response.response.text}")
                 return error_msg
             else:
                 print(
                     f"Failed to post to LinkedIn. Status Code: {response.status_code}"
                 )
-                print(f"Response: {response.text}")
+                print(f"Response: {response.response.text}")
                 return f"LinkedIn API error (Status {response.status_code}). Check logs for details."
 
         except Exception as e:
@@ -409,8 +427,7 @@ async def handle_selection(update, context):
             result = await SocialMedia.post_to_linkedin(
                 post_content, selected_post['sourceUrl'], title)
             if result == True:
-                from db_manager import PostDatabase
-                PostDatabase.store_post({
+                get_post_database().store_post({
                     "content": post_content,
                     "url": selected_post['sourceUrl'],
                     "title": title,
@@ -427,6 +444,7 @@ async def handle_selection(update, context):
             await context.bot.send_message(chat_id=Config.TELEGRAM_CHAT_ID,
                                            text=status_message)
             print("Shutting down...")
+            application = get_application()
             await application.stop()
             await application.shutdown()
             sys.exit(0)
@@ -456,9 +474,11 @@ async def main():
 
 async def start_bot():
     """Start the bot and keep it running"""
+    application = None
     try:
         await main()
         print("Bot is running and waiting for your selection...")
+        application = get_application()
         await application.initialize()
         await application.start()
         # Set polling timeout to 12 hours (43200 seconds)
@@ -470,6 +490,8 @@ async def start_bot():
             await asyncio.sleep(1)
     except Exception as e:
         print(f"Error in start_bot: {str(e)}")
+        if application is None:
+            return
         if application.updater and application.updater.running:
             await application.updater.stop()
         await application.stop()
@@ -477,10 +499,6 @@ async def start_bot():
 
 if __name__ == '__main__':
     check_environment()
-    application = Application.builder().token(
-        Config.TELEGRAM_BOT_TOKEN).build()
-    application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_selection))
     try:
         print("Starting bot...")
         asyncio.run(start_bot())
@@ -0,0 +1,155 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.utils.batching import GetBatcher
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import BaseAdapter
+from urllib.parse import unquote
+import json
+import requests
+
+# Ids long enough that only a few fit in the query string of a single chunk
+IDS = [f"{'x' * 1000}{index}" for index in range(9)]
+FAILED_ID = IDS[4]
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Answers BATCH_GET requests with a result for every requested id, or with a 500 error for the
+    requests that include FAILED_ID.
+    """
+
+    def __init__(self, failed_id=FAILED_ID):
+        super().__init__()
+        self.failed_id = failed_id
+        self.requested_urls = []
+
+    def send(self, request, **kwargs):
+        self.requested_urls.append(request.url)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        if self.failed_id in unquote(request.url):
+            response.status_code = 500
+            body = {"status": 500, "message": "Internal Server Error"}
+        else:
+            ids = [id for id in IDS if id in unquote(request.url)]
+            response.status_code = 200
+            body = {
+                "results": {id: {"id": id} for id in ids},
+                "statuses": {id: 200 for id in ids},
+                "errors": {},
+            }
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def create_client(adapter, **kwargs):
+    client = RestliClient(**kwargs)
+    client.session.mount("https://", adapter)
+    return client
+
+
+def batch_get(client):
+    return client.batch_get(
+        resource_path="/testResource",
+        ids=IDS,
+        access_token="ACCESS_TOKEN",
+        chunked=True,
+    )
+
+
+def test_chunked_batch_get_merges_results():
+    adapter = FakeAdapter(failed_id="not an id")
+    response = batch_get(create_client(adapter))
+
+    assert len(adapter.requested_urls) > 1
+    assert response.status_code == 200
+    assert response.error is None
+    assert sorted(response.results) == sorted(IDS)
+    assert response.errors == {}
+
+
+def test_chunked_batch_get_reports_failed_chunk():
+    adapter = FakeAdapter()
+    response = batch_get(create_client(adapter))
+
+    (failed_url,) = [
+        unquote(url) for url in adapter.requested_urls if FAILED_ID in unquote(url)
+    ]
+    failed_chunk = [id for id in IDS if id in failed_url]
+    assert FAILED_ID in failed_chunk
+    assert 1 < len(failed_chunk) < len(IDS)
+
+    assert response.status_code == 500
+    assert response.error == {"status": 500, "message": "Internal Server Error"}
+    for id in IDS:
+        if id in failed_chunk:
+            assert id not in response.results
+            assert response.statuses[id] == 500
+            assert response.errors[id]["status"] == 500
+        else:
+            assert response.results[id] == {"id": id}
+            assert id not in response.errors
+
+
+def batched_get(client, ids):
+    with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+        return dict(
+            zip(
+                ids,
+                executor.map(
+                    lambda id: client.get(
+                        resource_path="/testResource/{id}",
+                        path_keys={"id": id},
+                        access_token="ACCESS_TOKEN",
+                    ),
+                    ids,
+                ),
+            )
+        )
+
+
+def test_batched_get_reports_missing_id_as_not_found():
+    client = create_client(FakeAdapter(), get_batcher=GetBatcher(window=0.2))
+    responses = batched_get(client, [IDS[0], "missing"])
+
+    assert responses[IDS[0]].status_code == 200
+    assert responses[IDS[0]].entity == {"id": IDS[0]}
+    assert responses["missing"].status_code == 404
+    assert responses["missing"].entity is None
+
+
+def test_batched_get_passes_through_failed_batch():
+    client = create_client(
+        FakeAdapter(),
+        get_batcher=GetBatcher(window=0.2),
+        release_raw_responses=True,
+    )
+    responses = batched_get(client, [IDS[0], FAILED_ID])
+
+    for response in responses.values():
+        assert response.status_code == 500
+        assert response.entity == {"status": 500, "message": "Internal Server Error"}
+
+
+def test_batched_get_passes_through_failed_chunk():
+    adapter = FakeAdapter()
+    client = create_client(
+        adapter, get_batcher=GetBatcher(window=0.2), release_raw_responses=True
+    )
+    responses = batched_get(client, IDS)
+
+    assert len(adapter.requested_urls) > 1
+    (failed_url,) = [
+        unquote(url) for url in adapter.requested_urls if FAILED_ID in unquote(url)
+    ]
+    for id, response in responses.items():
+        if id in failed_url:
+            assert response.status_code == 500
+            assert response.entity["message"] == "Internal Server Error"
+        else:
+            assert response.status_code == 200
+            assert response.entity == {"id": id}
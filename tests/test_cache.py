@@ -0,0 +1,105 @@
+from linkedin_api.clients.restli.response_formatter import GetResponseFormatter
+from linkedin_api.clients.restli.utils.cache import ResponseCache
+import json
+import os
+import requests
+import time
+
+
+def create_response(entity):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://api.linkedin.com/rest/testResource"
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(entity).encode()
+    return response
+
+
+def store(cache, key):
+    response = create_response({"key": key})
+    cache.store(key, response, GetResponseFormatter.format_response(response))
+
+
+def lookup_on_disk(directory, key, **kwargs):
+    # A new cache only has the entries on disk
+    entry = ResponseCache(disk_directory=directory, **kwargs).lookup(
+        key, GetResponseFormatter
+    )
+    return entry.response.entity if entry is not None else None
+
+
+def list_files(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_disk_tier_round_trip(tmp_path):
+    store(ResponseCache(disk_directory=str(tmp_path)), "a")
+
+    assert lookup_on_disk(str(tmp_path), "a") == {"key": "a"}
+    assert lookup_on_disk(str(tmp_path), "b") is None
+
+
+def test_disk_tier_evicts_entries_over_max_entries(tmp_path):
+    cache = ResponseCache(disk_directory=str(tmp_path), disk_max_entries=3)
+    for key in ["a", "b", "c", "d", "e"]:
+        store(cache, key)
+
+    assert len(list_files(tmp_path)) == 3
+    assert [lookup_on_disk(str(tmp_path), key) for key in ["a", "b"]] == [None, None]
+    for key in ["c", "d", "e"]:
+        assert lookup_on_disk(str(tmp_path), key) == {"key": key}
+
+
+def test_disk_tier_evicts_entries_over_max_bytes(tmp_path):
+    store(ResponseCache(disk_directory=str(tmp_path)), "a")
+    file_size = os.path.getsize(tmp_path / list_files(tmp_path)[0])
+
+    cache = ResponseCache(disk_directory=str(tmp_path), disk_max_bytes=file_size * 2)
+    for key in ["b", "c"]:
+        store(cache, key)
+
+    assert len(list_files(tmp_path)) == 2
+    assert lookup_on_disk(str(tmp_path), "a") is None
+
+
+def test_disk_tier_limits_include_entries_of_previous_runs(tmp_path):
+    for key in ["a", "b", "c"]:
+        store(ResponseCache(disk_directory=str(tmp_path)), key)
+
+    store(ResponseCache(disk_directory=str(tmp_path), disk_max_entries=2), "d")
+
+    assert len(list_files(tmp_path)) == 2
+    assert lookup_on_disk(str(tmp_path), "c") == {"key": "c"}
+    assert lookup_on_disk(str(tmp_path), "d") == {"key": "d"}
+
+
+def test_disk_tier_prunes_expired_entries_on_read(tmp_path):
+    store(ResponseCache(disk_directory=str(tmp_path), ttl=0.05), "a")
+    time.sleep(0.1)
+
+    assert lookup_on_disk(str(tmp_path), "a") is None
+    assert list_files(tmp_path) == []
+
+
+def test_disk_tier_prunes_expired_entries_on_write(tmp_path):
+    store(ResponseCache(disk_directory=str(tmp_path), ttl=0.05), "a")
+    time.sleep(0.1)
+    store(ResponseCache(disk_directory=str(tmp_path)), "b")
+
+    assert len(list_files(tmp_path)) == 1
+    assert lookup_on_disk(str(tmp_path), "b") == {"key": "b"}
+
+
+def test_clear_removes_entries_and_temporary_files(tmp_path):
+    cache = ResponseCache(disk_directory=str(tmp_path))
+    store(cache, "a")
+    # Left behind by a write that was interrupted
+    (tmp_path / "interrupted.tmp").write_bytes(b"partial")
+    (tmp_path / "unrelated.txt").write_bytes(b"kept")
+
+    cache.clear()
+
+    assert list_files(tmp_path) == ["unrelated.txt"]
+    assert cache.lookup("a", GetResponseFormatter) is None
+    store(cache, "b")
+    assert lookup_on_disk(str(tmp_path), "b") == {"key": "b"}
@@ -0,0 +1,50 @@
+from linkedin_api.clients.restli.utils.encoder import encode, param_encode
+from types import MappingProxyType
+import pytest
+import sys
+
+# Deeper than the recursion limit, so that any recursive encoding fails
+DEPTH = sys.getrecursionlimit() * 2
+
+
+def nest(value, depth, container):
+    for _ in range(depth):
+        value = container(value)
+    return value
+
+
+@pytest.mark.parametrize(
+    "container",
+    [
+        lambda value: [value],
+        lambda value: (value,),
+        lambda value: {"k": value},
+        lambda value: MappingProxyType({"k": value}),
+    ],
+)
+def test_encode_deeply_nested_values(container):
+    encoded_value = encode(nest("a b", DEPTH, container))
+
+    if isinstance(container(None), (list, tuple)):
+        assert encoded_value == "List(" * DEPTH + "a%20b" + ")" * DEPTH
+    else:
+        assert encoded_value == "(k:" * DEPTH + "a%20b" + ")" * DEPTH
+
+
+def test_encode_deeply_nested_tuples_repeatedly():
+    value = nest(1, DEPTH, lambda value: (value, "x"))
+    expected = nest("1", DEPTH, lambda value: f"List({value},x)")
+
+    assert encode(value) == expected
+    assert encode(value) == expected
+
+
+def test_encode_tuples_and_mappings_like_lists_and_dicts():
+    value = {"ids": [1, True, "urn:li:person:1"], "key": {"a": None, "b": 1.5}}
+    frozen_like_value = MappingProxyType(
+        {"ids": (1, True, "urn:li:person:1"), "key": MappingProxyType(value["key"])}
+    )
+
+    assert encode(value) == encode(frozen_like_value)
+    assert encode(value) == "(ids:List(1,true,urn%3Ali%3Aperson%3A1),key:(a:,b:1.5))"
+    assert param_encode({"q": value}) == f"q={encode(value)}"
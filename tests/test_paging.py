@@ -0,0 +1,82 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.common.errors import PageFetchError
+from requests.adapters import BaseAdapter
+from urllib.parse import parse_qs, urlparse
+import json
+import pytest
+import requests
+
+TOTAL = 10
+PAGE_SIZE = 3
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Answers GET_ALL requests on a collection of TOTAL elements, or with a 429 error for the page
+    starting at `failed_start`.
+    """
+
+    def __init__(self, failed_start=None):
+        super().__init__()
+        self.failed_start = failed_start
+        self.requested_starts = []
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlparse(request.url).query)
+        start = int(query["start"][0])
+        count = int(query["count"][0])
+        self.requested_starts.append(start)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        if start == self.failed_start:
+            response.status_code = 429
+            body = {"status": 429, "message": "Too Many Requests"}
+        else:
+            response.status_code = 200
+            body = {
+                "elements": [
+                    {"id": id} for id in range(start, min(start + count, TOTAL))
+                ],
+                "paging": {"start": start, "count": count, "total": TOTAL},
+            }
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def iter_elements(adapter, prefetch):
+    client = RestliClient()
+    client.session.mount("https://", adapter)
+    return client.iter_elements(
+        resource_path="/testResource",
+        access_token="ACCESS_TOKEN",
+        page_size=PAGE_SIZE,
+        prefetch=prefetch,
+    )
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_elements_fetches_all_pages(prefetch):
+    adapter = FakeAdapter()
+    elements = list(iter_elements(adapter, prefetch))
+
+    assert [element["id"] for element in elements] == list(range(TOTAL))
+    assert adapter.requested_starts == [0, 3, 6, 9]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_elements_raises_on_failed_middle_page(prefetch):
+    adapter = FakeAdapter(failed_start=PAGE_SIZE)
+    elements = []
+    with pytest.raises(PageFetchError) as error:
+        for element in iter_elements(adapter, prefetch):
+            elements.append(element)
+
+    assert [element["id"] for element in elements] == list(range(PAGE_SIZE))
+    assert error.value.page.status_code == 429
+    assert adapter.requested_starts == [0, PAGE_SIZE]
@@ -0,0 +1,52 @@
+from linkedin_api.clients.common.codec import StdlibJsonCodec
+from linkedin_api.clients.common.response import LazyJsonBody
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import threading
+import time
+
+
+class SlowCountingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.decode_count = 0
+        self.lock = threading.Lock()
+
+    def decode(self, data):
+        with self.lock:
+            self.decode_count += 1
+        # Gives the other threads time to read the body while it is being decoded
+        time.sleep(0.05)
+        return super().decode(data)
+
+
+def create_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def test_lazy_json_body_decodes_once_across_threads():
+    codec = SlowCountingCodec()
+    body = LazyJsonBody(create_response(b'{"elements": [1, 2]}'), codec=codec)
+    thread_count = 8
+    barrier = threading.Barrier(thread_count)
+
+    def get():
+        barrier.wait()
+        return body.get()
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        values = list(executor.map(lambda _: get(), range(thread_count)))
+
+    assert codec.decode_count == 1
+    assert all(value is values[0] for value in values)
+    assert values[0] == {"elements": [1, 2]}
+    assert body.content is None
+
+
+def test_lazy_json_body_optional():
+    body = LazyJsonBody(create_response(b"<html>Bad Gateway</html>"), optional=True)
+
+    assert body.get() is None
+    assert body.decoded